@@ -61,14 +61,20 @@ setup(
     scripts=[
         'src/scs_mfr/afe_baseline.py',
         'src/scs_mfr/afe_calib.py',
+        'src/scs_mfr/afe_calib_cache.py',
         'src/scs_mfr/airnow_site_conf.py',
         'src/scs_mfr/aws_client_auth.py',
         'src/scs_mfr/aws_deployment.py',
+        'src/scs_mfr/aws_fleet_deployment.py',
         'src/scs_mfr/aws_group_cloner.py',
         'src/scs_mfr/aws_group_deployment.py',
         'src/scs_mfr/aws_group_setup.py',
+        'src/scs_mfr/aws_group_snapshot.py',
         'src/scs_mfr/aws_identity.py',
         'src/scs_mfr/aws_project.py',
+        'src/scs_mfr/baseline_history.py',
+        'src/scs_mfr/batch_query.py',
+        'src/scs_mfr/cognito_batch_registration.py',
         'src/scs_mfr/configuration.py',
         'src/scs_mfr/csv_logger_conf.py',
         'src/scs_mfr/csv_reader.py',
@@ -78,6 +84,7 @@ setup(
         'src/scs_mfr/display_conf.py',
         'src/scs_mfr/eeprom_read.py',
         'src/scs_mfr/eeprom_write.py',
+        'src/scs_mfr/fleet_index.py',
         'src/scs_mfr/fuel_gauge_calib.py',
         'src/scs_mfr/gas_baseline.py',
         'src/scs_mfr/gas_model_conf.py',
@@ -96,6 +103,7 @@ setup(
         'src/scs_mfr/opc_firmware_conf.py',
         'src/scs_mfr/opc_version.py',
         'src/scs_mfr/pmx_model_conf.py',
+        'src/scs_mfr/provision_batch_check.py',
         'src/scs_mfr/psu_conf.py',
         'src/scs_mfr/pt1000_calib.py',
         'src/scs_mfr/rtc.py',
@@ -106,7 +114,15 @@ setup(
         'src/scs_mfr/system_id.py',
         'src/scs_mfr/timezone.py'
     ],
+    entry_points={
+        'console_scripts': [
+            'scs-mfr = scs_mfr.cmd.dispatcher:main'
+        ]
+    },
     install_requires=required,
+    extras_require={
+        'fit': ['numpy']                            # afe_baseline / gas_baseline --fit
+    },
     platforms=['any'],
     python_requires=">=3.3"
 )
@@ -17,13 +17,18 @@ The --pid-test-sens flag is used to correct the sensitivity of PID sensors, base
 Prior to the bump test, sensor should have its zero offset set to the match the ambient VOC concentration.
 The afe_baseline utility should be set once more, following the sensitivity correction.
 
+Downloaded documents are held in a local cache, and recently-fetched documents are served from it directly. Otherwise,
+the document is revalidated with the server, and downloaded only if it has changed. The --reload flag always
+revalidates. If the server cannot be reached, or in --offline mode, the cached document is used. The cache may be
+filled in advance for a production batch with the afe_calib_cache utility.
+
 The afe_calib utility may also be used to set a "test" calibration sheet, for use in an R & D environment.
 
 Note that the scs_dev/gasses_sampler process must be restarted for changes to take effect.
 
 SYNOPSIS
 afe_calib.py [{ -f SERIAL_NUMBER | -a SERIAL_NUMBER | -s SERIAL_NUMBER YYYY-MM-DD | -r | -p CORRECT REPORTED |
--t  | -d }] [-i INDENT] [-v]
+-t  | -d }] [-o] [-i INDENT] [-v]
 
 EXAMPLES
 ./afe_calib.py -vi4 -s 143800348 2023-03-01
@@ -37,10 +42,12 @@ DOCUMENT EXAMPLE
 
 FILES
 ~/SCS/conf/afe_calib.json
+~/SCS/conf/calib_cache/*
 
 SEE ALSO
 scs_dev/gases_sampler
 scs_mfr/afe_baseline
+scs_mfr/afe_calib_cache
 
 RESOURCES
 https://calibration.southcoastscience.com/
@@ -63,6 +70,7 @@ from scs_core.sys.logging import Logging
 
 from scs_host.sys.host import Host
 
+from scs_mfr.calib.calib_cache import CalibCache
 from scs_mfr.cmd.cmd_afe_calib import CmdAFECalib
 
 
@@ -95,22 +103,25 @@ if __name__ == '__main__':
 
         calib = AFECalib.load(Host)
 
+        cache = CalibCache(Host, offline=cmd.offline, max_age=0 if cmd.reload else None)
+        logger.info(cache)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         if cmd.find_serial_number:
             if '-' in cmd.find_serial_number:
-                calib = AFECalib.download(cmd.find_serial_number, parse=False)
+                calib = cache.download(AFECalib, cmd.find_serial_number, parse=False)
             else:
-                calib = DSICalib.download(cmd.find_serial_number, parse=False)
+                calib = cache.download(DSICalib, cmd.find_serial_number, parse=False)
 
         if cmd.set():
             if cmd.afe_serial_number is not None:
-                calib = AFECalib.download(cmd.afe_serial_number)
+                calib = cache.download(AFECalib, cmd.afe_serial_number)
 
             else:
-                calib = DSICalib.download(cmd.sensor_serial_number)
+                calib = cache.download(DSICalib, cmd.sensor_serial_number)
 
                 if not Date.is_valid_iso_format(cmd.sensor_calibration_date_str):
                     logger.error("invalid ISO date: '%s'." % cmd.sensor_calibration_date_str)
@@ -125,11 +136,11 @@ if __name__ == '__main__':
 
             if calib.afe_type == DSICalib.TYPE:
                 calibrated_on = calib.calibrated_on
-                calib = DSICalib.download(calib.sensor_calib(0).serial_number)
+                calib = cache.download(DSICalib, calib.sensor_calib(0).serial_number)
                 calib.calibrated_on = calibrated_on
 
             else:
-                calib = AFECalib.download(calib.serial_number)
+                calib = cache.download(AFECalib, calib.serial_number)
 
         if cmd.pid_test_correct:
             index = calib.sensor_index('VOC')
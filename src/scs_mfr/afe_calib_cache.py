@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The afe_calib_cache utility is used to manage the local cache of AFE board and DSI sensor calibration documents used by
+the afe_calib, provision_new_scs and provision_service_scs utilities.
+
+In --prefetch mode, the documents for a whole production batch are fetched in parallel, so that provisioning can
+proceed without further network access. Serial numbers are given as arguments or - if there are none - read from
+stdin, one per line. Serial numbers containing a '-' are AFE boards; others are DSI sensors. Documents that were
+fetched recently are not fetched again, unless the --revalidate flag is set. A JSON report is written to stdout for
+each serial number, and the utility exits with status 1 if any document could not be fetched.
+
+If no operation is specified, the cached documents are listed.
+
+SYNOPSIS
+afe_calib_cache.py [{ -p [-r] [-c CONCURRENCY] [SERIAL_NUMBER_1 .. N] | -d }] [-v]
+
+EXAMPLES
+./afe_calib_cache.py -v -p -c 16 < batch_serials.txt
+
+DOCUMENT EXAMPLE - REPORT
+{"kind": "board", "serial": "26-000345", "status": "fetched", "hash": "3c9e...", "elapsed": 0.214}
+
+DOCUMENT EXAMPLE - LIST
+{"kind": "board", "serial": "26-000345", "hash": "3c9e...", "etag": "\"a1b2\"",
+"last-modified": "Tue, 05 Mar 2024 10:12:33 GMT", "fetched": "2026-10-19T09:01:12Z"}
+
+FILES
+~/SCS/conf/calib_cache/*
+
+SEE ALSO
+scs_mfr/afe_calib
+scs_mfr/provision_new_scs
+scs_mfr/provision_service_scs
+
+RESOURCES
+https://calibration.southcoastscience.com/
+"""
+
+import sys
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_host.sys.host import Host
+
+from scs_mfr.calib.calib_cache import CalibCache
+from scs_mfr.cmd.cmd_afe_calib_cache import CmdAFECalibCache
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    failures = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdAFECalibCache()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('afe_calib_cache', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        cache = CalibCache(Host, max_age=0 if cmd.revalidate else None)
+        logger.info(cache)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        if cmd.prefetch:
+            serial_numbers = cmd.serial_numbers if cmd.serial_numbers else \
+                [line.strip() for line in sys.stdin if line.strip()]
+
+            timer = Timer()
+
+            for report in cache.prefetch(serial_numbers, concurrency=cmd.concurrency):
+                print(JSONify.dumps(report))
+                sys.stdout.flush()
+
+                if not report.is_ok():
+                    failures += 1
+
+            logger.info("fetched: %s of %s in %s seconds" %
+                        (len(serial_numbers) - failures, len(serial_numbers), timer.total()))
+
+        elif cmd.delete:
+            cache.clear()
+
+        else:
+            for entry in cache.entries():
+                print(JSONify.dumps(entry))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # end...
+
+        if failures:
+            exit(1)
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
@@ -13,11 +13,15 @@ configuration should already be in place - see aws_identity.py and aws_group_set
 
 The greengrass service must be running for the deployment to complete.
 
+In --wait mode, the deployment status is polled with exponential backoff and jitter, starting at half a second. A
+progress report is written to stdout for each status transition. If a timeout is given, the utility gives up waiting
+after TIMEOUT seconds. The utility exits with status 1 if the deployment fails or times out.
+
 SYNOPSIS
-aws_deployment.py [-w] [-i INDENT] [-v]
+aws_deployment.py [-w [-t TIMEOUT]] [-i INDENT] [-v]
 
 EXAMPLES
-./aws_deployment.py -vw
+./aws_deployment.py -vw -t 300
 
 DOCUMENT EXAMPLE - OUTPUT
 {"ResponseMetadata": {"RequestId": "72fce673", "HTTPStatusCode": 200,
@@ -27,6 +31,13 @@ DOCUMENT EXAMPLE - OUTPUT
 "DeploymentArn": "arn:aws:greengrass:us-west-2:696437392763:/greengrass/groups//deployments/cb645f98-7737",
 "DeploymentId": "cb645f98-7737"}
 
+DOCUMENT EXAMPLE - PROGRESS
+{"group": "scs-bbe-401-group", "deployment": "cb645f98-7737", "status": "Success", "was": "InProgress",
+"elapsed": 14.2, "interval": 9.8, "polls": 6}
+
+FILES
+~/SCS/aws/device_session.json
+
 SEE ALSO
 scs_mfr/aws_group_setup.py
 scs_mfr/aws_identity.py
@@ -35,15 +46,10 @@ scs_mfr/aws_identity.py
 import sys
 import time
 
-from botocore.exceptions import ClientError, NoCredentialsError
-
-from scs_core.aws.client.client import Client
 from scs_core.aws.config.aws import AWS
 from scs_core.aws.greengrass.v1.aws_deployer import AWSGroupDeployer
 
-from scs_core.aws.security.access_key_manager import AccessKeyManager
 from scs_core.aws.security.cognito_device import CognitoDeviceCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.data.json import JSONify
 
@@ -52,6 +58,9 @@ from scs_core.sys.logging import Logging
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_aws_deployment import CmdAWSDeployment
+from scs_mfr.greengrass.deployment_tracker import DeploymentTracker
+from scs_mfr.security.device_session import DeviceSession, DeviceSessionException
+from scs_mfr.sys.backoff import Backoff
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -73,6 +82,10 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    from botocore.exceptions import ClientError, NoCredentialsError                     # late import
+
+    from scs_core.aws.client.client import Client
+
 
     # ------------------------------------------------------------------------------------------------------------
     # authentication...
@@ -81,15 +94,13 @@ if __name__ == '__main__':
     credentials = CognitoDeviceCredentials.load_credentials_for_device(Host)
 
     # AccessKey...
-    gatekeeper = CognitoLoginManager()
-    auth = gatekeeper.device_login(credentials)
-
-    if not auth.is_ok():
-        logger.error(auth.authentication_status.description)
+    try:
+        session = DeviceSession.authenticate(Host, credentials)
+    except DeviceSessionException as ex:
+        logger.error(ex)
         exit(1)
 
-    manager = AccessKeyManager()
-    key = manager.get(auth.id_token)
+    key = session.access_key(Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -114,21 +125,39 @@ if __name__ == '__main__':
             exit(1)
 
         print(JSONify.dumps(response, indent=cmd.indent))
+        sys.stdout.flush()
+
+        group_id, _ = deployer.retrieve_deployment_info(client)
+
+        tracker = DeploymentTracker(AWS.group_name(), group_id, response.get("DeploymentId"))
+        backoff = Backoff()
+
+        deadline = None if cmd.timeout is None else time.monotonic() + cmd.timeout
 
         # wait...
         while True:
-            status = deployer.status(response)
+            progress = tracker.poll(client)
+
+            if progress is not None:
+                logger.info(tracker.status)
 
-            if status == AWSGroupDeployer.FAILURE:
+                if cmd.wait:
+                    print(JSONify.dumps(progress))
+                    sys.stdout.flush()
+
+            if tracker.status == AWSGroupDeployer.FAILURE:
                 logger.error("deployment failed.")
                 exit(1)
 
-            logger.info(status)
-
-            if not cmd.wait or status == AWSGroupDeployer.SUCCESS:
+            if not cmd.wait or tracker.status == AWSGroupDeployer.SUCCESS:
                 break
 
-            time.sleep(5.0)
+            if deadline is not None and time.monotonic() >= deadline:
+                print(JSONify.dumps(tracker.timeout()))
+                logger.error("deployment timed out after %s seconds." % cmd.timeout)
+                exit(1)
+
+            backoff.sleep(deadline=deadline)
 
     except KeyboardInterrupt:
         print(file=sys.stderr)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_mfr
+
+DESCRIPTION
+The aws_fleet_deployment utility is used to invoke deployments of many Greengrass groups, for example after an
+estate-wide change of model or lambda. It is intended to be run from a management host, rather than a device. The
+configuration of each group should already be in place - see aws_group_setup.py.
+
+Group names are given as arguments, or - if there are none - read from stdin, one per line. Deployment requests are
+made concurrently, subject to a limit on the number in flight, and a limit on the rate of AWS API calls, so that
+Greengrass API throttling is respected. Throttled calls are retried with exponential backoff. All in-flight
+deployments are tracked by a single polling loop.
+
+A JSON result is written to stdout for each group as its deployment completes, fails, is rejected, or times out. The
+utility exits with status 1 if any deployment is not successful.
+
+AWS credentials are found by the standard boto3 search - for example, environment variables or ~/.aws/credentials.
+In --stub mode, a local stand-in for the Greengrass service is used, and no credentials are required.
+
+SYNOPSIS
+aws_fleet_deployment.py [-r RATE] [-c CONCURRENCY] [-t TIMEOUT] [-s [-d DURATION] [-f FAILURE]] [-v]
+[GROUP_NAME_1 .. N]
+
+EXAMPLES
+./aws_fleet_deployment.py -v -r 4 -t 600 < groups.txt
+
+./aws_fleet_deployment.py -v -s -d 3 -f scs-bbe-402-group scs-bbe-401-group scs-bbe-402-group
+
+DOCUMENT EXAMPLE - OUTPUT
+{"group": "scs-bbe-401-group", "deployment": "cb645f98-7737", "status": "Success", "submitted": 0.4,
+"elapsed": 14.2, "polls": 6}
+
+SEE ALSO
+scs_mfr/aws_deployment
+scs_mfr/aws_group_setup
+"""
+
+import sys
+
+from scs_core.aws.client.access_key import AccessKey
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_mfr.cmd.cmd_aws_fleet_deployment import CmdAWSFleetDeployment
+from scs_mfr.greengrass.fleet_deployer import FleetDeployer
+from scs_mfr.greengrass.greengrass_stub import GreengrassStub
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    results = []
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdAWSFleetDeployment()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('aws_fleet_deployment', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError      # late import
+
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        group_names = cmd.group_names if cmd.group_names else [line.strip() for line in sys.stdin if line.strip()]
+
+        if not group_names:
+            logger.error("no group names were given.")
+            exit(2)
+
+        if cmd.stub:
+            client = GreengrassStub(group_names, duration=cmd.stub_duration, failures=cmd.stub_failures)
+
+        else:
+            from scs_core.aws.client.client import Client                               # late import
+
+            key = AccessKey.from_environment()
+            client = Client.construct('greengrass', AccessKey(None, None) if key is None else key)
+
+        deployer = FleetDeployer(client, rate=cmd.rate, concurrency=cmd.concurrency, timeout=cmd.timeout)
+        logger.info(deployer)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        timer = Timer()
+
+        for result in deployer.deploy(group_names):
+            print(JSONify.dumps(result))
+            sys.stdout.flush()
+
+            results.append(result)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # end...
+
+        successes = len([result for result in results if result.is_successful()])
+
+        logger.info("deployed: %s of %s in %s seconds" % (successes, len(results), timer.total()))
+
+        if successes < len(results):
+            exit(1)
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    except ClientError as ex:
+        logger.error(repr(ex))
+        exit(1)
+
+    except NoCredentialsError:
+        logger.error("credentials error.")
+        exit(1)
+
+    except BotoCoreError as ex:
+        logger.error(repr(ex))
+        exit(1)
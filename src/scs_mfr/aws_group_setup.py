@@ -14,7 +14,8 @@ Coast Science's configurations.
 Note that the template name for the AWS group is specified by the group name as set by the gas_model_conf utility.
 
 When setting the group, the group must already exist and the ML lambdas must be associated with the greengrass
-account for which the IAM auth keys are given.
+account for which the IAM auth keys are given. The resource, function and subscription definitions are created
+concurrently - in --verbose mode, the time taken by each step is reported.
 
 If neither --retrieve or --set flags are used, the aws_group_setup utility reports the group summary as stored on
 the device, if it exists.
@@ -30,6 +31,7 @@ EXAMPLE DOCUMENT - SHORTFORM (LOCAL)
 
 FILES
 ~/SCS/aws/aws_group_config.json
+~/SCS/aws/device_session.json
 
 SEE ALSO
 scs_mfr/aws_deployment
@@ -44,17 +46,12 @@ https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/green
 import os
 import sys
 
-from botocore.exceptions import ClientError, EndpointConnectionError, NoCredentialsError
-
-from scs_core.aws.client.client import Client
 from scs_core.aws.config.aws import AWS
 from scs_core.aws.greengrass.v1.aws_group import AWSGroup
 from scs_core.aws.greengrass.v1.aws_group_configuration import AWSGroupConfiguration
 from scs_core.aws.greengrass.v1.gg_errors import ProjectMissingError
 
-from scs_core.aws.security.access_key_manager import AccessKeyManager
 from scs_core.aws.security.cognito_device import CognitoDeviceCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
@@ -68,6 +65,8 @@ from scs_core.sys.logging import Logging
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_aws_group_setup import CmdAWSGroupSetup
+from scs_mfr.greengrass.concurrent_configurator import ConcurrentConfigurator
+from scs_mfr.security.device_session import DeviceSession, DeviceSessionException
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -92,6 +91,8 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    from botocore.exceptions import ClientError, EndpointConnectionError, NoCredentialsError        # late import
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # validation...
@@ -113,17 +114,17 @@ if __name__ == '__main__':
         credentials = CognitoDeviceCredentials.load_credentials_for_device(Host)
 
         # AccessKey...
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.device_login(credentials)
-
-        if not auth.is_ok():
-            logger.error(auth.authentication_status.description)
+        try:
+            session = DeviceSession.authenticate(Host, credentials)
+        except DeviceSessionException as ex:
+            logger.error(ex)
             exit(1)
 
-        manager = AccessKeyManager()
-        key = manager.get(auth.id_token)
+        key = session.access_key(Host)
 
         # client...
+        from scs_core.aws.client.client import Client                                   # late import
+
         client = Client.construct('greengrass', key)
 
 
@@ -161,14 +162,8 @@ if __name__ == '__main__':
             try:
                 now = LocalizedDatetime.now()
                 conf = AWSGroupConfiguration(AWS.group_name(), now, ml=gg_ml_template)
-                configurator = conf.configurator(client)
-
-                configurator.collect_information(Host)
-                configurator.define_aws_group_resources(Host)
-                configurator.define_aws_group_functions()
-                configurator.define_aws_group_subscriptions()
-                # configurator.define_aws_logger()
-                configurator.create_aws_group_definition()
+                configurator = ConcurrentConfigurator(conf.configurator(client), Host)
+                configurator.run()
 
                 conf.save(Host)
 
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_mfr
+
+DESCRIPTION
+The aws_group_snapshot utility is used to audit drift in Greengrass group versions, without comparing whole group
+documents. A snapshot is a compact summary of a group version, in which each function, resource, subscription, logger
+and core definition is represented by a hash. Identifiers that change with every version - ARNs, version IDs and
+timestamps - are not hashed, so groups with the same definitions have the same snapshot hash.
+
+If no mode is specified, the deployed group version and the group configuration of this device are snapshotted. This
+requires read access to the Greengrass deployment directory.
+
+In --fleet mode, the latest version of each named group is snapshotted from the Greengrass API. Group names are given
+as arguments or - if there are none - read from stdin, one per line. Groups are retrieved concurrently, subject to a
+limit on the number in flight, and a limit on the rate of AWS API calls. AWS credentials are found by the standard
+boto3 search - for example, environment variables or ~/.aws/credentials.
+
+In --diff mode, two files of snapshots are compared, group by group. A report is written for each group whose
+components or items have been added, removed or changed. Where either snapshot failed, the report gives the error,
+rather than a comparison.
+
+Snapshots from the device and from the Greengrass API are not comparable with each other.
+
+SYNOPSIS
+aws_group_snapshot.py [{ -f [-r RATE] [-c CONCURRENCY] [GROUP_NAME_1 .. N] | -d BEFORE_FILE AFTER_FILE }] [-v]
+
+EXAMPLES
+./aws_group_snapshot.py -v -f < groups.txt > snapshots_2026_10_19.jsonl
+
+./aws_group_snapshot.py -d snapshots_2026_09_01.jsonl snapshots_2026_10_19.jsonl
+
+DOCUMENT EXAMPLE - SNAPSHOT
+{"group": "scs-bbe-401-group", "version": "4c8ba1d3-1b2e-4b3f-9d0e-9e3f1b0a7c2d", "hash": "9f2c61d0a4b7e815",
+"components": {"functions": {"hash": "0be4f5d7a3c29e61", "items": {"gas-inference": "77a1d6e0c4b3f2a9"}}}}
+
+DOCUMENT EXAMPLE - DIFF
+{"group": "scs-bbe-401-group", "before": "0d6e...", "after": "4c8b...", "added": [], "removed": [],
+"changed": ["functions/gas-inference"]}
+
+FILES
+/greengrass/ggc/deployment/group/group.json
+~/SCS/aws/aws_group_config.json
+
+SEE ALSO
+scs_mfr/aws_fleet_deployment
+scs_mfr/aws_group_setup
+"""
+
+import json
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.sys.logging import Logging
+
+from scs_host.sys.host import Host
+
+from scs_mfr.cmd.cmd_aws_group_snapshot import CmdAWSGroupSnapshot
+from scs_mfr.greengrass.group_snapshot import GroupSnapshot, GroupSnapshotDiff
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def load_snapshots(filename):
+    snapshots = OrderedDict()
+
+    with open(filename) as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            jdict = json.loads(line)
+
+            try:
+                snapshot = GroupSnapshot.construct_from_jdict(jdict) if isinstance(jdict, dict) else None
+            except (AttributeError, TypeError):
+                snapshot = None
+
+            if snapshot is None or snapshot.group_name is None:
+                raise ValueError("%s line %s: not a group snapshot" % (filename, number))
+
+            snapshots[snapshot.group_name] = snapshot
+
+    return snapshots
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdAWSGroupSnapshot()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('aws_group_snapshot', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        if cmd.diff:
+            try:
+                before = load_snapshots(cmd.before_filename)
+                after = load_snapshots(cmd.after_filename)
+
+            except (OSError, ValueError) as ex:
+                logger.error("the snapshots could not be read: %s" % repr(ex))
+                exit(1)
+
+            changes = 0
+
+            for group_name in list(before) + [group_name for group_name in after if group_name not in before]:
+                diff = GroupSnapshotDiff.construct(before.get(group_name), after.get(group_name))
+
+                if diff.has_changes() or diff.error is not None:
+                    print(JSONify.dumps(diff))
+                    changes += 1
+
+            logger.info("changed: %s of %s" % (changes, len(set(before) | set(after))))
+
+        elif cmd.fleet:
+            from botocore.exceptions import ClientError, NoCredentialsError
+
+            from scs_core.aws.client.access_key import AccessKey
+            from scs_core.aws.client.client import Client
+
+            from scs_mfr.greengrass.group_snapshotter import GroupSnapshotter
+
+            group_names = cmd.group_names if cmd.group_names else [line.strip() for line in sys.stdin if line.strip()]
+
+            if not group_names:
+                logger.error("no group names were given.")
+                exit(2)
+
+            try:
+                key = AccessKey.from_environment()
+                client = Client.construct('greengrass', AccessKey(None, None) if key is None else key)
+
+                snapshotter = GroupSnapshotter(client, rate=cmd.rate, concurrency=cmd.concurrency)
+                logger.info(snapshotter)
+
+                for snapshot in snapshotter.retrieve(group_names):
+                    print(JSONify.dumps(snapshot))
+                    sys.stdout.flush()
+
+            except ClientError as ex:
+                logger.error(repr(ex))
+                exit(1)
+
+            except NoCredentialsError:
+                logger.error("credentials error.")
+                exit(1)
+
+        else:
+            from scs_core.aws.greengrass.v1.aws_group_configuration import AWSGroupConfiguration
+            from scs_core.aws.greengrass.v1.aws_group_version import AWSGroupVersion
+
+            try:
+                group_version = AWSGroupVersion.load(Host)
+
+            except PermissionError:
+                logger.error("you must have root privileges to read the group version.")
+                exit(1)
+
+            if group_version is None:
+                logger.error("no group version has been deployed.")
+                exit(1)
+
+            snapshot = GroupSnapshot.construct_from_device(group_version, AWSGroupConfiguration.load(Host))
+            print(JSONify.dumps(snapshot))
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
@@ -27,6 +27,9 @@ EXAMPLES
 DOCUMENT EXAMPLE
 {"core-name": "scs-cube-001-core", "group-name": "scs-cube-001-group"}
 
+FILES
+~/SCS/aws/device_session.json
+
 SEE ALSO
 scs_mfr/aws_deployment
 scs_mfr/aws_group_setup
@@ -46,15 +49,10 @@ https://docs.aws.amazon.com/iot/latest/developerguide/server-authentication.html
 import os
 import sys
 
-from botocore.exceptions import NoCredentialsError, ClientError
-
-from scs_core.aws.client.client import Client
 from scs_core.aws.config.aws import AWS
 from scs_core.aws.greengrass.v1.aws_identity import AWSIdentity
 
-from scs_core.aws.security.access_key_manager import AccessKeyManager
 from scs_core.aws.security.cognito_device import CognitoDeviceCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.data.json import JSONify
 
@@ -63,6 +61,7 @@ from scs_core.sys.logging import Logging
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_aws_identity import CmdAWSIdentity
+from scs_mfr.security.device_session import DeviceSession, DeviceSessionException
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -86,6 +85,8 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    from botocore.exceptions import NoCredentialsError, ClientError                     # late import
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # validation...
@@ -103,15 +104,13 @@ if __name__ == '__main__':
         credentials = CognitoDeviceCredentials.load_credentials_for_device(Host)
 
         # AccessKey...
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.device_login(credentials)
-
-        if not auth.is_ok():
-            logger.error(auth.authentication_status.description)
+        try:
+            session = DeviceSession.authenticate(Host, credentials)
+        except DeviceSessionException as ex:
+            logger.error(ex)
             exit(1)
 
-        manager = AccessKeyManager()
-        key = manager.get(auth.id_token)
+        key = session.access_key(Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -119,6 +118,8 @@ if __name__ == '__main__':
 
     try:
         if cmd.setup:
+            from scs_core.aws.client.client import Client                               # late import
+
             iot_client = Client.construct('iot', key)
             gg_client = Client.construct('greengrass', key)
 
@@ -19,6 +19,9 @@ EXAMPLES
 DOCUMENT EXAMPLE
 {"core-name": "scs-cube-001-core", "group-name": "scs-cube-001-group"}
 
+FILES
+~/SCS/aws/device_session.json
+
 SEE ALSO
 scs_mfr/aws_deployment
 scs_mfr/aws_group_setup
@@ -33,21 +36,17 @@ https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/green
 import os
 import sys
 
-from botocore.exceptions import NoCredentialsError, ClientError
-
-from scs_core.aws.client.client import Client
 from scs_core.aws.greengrass.v1.aws_group_version import AWSGroupVersion
 from scs_core.aws.greengrass.v1.aws_identity_update import AWSIdentityUpdate
 
-from scs_core.aws.security.access_key_manager import AccessKeyManager
 from scs_core.aws.security.cognito_device import CognitoDeviceCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.sys.logging import Logging
 
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_aws_identity_update import CmdAWSIdentityUpdate
+from scs_mfr.security.device_session import DeviceSession, DeviceSessionException
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -69,6 +68,10 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    from botocore.exceptions import NoCredentialsError, ClientError                     # late import
+
+    from scs_core.aws.client.client import Client
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # validation...
@@ -85,15 +88,13 @@ if __name__ == '__main__':
     credentials = CognitoDeviceCredentials.load_credentials_for_device(Host)
 
     # AccessKey...
-    gatekeeper = CognitoLoginManager()
-    auth = gatekeeper.device_login(credentials)
-
-    if not auth.is_ok():
-        logger.error(auth.authentication_status.description)
+    try:
+        session = DeviceSession.authenticate(Host, credentials)
+    except DeviceSessionException as ex:
+        logger.error(ex)
         exit(1)
 
-    manager = AccessKeyManager()
-    key = manager.get(auth.id_token)
+    key = session.access_key(Host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,240 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A batch of baseline corrections, each derived from the difference between a correct and a reported value, together
+with the before / after report for the batch. Where the corrections were fitted from co-located reference data, the
+report also includes the fit statistics.
+
+example JSON (correction):
+{"gas": "NO2", "correct": 10, "reported": 23, "sample": {"rec": "2022-03-16T07:45:00Z", "hmd": 51.6, "tmp": 21.8}}
+
+example JSON (report):
+{"baseline": {"NO2": {"calibrated-on": "2022-03-21T11:46:43Z", "offset": -13,
+"env": {"rec": "2022-03-16T07:45:00Z", "hmd": 51.6, "tmp": 21.8}}},
+"summary": {"NO2": {"was": 0, "now": -13}}}
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_core.gas.sensor_baseline import SensorBaseline, SensorBaselineSample
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineCorrection(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_lines(cls, lines):
+        corrections = []
+
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                jdict = json.loads(line)
+            except ValueError as ex:
+                raise ValueError("line %s: %s" % (number, ex))
+
+            if not isinstance(jdict, dict):
+                raise ValueError("line %s: not a JSON object" % number)
+
+            try:
+                correction = cls.construct_from_jdict(jdict)
+            except (AttributeError, TypeError, ValueError) as ex:          # eg. a sample that is not an object
+                raise ValueError("line %s: %s" % (number, ex))
+
+            if correction is None:
+                raise ValueError("line %s: incomplete correction" % number)
+
+            corrections.append(correction)
+
+        return corrections
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        gas = jdict.get('gas')
+        correct = jdict.get('correct')
+        reported = jdict.get('reported')
+
+        if gas is None or correct is None or reported is None:
+            return None
+
+        sample = SensorBaselineSample.construct_from_jdict(jdict.get('sample'))
+
+        return cls(gas, correct, reported, sample=sample)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, gas, correct, reported, sample=None):
+        """
+        Constructor
+        """
+        self.__gas = gas                                    # string
+        self.__correct = float(correct)                     # float
+        self.__reported = float(reported)                   # float
+        self.__sample = sample                              # SensorBaselineSample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def delta(self):
+        return int(round(self.correct - self.reported))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['gas'] = self.gas
+        jdict['correct'] = self.correct
+        jdict['reported'] = self.reported
+
+        if self.sample is not None:
+            jdict['sample'] = self.sample
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def correct(self):
+        return self.__correct
+
+
+    @property
+    def reported(self):
+        return self.__reported
+
+
+    @property
+    def sample(self):
+        return self.__sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineCorrection:{gas:%s, correct:%s, reported:%s, sample:%s}" % \
+               (self.gas, self.correct, self.reported, self.sample)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineCorrectionReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def apply(cls, baseline, changes, history, manager, rec):
+        report = cls()
+        sensor_baselines = []
+
+        for key, gas, delta, sample, fit in changes:        # key is an AFEBaseline index or a Baseline gas
+            old_sensor_baseline = baseline.sensor_baseline(key)
+
+            old_offset = 0 if old_sensor_baseline is None else old_sensor_baseline.offset
+            new_offset = old_offset + delta
+
+            sensor_baseline = SensorBaseline(rec, new_offset, sample=sample)
+            baseline.set_sensor_baseline(key, sensor_baseline)
+
+            report.record(gas, old_offset, new_offset, fit=fit)
+            sensor_baselines.append((gas, old_offset, sensor_baseline))
+
+        baseline.save(manager)                              # one save for the batch
+
+        for gas, old_offset, sensor_baseline in sensor_baselines:
+            history.append(gas, old_offset, sensor_baseline)
+
+        report.baseline = baseline
+
+        return report
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, baseline=None):
+        """
+        Constructor
+        """
+        self.__baseline = baseline                          # Baseline or AFEBaseline
+        self.__summary = OrderedDict()                      # dict of gas: [was, now]
+        self.__fits = OrderedDict()                         # dict of gas: BaselineFit
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record(self, gas, old_offset, new_offset, fit=None):
+        if fit is not None:
+            self.__fits[gas] = fit
+
+        if gas in self.__summary:
+            self.__summary[gas][1] = new_offset             # "was" is the offset before the batch
+        else:
+            self.__summary[gas] = [old_offset, new_offset]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['baseline'] = self.baseline
+        jdict['summary'] = OrderedDict((gas, OrderedDict((('was', was), ('now', now))))
+                                       for gas, (was, now) in self.__summary.items())
+
+        if self.__fits:
+            jdict['fits'] = self.__fits
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def baseline(self):
+        return self.__baseline
+
+
+    @baseline.setter
+    def baseline(self, baseline):
+        self.__baseline = baseline
+
+
+    @property
+    def gases(self):
+        return list(self.__summary.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineCorrectionReport:{baseline:%s, summary:%s, fits:%s}" % \
+               (self.baseline, self.__summary, len(self.__fits))
@@ -0,0 +1,482 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Estimation of baseline offsets from co-located device and reference-analyser data.
+
+Both data sets may be CSV or JSON lines. Rows are aligned on rec, by truncation to the alignment interval - where
+several rows fall into the same interval, their mean is used. The offset for each gas is the median of the differences
+(reference - device). If temperature and / or humidity bin widths are given, the median is found for each bin, and
+the offset is the median of the bin medians, so that over-represented conditions do not dominate the fit.
+
+Device values are found at val.GAS.cnc, with environment at val.sht.tmp and val.sht.hmd. Reference values are found
+at GAS.
+
+This module requires NumPy, which is an optional dependency of scs_mfr (the fit extra) - it should be imported late.
+
+example JSON:
+{"gas": "NO2", "points": 2871, "delta": -13, "median": -13.2, "mean": -12.7, "std": 4.1, "mad": 2.6,
+"p25": -15.8, "p75": -10.4, "r": 0.93, "start": "2022-03-01T00:00:00Z", "end": "2022-03-14T23:59:00Z",
+"bins": null}
+"""
+
+import json
+
+from collections import OrderedDict
+from itertools import chain
+
+import numpy as np
+
+from scs_core.csv.csv_reader import CSVReader
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+from scs_core.data.path_dict import PathDict
+
+from scs_core.gas.sensor_baseline import SensorBaselineSample
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineFitter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_ALIGNMENT = 60                      # seconds
+
+    MIN_BIN_POINTS = 10
+
+    __TEMP_PATH = 'val.sht.tmp'
+    __HUMID_PATH = 'val.sht.hmd'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def device_path(gas):
+        return '.'.join(('val', gas, 'cnc'))
+
+
+    @staticmethod
+    def reference_path(gas):
+        return gas
+
+
+    @staticmethod
+    def jstrs(lines):
+        lines = iter(lines)
+
+        for first in lines:
+            if not first.strip():
+                continue
+
+            if first.lstrip().startswith('{'):                  # JSON lines
+                yield first
+
+                for line in lines:
+                    if line.strip():
+                        yield line
+
+            else:                                               # CSV, with header
+                reader = CSVReader(chain([first], lines))
+
+                for jstr in reader.rows():
+                    yield jstr
+
+            return
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, gases, alignment=None, temp_bin=None, humid_bin=None):
+        """
+        Constructor
+        """
+        self.__gases = gases                                                    # list of string
+        self.__alignment = self.DEFAULT_ALIGNMENT if alignment is None else int(alignment)     # int seconds
+        self.__temp_bin = temp_bin                                              # float or None
+        self.__humid_bin = humid_bin                                            # float or None
+
+        self.__device = {}                      # dict of interval: dict of path: [sum, count]
+        self.__reference = {}                   # dict of interval: dict of path: [sum, count]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def load_device(self, lines):
+        paths = [self.device_path(gas) for gas in self.gases] + [self.__TEMP_PATH, self.__HUMID_PATH]
+
+        return self.__load(self.__device, lines, paths)
+
+
+    def load_reference(self, lines):
+        paths = [self.reference_path(gas) for gas in self.gases]
+
+        return self.__load(self.__reference, lines, paths)
+
+
+    def fit(self, gas):
+        intervals, device, reference, temp, humid = self.__aligned(gas)
+
+        if len(intervals) == 0:
+            return None
+
+        diffs = reference - device
+
+        # fit...
+        if self.__temp_bin or self.__humid_bin:
+            bins = self.__binned(diffs, temp, humid)
+            medians = [bin_fit.median for bin_fit in bins if bin_fit.points >= self.MIN_BIN_POINTS]
+            centre = float(np.median(medians)) if medians else float(np.median(diffs))
+
+        else:
+            bins = None
+            centre = float(np.median(diffs))
+
+        # statistics...
+        p25, p75 = np.percentile(diffs, [25, 75])
+        mad = float(np.median(np.abs(diffs - np.median(diffs))))
+        r = float(np.corrcoef(device, reference)[0, 1]) if len(diffs) > 1 and np.std(device) > 0 and \
+            np.std(reference) > 0 else None
+
+        start = self.__datetime(intervals[0])
+        end = self.__datetime(intervals[-1])
+
+        # sample...
+        temps = temp[~np.isnan(temp)]
+        humids = humid[~np.isnan(humid)]
+
+        sample = SensorBaselineSample(end, float(np.median(humids)) if len(humids) else None,
+                                      float(np.median(temps)) if len(temps) else None, None)
+
+        return BaselineFit(gas, len(diffs), int(round(centre)), centre, float(np.mean(diffs)), float(np.std(diffs)),
+                           mad, float(p25), float(p75), r, start, end, sample, bins=bins)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __load(self, store, lines, paths):
+        count = 0
+
+        for jstr in self.jstrs(lines):
+            datum = PathDict(json.loads(jstr))
+
+            try:
+                rec = LocalizedDatetime.construct_from_iso8601(datum.node('rec'))
+            except KeyError:
+                continue
+
+            if rec is None:
+                continue
+
+            interval = int(rec.timestamp()) // self.__alignment
+            totals = store.setdefault(interval, {})
+
+            for path in paths:
+                try:
+                    value = float(datum.node(path))
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+                if path not in totals:
+                    totals[path] = [0.0, 0]
+
+                totals[path][0] += value
+                totals[path][1] += 1
+
+            count += 1
+
+        return count
+
+
+    def __aligned(self, gas):
+        device_path = self.device_path(gas)
+        reference_path = self.reference_path(gas)
+
+        intervals = []
+        device = []
+        reference = []
+        temp = []
+        humid = []
+
+        for interval in sorted(set(self.__device.keys()) & set(self.__reference.keys())):
+            device_totals = self.__device[interval]
+            reference_totals = self.__reference[interval]
+
+            if device_path not in device_totals or reference_path not in reference_totals:
+                continue
+
+            intervals.append(interval)
+            device.append(self.__mean(device_totals[device_path]))
+            reference.append(self.__mean(reference_totals[reference_path]))
+            temp.append(self.__mean(device_totals.get(self.__TEMP_PATH)))
+            humid.append(self.__mean(device_totals.get(self.__HUMID_PATH)))
+
+        return intervals, np.array(device), np.array(reference), np.array(temp), np.array(humid)
+
+
+    def __binned(self, diffs, temp, humid):
+        temp_keys = self.__bin_keys(temp, self.__temp_bin)
+        humid_keys = self.__bin_keys(humid, self.__humid_bin)
+
+        members = OrderedDict()
+
+        for i in range(len(diffs)):
+            if temp_keys[i] is False or humid_keys[i] is False:
+                continue
+
+            members.setdefault((temp_keys[i], humid_keys[i]), []).append(diffs[i])
+
+        bins = []
+
+        for (temp_key, humid_key), values in sorted(members.items(), key=lambda item: str(item[0])):
+            bins.append(BaselineFitBin(temp_key, humid_key, len(values), float(np.median(values))))
+
+        return bins
+
+
+    def __datetime(self, interval):
+        return LocalizedDatetime.construct_from_timestamp(interval * self.__alignment).utc()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __bin_keys(values, width):
+        if not width:
+            return [None] * len(values)
+
+        return [False if np.isnan(value) else float(np.floor(value / width) * width) for value in values]
+
+
+    @staticmethod
+    def __mean(total):
+        return np.nan if total is None else total[0] / total[1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def gases(self):
+        return self.__gases
+
+
+    @property
+    def alignment(self):
+        return self.__alignment
+
+
+    @property
+    def temp_bin(self):
+        return self.__temp_bin
+
+
+    @property
+    def humid_bin(self):
+        return self.__humid_bin
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineFitter:{gases:%s, alignment:%s, temp_bin:%s, humid_bin:%s, device:%s, reference:%s}" % \
+               (self.gases, self.alignment, self.temp_bin, self.humid_bin, len(self.__device), len(self.__reference))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineFit(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, gas, points, delta, median, mean, std, mad, p25, p75, r, start, end, sample, bins=None):
+        """
+        Constructor
+        """
+        self.__gas = gas                                    # string
+        self.__points = int(points)                         # int
+        self.__delta = int(delta)                           # int               offset change
+        self.__median = median                              # float
+        self.__mean = mean                                  # float
+        self.__std = std                                    # float
+        self.__mad = mad                                    # float
+        self.__p25 = p25                                    # float
+        self.__p75 = p75                                    # float
+        self.__r = r                                        # float or None
+        self.__start = start                                # LocalizedDatetime
+        self.__end = end                                    # LocalizedDatetime
+        self.__sample = sample                              # SensorBaselineSample
+        self.__bins = bins                                  # list of BaselineFitBin or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['gas'] = self.gas
+        jdict['points'] = self.points
+        jdict['delta'] = self.delta
+        jdict['median'] = round(self.median, 1)
+        jdict['mean'] = round(self.mean, 1)
+        jdict['std'] = round(self.std, 1)
+        jdict['mad'] = round(self.mad, 1)
+        jdict['p25'] = round(self.p25, 1)
+        jdict['p75'] = round(self.p75, 1)
+        jdict['r'] = None if self.r is None else round(self.r, 3)
+        jdict['start'] = self.start.as_iso8601()
+        jdict['end'] = self.end.as_iso8601()
+        jdict['bins'] = self.bins
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def points(self):
+        return self.__points
+
+
+    @property
+    def delta(self):
+        return self.__delta
+
+
+    @property
+    def median(self):
+        return self.__median
+
+
+    @property
+    def mean(self):
+        return self.__mean
+
+
+    @property
+    def std(self):
+        return self.__std
+
+
+    @property
+    def mad(self):
+        return self.__mad
+
+
+    @property
+    def p25(self):
+        return self.__p25
+
+
+    @property
+    def p75(self):
+        return self.__p75
+
+
+    @property
+    def r(self):
+        return self.__r
+
+
+    @property
+    def start(self):
+        return self.__start
+
+
+    @property
+    def end(self):
+        return self.__end
+
+
+    @property
+    def sample(self):
+        return self.__sample
+
+
+    @property
+    def bins(self):
+        return self.__bins
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineFit:{gas:%s, points:%s, delta:%s, median:%s, mean:%s, std:%s, mad:%s, p25:%s, p75:%s, " \
+               "r:%s, start:%s, end:%s, sample:%s, bins:%s}" % \
+               (self.gas, self.points, self.delta, self.median, self.mean, self.std, self.mad, self.p25, self.p75,
+                self.r, self.start, self.end, self.sample, self.bins)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineFitBin(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, temp, humid, points, median):
+        """
+        Constructor
+        """
+        self.__temp = temp                                  # float or None     lower bound of bin
+        self.__humid = humid                                # float or None     lower bound of bin
+        self.__points = int(points)                         # int
+        self.__median = median                              # float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        if self.temp is not None:
+            jdict['tmp'] = self.temp
+
+        if self.humid is not None:
+            jdict['hmd'] = self.humid
+
+        jdict['points'] = self.points
+        jdict['median'] = round(self.median, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def temp(self):
+        return self.__temp
+
+
+    @property
+    def humid(self):
+        return self.__humid
+
+
+    @property
+    def points(self):
+        return self.__points
+
+
+    @property
+    def median(self):
+        return self.__median
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineFitBin:{temp:%s, humid:%s, points:%s, median:%s}" % \
+               (self.temp, self.humid, self.points, self.median)
+
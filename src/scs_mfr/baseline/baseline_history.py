@@ -0,0 +1,291 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An append-only history of baseline offset changes. Each (kind, gas) pair has its own file of fixed-width records,
+so that the file name is the index by sensor. Records are appended in calibrated-on order, so a date range is found by
+binary search on record position, without loading the whole history.
+
+record layout (little-endian, 36 bytes):
+calibrated-on (int64 epoch secs), old offset (int32), new offset (int32), sample rec (int64 epoch secs, or -1),
+sample humid, sample temp, sample press (float32, or NaN)
+
+example JSON:
+{"kind": "afe", "gas": "NO2", "calibrated-on": "2022-03-21T11:46:43Z", "was": 12, "offset": -1,
+"env": {"rec": "2022-03-16T07:45:00Z", "hmd": 51.6, "tmp": 21.8}}
+"""
+
+import math
+import os
+import struct
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+from scs_core.gas.sensor_baseline import SensorBaselineSample
+
+from scs_core.sys.filesystem import Filesystem
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineHistory(object):
+    """
+    classdocs
+    """
+
+    KINDS = ('afe', 'gas', 'vcal', 'scd30')
+
+    __DIR = "baseline_history"                              # hard-coded rel path
+    __SUFFIX = ".bhr"
+
+    __RECORD = struct.Struct('<qiiqfff')
+    __NO_REC = -1
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def record_size(cls):
+        return cls.__RECORD.size
+
+
+    @classmethod
+    def abs_dirname(cls, manager):
+        return os.path.join(manager.scs_path(), 'conf', cls.__DIR)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __pack(cls, record):
+        calibrated_on = int(record.calibrated_on.timestamp())
+        sample = record.sample
+
+        if sample is None:
+            return cls.__RECORD.pack(calibrated_on, record.old_offset, record.new_offset, cls.__NO_REC,
+                                     math.nan, math.nan, math.nan)
+
+        rec = cls.__NO_REC if sample.rec is None else int(sample.rec.timestamp())
+
+        return cls.__RECORD.pack(calibrated_on, record.old_offset, record.new_offset, rec,
+                                 cls.__float(sample.humid), cls.__float(sample.temp), cls.__float(sample.press))
+
+
+    @classmethod
+    def __unpack(cls, kind, gas, buffer):
+        calibrated_on, old_offset, new_offset, rec, humid, temp, press = cls.__RECORD.unpack(buffer)
+
+        if rec == cls.__NO_REC and math.isnan(humid) and math.isnan(temp):
+            sample = None
+
+        else:
+            sample_rec = None if rec == cls.__NO_REC else cls.__datetime(rec)
+            sample = SensorBaselineSample(sample_rec, cls.__value(humid), cls.__value(temp), cls.__value(press))
+
+        return BaselineHistoryRecord(kind, gas, cls.__datetime(calibrated_on), old_offset, new_offset, sample)
+
+
+    @staticmethod
+    def __float(value):
+        return math.nan if value is None else float(value)
+
+
+    @staticmethod
+    def __value(value):
+        return None if math.isnan(value) else value
+
+
+    @staticmethod
+    def __datetime(timestamp):
+        return LocalizedDatetime.construct_from_timestamp(timestamp).utc()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager, kind):
+        """
+        Constructor
+        """
+        if kind not in self.KINDS:
+            raise ValueError(kind)
+
+        self.__manager = manager                            # PersistenceManager
+        self.__kind = kind                                  # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, gas, old_offset, sensor_baseline):
+        record = BaselineHistoryRecord(self.kind, gas, sensor_baseline.calibrated_on, old_offset,
+                                       sensor_baseline.offset, sensor_baseline.sample)
+
+        Filesystem.mkdir(self.abs_dirname(self.__manager))
+
+        with open(self.abs_filename(gas), 'ab') as f:
+            f.write(self.__pack(record))
+
+        return record
+
+
+    def gases(self):
+        try:
+            filenames = os.listdir(self.abs_dirname(self.__manager))
+        except FileNotFoundError:
+            return []
+
+        prefix = self.kind + '_'
+
+        return sorted(filename[len(prefix):-len(self.__SUFFIX)] for filename in filenames
+                      if filename.startswith(prefix) and filename.endswith(self.__SUFFIX))
+
+
+    def find(self, gas, start=None, end=None):
+        try:
+            f = open(self.abs_filename(gas), 'rb')
+        except FileNotFoundError:
+            return
+
+        size = self.record_size()
+
+        try:
+            count = os.fstat(f.fileno()).st_size // size
+            first = 0 if start is None else self.__bisect(f, count, int(start.timestamp()))
+
+            f.seek(first * size)
+
+            for _ in range(first, count):
+                record = self.__unpack(self.kind, gas, f.read(size))
+
+                if end is not None and record.calibrated_on.timestamp() >= end.timestamp():
+                    break
+
+                yield record
+
+        finally:
+            f.close()
+
+
+    def delete(self, gas=None):
+        for name in (self.gases() if gas is None else [gas]):
+            try:
+                os.remove(self.abs_filename(name))
+            except FileNotFoundError:
+                pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __bisect(self, f, count, timestamp):
+        size = self.record_size()
+        low = 0
+        high = count
+
+        while low < high:
+            mid = (low + high) // 2
+
+            f.seek(mid * size)
+            calibrated_on = self.__RECORD.unpack(f.read(size))[0]
+
+            if calibrated_on < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+
+        return low
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def abs_filename(self, gas):
+        return os.path.join(self.abs_dirname(self.__manager), self.kind + '_' + gas + self.__SUFFIX)
+
+
+    @property
+    def kind(self):
+        return self.__kind
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineHistory:{kind:%s, manager:%s}" % (self.kind, self.__manager)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BaselineHistoryRecord(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, kind, gas, calibrated_on, old_offset, new_offset, sample):
+        """
+        Constructor
+        """
+        self.__kind = kind                                  # string
+        self.__gas = gas                                    # string
+        self.__calibrated_on = calibrated_on                # LocalizedDatetime
+        self.__old_offset = int(old_offset)                 # int
+        self.__new_offset = int(new_offset)                 # int
+        self.__sample = sample                              # SensorBaselineSample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['kind'] = self.kind
+        jdict['gas'] = self.gas
+        jdict['calibrated-on'] = None if self.calibrated_on is None else self.calibrated_on.as_iso8601()
+        jdict['was'] = self.old_offset
+        jdict['offset'] = self.new_offset
+
+        if self.sample is not None:
+            jdict['env'] = self.sample
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def kind(self):
+        return self.__kind
+
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def calibrated_on(self):
+        return self.__calibrated_on
+
+
+    @property
+    def old_offset(self):
+        return self.__old_offset
+
+
+    @property
+    def new_offset(self):
+        return self.__new_offset
+
+
+    @property
+    def sample(self):
+        return self.__sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BaselineHistoryRecord:{kind:%s, gas:%s, calibrated_on:%s, old_offset:%s, new_offset:%s, sample:%s}" % \
+               (self.kind, self.gas, self.calibrated_on, self.old_offset, self.new_offset, self.sample)
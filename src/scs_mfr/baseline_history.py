@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The baseline_history utility is used to report the history of changes to sensor zero offsets, as recorded by the
+afe_baseline, gas_baseline, vcal_baseline and scd30_baseline utilities.
+
+The history is append-only, with one file of fixed-width records for each kind of baseline and gas. Changes for a
+given gas over a given date range can be found without reading the whole history. The START datetime is inclusive,
+the END datetime is exclusive.
+
+If no gas is specified, the utility lists the gases for which a history is held. Otherwise, changes are written to
+stdout as JSON lines.
+
+SYNOPSIS
+baseline_history.py -k KIND [-g GAS [-s START] [-e END]] [-v]
+
+EXAMPLES
+./baseline_history.py -k afe -g NO2 -s 2022-03-01T00:00:00Z -e 2022-04-01T00:00:00Z
+
+DOCUMENT EXAMPLE - OUTPUT
+{"kind": "afe", "gas": "NO2", "calibrated-on": "2022-03-21T11:46:43Z", "was": 12, "offset": -1,
+"env": {"rec": "2022-03-16T07:45:00Z", "hmd": 51.6, "tmp": 21.8}}
+
+FILES
+~/SCS/conf/baseline_history/*.bhr
+
+SEE ALSO
+scs_mfr/afe_baseline
+scs_mfr/gas_baseline
+scs_mfr/scd30_baseline
+scs_mfr/vcal_baseline
+"""
+
+import sys
+
+from scs_core.data.json import JSONify
+from scs_core.sys.logging import Logging
+
+from scs_host.sys.host import Host
+
+from scs_mfr.baseline.baseline_history import BaselineHistory
+from scs_mfr.cmd.cmd_baseline_history import CmdBaselineHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdBaselineHistory()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('baseline_history', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    if not cmd.is_valid_start() or not cmd.is_valid_end():
+        logger.error("invalid format for start or end datetime.")
+        exit(2)
+
+    logger.info(cmd)
+
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        history = BaselineHistory(Host, cmd.kind)
+        logger.info(history)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        if cmd.gas is None:
+            print(JSONify.dumps(history.gases()))
+            exit(0)
+
+        count = 0
+
+        for record in history.find(cmd.gas, start=cmd.start, end=cmd.end):
+            print(JSONify.dumps(record))
+            sys.stdout.flush()
+
+            count += 1
+
+        logger.info("changes: %s" % count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
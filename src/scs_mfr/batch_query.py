@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The batch_query utility reports several documents in one combined JSON response. It is intended to be made available
+to the scs_dev/control_receiver, so that a remote management system can obtain a device health snapshot with one
+round trip and one interpreter start, rather than by invoking the configuration, host_id, dfe_id, modem, opc_version
+and git_pull utilities separately.
+
+The documents are named on the command line, in the order in which they are to be reported. If none is named, all
+are reported. The available documents are:
+
+configuration, system-id, host-id, dfe-id, modem, modem-conn, sim, opc-version, git-pull
+
+The queries share the Host, SystemID and modem cache. Modem reports are served from the cached snapshot maintained by
+the modem utility, unless the --live flag is set. The opc-version and git-pull reports are served as last saved by
+their utilities - no hardware is interrogated and no repo is pulled.
+
+A document that cannot be read is reported as null, and the reason is given in the errors field. In this case, the
+utility exits with status 1.
+
+SYNOPSIS
+batch_query.py [-l] [-i INDENT] [-v] [DOCUMENT_1 .. DOCUMENT_N]
+
+EXAMPLES
+./batch_query.py host-id dfe-id modem sim opc-version git-pull
+
+DOCUMENT EXAMPLE
+{"tag": "scs-be2-3", "rec": "2026-10-19T09:01:12Z", "documents": {"host-id": "0000000040d4d158",
+"dfe-id": null, "modem": {"id": "3f07553c31ce11715037ac16c24ceddcfb6f7a0b", "imei": "867962041294151",
+"mfr": "QUALCOMM INCORPORATED", "model": "QUECTEL Mobile Broadband Module", "rev": "EC21EFAR06A01M4G"},
+"sim": {"imsi": "234104886708567", "iccid": "8944110068257270054", "operator-code": "23410",
+"operator-name": "O2 - UK"}, "opc-version": {"serial": "177336702",
+"firmware": "OPC-N3 Iss1.1 FirmwareVer=1.17a...........................BS"}, "git-pull": {"pulled-on":
+"2026-10-18T08:37:09Z", "success": true, "installed": ["scs_core", "scs_mfr"], "pulled": ["scs_core", "scs_mfr"],
+"excluded": []}}, "errors": {"dfe-id": "OSError(121, 'Remote I/O error')"}}
+
+FILES
+~/SCS/conf/modem_snapshot.json
+
+SEE ALSO
+scs_dev/control_receiver
+scs_mfr/configuration
+scs_mfr/dfe_id
+scs_mfr/git_pull
+scs_mfr/host_id
+scs_mfr/modem
+scs_mfr/opc_version
+"""
+
+import sys
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.system_id import SystemID
+
+from scs_host.sys.host import Host
+
+from scs_mfr.cmd.cmd_batch_query import CmdBatchQuery
+from scs_mfr.estate.batch_query import BatchQuery
+from scs_mfr.sys.modem_cache import ModemCache
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdBatchQuery()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('batch_query', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    # SystemID...
+    system_id = SystemID.load(Host)
+    logger.info(system_id)
+
+    # modem...
+    modem_cache = ModemCache(Host, live=cmd.live)
+    logger.info(modem_cache)
+
+    # BatchQuery...
+    query = BatchQuery(Host, system_id, modem_cache)
+    logger.info(query)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        response = query.run(*cmd.documents)
+        logger.info(response)
+
+        print(JSONify.dumps(response, indent=cmd.indent))
+
+        exit(1 if response.has_errors() else 0)
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
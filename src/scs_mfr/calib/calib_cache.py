@@ -0,0 +1,544 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A local cache of AFE board and DSI sensor calibration documents, as served by the South Coast Science calibration web
+API. Documents are stored by content hash, with one reference file per serial number recording the hash together with
+the ETag and Last-Modified headers of the response.
+
+A reference younger than max_age seconds is served without contacting the server. Older references are revalidated
+with a conditional GET, so that an unchanged document is not downloaded again. If the server cannot be reached, or
+responds with a server error (5xx), the cached document is served. In offline mode, the server is never contacted.
+
+Serial numbers containing a '-' are AFE boards; others are DSI sensors.
+
+example JSON (reference):
+{"kind": "board", "serial": "26-000345", "hash": "3c9e...", "etag": "\"a1b2\"",
+"last-modified": "Tue, 05 Mar 2024 10:12:33 GMT", "fetched": "2026-10-19T09:01:12Z"}
+
+example JSON (report):
+{"kind": "board", "serial": "26-000345", "status": "not-modified", "hash": "3c9e...", "elapsed": 0.214}
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_core.client.http_exception import HTTPException
+from scs_core.client.http_status import HTTPStatus
+from scs_core.client.resource_unavailable_exception import ResourceUnavailableException
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+from scs_core.gas.calibration_client import AFECalibrationClient, SensorCalibrationClient
+from scs_core.gas.dsi_calib import DSICalib
+
+from scs_core.sys.filesystem import Filesystem
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CalibCache(object):
+    """
+    classdocs
+    """
+
+    HOST = "calibration.southcoastscience.com"
+
+    BOARD = 'board'
+    SENSOR = 'sensor'
+
+    DEFAULT_MAX_AGE = 600                           # seconds
+    DEFAULT_TIMEOUT = 10.0                          # seconds
+    DEFAULT_CONCURRENCY = 8
+
+    FRESH = 'fresh'
+    NOT_MODIFIED = 'not-modified'
+    FETCHED = 'fetched'
+    STALE = 'stale'                                 # served from cache because the server could not be reached
+    FAILED = 'failed'
+
+    __NOT_MODIFIED = 304
+    __SERVER_ERROR = 500                            # 5xx: treated as the server being unavailable
+
+    __DIR = "calib_cache"                           # hard-coded rel path
+    __OBJECTS = "objects"
+    __REFS = "refs"
+
+    __HEADERS = {"Accept": "application/json"}
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def abs_dirname(cls, manager):
+        return os.path.join(manager.scs_path(), 'conf', cls.__DIR)
+
+
+    @classmethod
+    def kind(cls, serial_number):
+        return cls.BOARD if '-' in serial_number else cls.SENSOR
+
+
+    @classmethod
+    def calib_kind(cls, calib_class):
+        return cls.SENSOR if issubclass(calib_class, DSICalib) else cls.BOARD
+
+
+    @classmethod
+    def path(cls, kind, serial_number):
+        client = AFECalibrationClient.construct() if kind == cls.BOARD else SensorCalibrationClient.construct()
+
+        return client.path + serial_number
+
+
+    @staticmethod
+    def content_hash(content):
+        return hashlib.sha256(content).hexdigest()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager, offline=False, max_age=None, timeout=None):
+        """
+        Constructor
+        """
+        self.__manager = manager                                                            # PersistenceManager
+        self.__offline = bool(offline)                                                      # bool
+        self.__max_age = self.DEFAULT_MAX_AGE if max_age is None else max_age               # int seconds
+        self.__timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout               # float seconds
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def download(self, calib_class, serial_number, parse=True):
+        jdict, _ = self.fetch(self.calib_kind(calib_class), serial_number)
+
+        return calib_class.construct_from_jdict(jdict) if parse else jdict
+
+
+    @classmethod
+    def is_unavailable(cls, ex):
+        if isinstance(ex, ResourceUnavailableException):
+            return True
+
+        return ex.status is not None and ex.status >= cls.__SERVER_ERROR
+
+
+    def fetch(self, kind, serial_number):
+        entry = self.entry(kind, serial_number)
+        content = None if entry is None else self.__read_object(entry.hash)
+
+        if content is None:
+            entry = None
+
+        # cache...
+        if entry is not None and (self.offline or entry.age() < self.max_age):
+            return json.loads(content), self.FRESH
+
+        if self.offline:
+            raise ResourceUnavailableException(self.HOST + self.path(kind, serial_number), None)
+
+        # server...
+        try:
+            response_content, etag, last_modified = self.__get(self.path(kind, serial_number), entry)
+
+        except (HTTPException, ResourceUnavailableException) as ex:
+            if entry is None or not self.is_unavailable(ex):
+                raise ex
+
+            self.__logger.warning("%s %s: server unavailable - serving cached document" % (kind, serial_number))
+            return json.loads(content), self.STALE
+
+        if response_content is None:
+            status = self.NOT_MODIFIED
+            entry = CalibCacheEntry(kind, serial_number, entry.hash, etag or entry.etag,
+                                    last_modified or entry.last_modified, LocalizedDatetime.now().utc())
+
+        else:
+            status = self.FETCHED
+            content = response_content
+            entry = CalibCacheEntry(kind, serial_number, self.__write_object(content), etag, last_modified,
+                                    LocalizedDatetime.now().utc())
+
+        self.__write_entry(entry)
+
+        return json.loads(content), status
+
+
+    def prefetch(self, serial_numbers, concurrency=None):
+        concurrency = self.DEFAULT_CONCURRENCY if concurrency is None else int(concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for report in executor.map(self.__prefetch, serial_numbers):
+                yield report
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def entry(self, kind, serial_number):
+        try:
+            with open(self.__entry_filename(kind, serial_number)) as f:
+                return CalibCacheEntry.construct_from_jdict(json.load(f))
+
+        except (OSError, ValueError):
+            return None
+
+
+    def entries(self):
+        dirname = os.path.join(self.abs_dirname(self.__manager), self.__REFS)
+
+        try:
+            filenames = sorted(os.listdir(dirname))
+        except FileNotFoundError:
+            return []
+
+        entries = []
+
+        for filename in filenames:
+            try:
+                with open(os.path.join(dirname, filename)) as f:
+                    entries.append(CalibCacheEntry.construct_from_jdict(json.load(f)))
+
+            except (OSError, ValueError):
+                continue
+
+        return entries
+
+
+    def clear(self):
+        for subdir in (self.__REFS, self.__OBJECTS):
+            dirname = os.path.join(self.abs_dirname(self.__manager), subdir)
+
+            try:
+                filenames = os.listdir(dirname)
+            except FileNotFoundError:
+                continue
+
+            for filename in filenames:
+                os.remove(os.path.join(dirname, filename))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __prefetch(self, serial_number):
+        kind = self.kind(serial_number)
+        timer = Timer()
+
+        try:
+            _, status = self.fetch(kind, serial_number)
+            entry = self.entry(kind, serial_number)
+
+            return CalibCacheReport(kind, serial_number, status, None if entry is None else entry.hash, timer.total())
+
+        except HTTPException as ex:
+            return CalibCacheReport(kind, serial_number, self.FAILED, None, timer.total(), error=ex.status)
+
+        except (ResourceUnavailableException, ValueError) as ex:
+            return CalibCacheReport(kind, serial_number, self.FAILED, None, timer.total(),
+                                    error=ex.__class__.__name__)
+
+
+    def __get(self, path, entry):
+        headers = dict(self.__HEADERS)
+
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        conn = http.client.HTTPSConnection(self.HOST, timeout=self.__timeout)
+
+        try:
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                content = response.read()
+
+            except (OSError, http.client.HTTPException) as ex:
+                raise ResourceUnavailableException(self.HOST + path, ex)
+
+            etag = response.getheader('ETag')
+            last_modified = response.getheader('Last-Modified')
+
+            if response.status == self.__NOT_MODIFIED:
+                return None, etag, last_modified
+
+            if response.status != HTTPStatus.OK:
+                raise HTTPException.construct_from_res(response, content)
+
+            json.loads(content)                             # raises ValueError if the document is not JSON
+
+            return content, etag, last_modified
+
+        finally:
+            conn.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __read_object(self, content_hash):
+        try:
+            with open(self.__object_filename(content_hash), 'rb') as f:
+                content = f.read()
+
+        except OSError:
+            return None
+
+        return content if self.content_hash(content) == content_hash else None
+
+
+    def __write_object(self, content):
+        content_hash = self.content_hash(content)
+        filename = self.__object_filename(content_hash)
+
+        if not os.path.exists(filename):
+            self.__write(filename, content)
+
+        return content_hash
+
+
+    def __write_entry(self, entry):
+        content = json.dumps(entry.as_json()).encode()
+
+        self.__write(self.__entry_filename(entry.kind, entry.serial_number), content)
+
+
+    @staticmethod
+    def __write(filename, content):
+        Filesystem.mkdir(os.path.dirname(filename))
+
+        tmp_filename = '%s.%s.%s.tmp' % (filename, os.getpid(), threading.get_ident())
+
+        with open(tmp_filename, 'wb') as f:
+            f.write(content)
+
+        os.replace(tmp_filename, filename)
+
+
+    def __object_filename(self, content_hash):
+        return os.path.join(self.abs_dirname(self.__manager), self.__OBJECTS, content_hash + '.json')
+
+
+    def __entry_filename(self, kind, serial_number):
+        return os.path.join(self.abs_dirname(self.__manager), self.__REFS, '%s_%s.json' % (kind, serial_number))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def offline(self):
+        return self.__offline
+
+
+    @property
+    def max_age(self):
+        return self.__max_age
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CalibCache:{offline:%s, max_age:%s, timeout:%s, manager:%s}" % \
+               (self.offline, self.max_age, self.timeout, self.__manager)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CalibCacheEntry(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        kind = jdict.get('kind')
+        serial_number = jdict.get('serial')
+        content_hash = jdict.get('hash')
+        etag = jdict.get('etag')
+        last_modified = jdict.get('last-modified')
+        fetched = LocalizedDatetime.construct_from_iso8601(jdict.get('fetched'))
+
+        return cls(kind, serial_number, content_hash, etag, last_modified, fetched)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, kind, serial_number, content_hash, etag, last_modified, fetched):
+        """
+        Constructor
+        """
+        self.__kind = kind                                  # string
+        self.__serial_number = serial_number                # string
+        self.__hash = content_hash                          # string
+        self.__etag = etag                                  # string
+        self.__last_modified = last_modified                # string        HTTP date
+        self.__fetched = fetched                            # LocalizedDatetime
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def age(self):
+        if self.fetched is None:
+            return float('inf')
+
+        return LocalizedDatetime.now().timestamp() - self.fetched.timestamp()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['kind'] = self.kind
+        jdict['serial'] = self.serial_number
+        jdict['hash'] = self.hash
+        jdict['etag'] = self.etag
+        jdict['last-modified'] = self.last_modified
+        jdict['fetched'] = None if self.fetched is None else self.fetched.as_iso8601()
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def kind(self):
+        return self.__kind
+
+
+    @property
+    def serial_number(self):
+        return self.__serial_number
+
+
+    @property
+    def hash(self):
+        return self.__hash
+
+
+    @property
+    def etag(self):
+        return self.__etag
+
+
+    @property
+    def last_modified(self):
+        return self.__last_modified
+
+
+    @property
+    def fetched(self):
+        return self.__fetched
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CalibCacheEntry:{kind:%s, serial_number:%s, hash:%s, etag:%s, last_modified:%s, fetched:%s}" % \
+               (self.kind, self.serial_number, self.hash, self.etag, self.last_modified, self.fetched)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CalibCacheReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, kind, serial_number, status, content_hash, elapsed, error=None):
+        """
+        Constructor
+        """
+        self.__kind = kind                                  # string
+        self.__serial_number = serial_number                # string
+        self.__status = status                              # string
+        self.__hash = content_hash                          # string
+        self.__elapsed = elapsed                            # float seconds
+        self.__error = error                                # int HTTP status or string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_ok(self):
+        return self.status != CalibCache.FAILED
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['kind'] = self.kind
+        jdict['serial'] = self.serial_number
+        jdict['status'] = self.status
+        jdict['hash'] = self.hash
+        jdict['elapsed'] = self.elapsed
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def kind(self):
+        return self.__kind
+
+
+    @property
+    def serial_number(self):
+        return self.__serial_number
+
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    @property
+    def hash(self):
+        return self.__hash
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CalibCacheReport:{kind:%s, serial_number:%s, status:%s, hash:%s, elapsed:%s, error:%s}" % \
+               (self.kind, self.serial_number, self.status, self.hash, self.elapsed, self.error)
@@ -22,7 +22,7 @@ class CmdAFECalib(object):
         """
         self.__parser = optparse.OptionParser(usage="%prog [{ -f SERIAL_NUMBER | -a SERIAL_NUMBER | "
                                                     "-s SERIAL_NUMBER YYYY-MM-DD | -r | -p CORRECT REPORTED | "
-                                                    "-t  | -d }] [-i INDENT] [-v]", version=version())
+                                                    "-t  | -d }] [-o] [-i INDENT] [-v]", version=version())
 
         # operations...
         self.__parser.add_option("--find", "-f", type="string", action="store", dest="find_serial_number",
@@ -46,6 +46,10 @@ class CmdAFECalib(object):
         self.__parser.add_option("--delete", "-d", action="store_true", dest="delete", default=False,
                                  help="delete this calibration")
 
+        # cache...
+        self.__parser.add_option("--offline", "-o", action="store_true", dest="offline", default=False,
+                                 help="use only locally-cached calibration data")
+
         # output...
         self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
                                  help="pretty-print the output with INDENT")
@@ -163,6 +167,11 @@ class CmdAFECalib(object):
         return self.__opts.delete
 
 
+    @property
+    def offline(self):
+        return self.__opts.offline
+
+
     @property
     def indent(self):
         return self.__opts.indent
@@ -181,6 +190,6 @@ class CmdAFECalib(object):
 
     def __str__(self, *args, **kwargs):
         return "CmdAFECalib:{find_serial_number:%s, afe_serial_number:%s, sensor:%s, reload:%s, pid_test_sens:%s, " \
-               "test:%s, delete:%s, indent:%s, verbose:%s}" % \
+               "test:%s, delete:%s, offline:%s, indent:%s, verbose:%s}" % \
                (self.find_serial_number, self.afe_serial_number, self.sensor, self.reload, self.__opts.pid_test_sens,
-                self.test, self.delete, self.indent, self.verbose)
+                self.test, self.delete, self.offline, self.indent, self.verbose)
@@ -0,0 +1,101 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdAFECalibCache(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [{ -p [-r] [-c CONCURRENCY] [SERIAL_NUMBER_1 .. N] | -d }] "
+                                                    "[-v]", version=version())
+
+        # operations...
+        self.__parser.add_option("--prefetch", "-p", action="store_true", dest="prefetch", default=False,
+                                 help="fetch the given serial numbers, or those on stdin")
+
+        self.__parser.add_option("--revalidate", "-r", action="store_true", dest="revalidate", default=False,
+                                 help="revalidate recently-fetched documents")
+
+        self.__parser.add_option("--concurrency", "-c", type="int", action="store", dest="concurrency",
+                                 help="maximum requests in flight (default 8)")
+
+        self.__parser.add_option("--delete", "-d", action="store_true", dest="delete", default=False,
+                                 help="delete all cached documents")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.prefetch and self.delete:
+            return False
+
+        if not self.prefetch and (self.revalidate or self.concurrency is not None or self.__args):
+            return False
+
+        if self.concurrency is not None and self.concurrency < 1:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def prefetch(self):
+        return self.__opts.prefetch
+
+
+    @property
+    def revalidate(self):
+        return self.__opts.revalidate
+
+
+    @property
+    def concurrency(self):
+        return self.__opts.concurrency
+
+
+    @property
+    def delete(self):
+        return self.__opts.delete
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def serial_numbers(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdAFECalibCache:{prefetch:%s, revalidate:%s, concurrency:%s, delete:%s, verbose:%s, " \
+               "serial_numbers:%s}" % \
+               (self.prefetch, self.revalidate, self.concurrency, self.delete, self.verbose,
+                self.serial_numbers)
@@ -18,12 +18,15 @@ class CmdAWSDeployment(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-w] [-i INDENT] [-v]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-w [-t TIMEOUT]] [-i INDENT] [-v]", version=version())
 
         # mode...
         self.__parser.add_option("--wait", "-w", action="store_true", dest="wait", default=False,
                                  help="wait for the deployment to finish")
 
+        self.__parser.add_option("--timeout", "-t", type="float", action="store", dest="timeout",
+                                 help="give up waiting after TIMEOUT seconds")
+
         # output...
         self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
                                  help="pretty-print the output with INDENT")
@@ -37,6 +40,9 @@ class CmdAWSDeployment(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.timeout is not None and (not self.wait or self.timeout <= 0):
+            return False
+
         if self.__args:
             return False
 
@@ -50,6 +56,11 @@ class CmdAWSDeployment(object):
         return self.__opts.wait
 
 
+    @property
+    def timeout(self):
+        return self.__opts.timeout
+
+
     @property
     def indent(self):
         return self.__opts.indent
@@ -66,5 +77,5 @@ class CmdAWSDeployment(object):
         self.__parser.print_help(file)
 
     def __str__(self, *args, **kwargs):
-        return "CmdAWSDeployment:{wait:%s indent:%s verbose:%s}" % \
-               (self.wait, self.indent, self.verbose)
+        return "CmdAWSDeployment:{wait:%s timeout:%s indent:%s verbose:%s}" % \
+               (self.wait, self.timeout, self.indent, self.verbose)
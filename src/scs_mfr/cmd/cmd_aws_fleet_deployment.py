@@ -0,0 +1,122 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdAWSFleetDeployment(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-r RATE] [-c CONCURRENCY] [-t TIMEOUT] "
+                                                    "[-s [-d DURATION] [-f FAILURE]] [-v] [GROUP_NAME_1 .. N]",
+                                              version=version())
+
+        # throughput...
+        self.__parser.add_option("--rate", "-r", type="float", action="store", dest="rate",
+                                 help="maximum AWS API requests per second (default 5)")
+
+        self.__parser.add_option("--concurrency", "-c", type="int", action="store", dest="concurrency",
+                                 help="maximum deployment requests in flight (default 8)")
+
+        self.__parser.add_option("--timeout", "-t", type="float", action="store", dest="timeout",
+                                 help="give up on each deployment after TIMEOUT seconds")
+
+        # stub...
+        self.__parser.add_option("--stub", "-s", action="store_true", dest="stub", default=False,
+                                 help="use a local stub in place of the Greengrass service")
+
+        self.__parser.add_option("--stub-duration", "-d", type="float", action="store", dest="stub_duration",
+                                 help="duration of each stub deployment in seconds (default 5)")
+
+        self.__parser.add_option("--stub-failure", "-f", type="string", action="append", dest="stub_failures",
+                                 help="stub deployment for group FAILURE fails (may be repeated)")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.rate is not None and self.rate <= 0:
+            return False
+
+        if self.concurrency is not None and self.concurrency < 1:
+            return False
+
+        if self.timeout is not None and self.timeout <= 0:
+            return False
+
+        if not self.stub and (self.stub_duration is not None or self.stub_failures):
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rate(self):
+        return self.__opts.rate
+
+
+    @property
+    def concurrency(self):
+        return self.__opts.concurrency
+
+
+    @property
+    def timeout(self):
+        return self.__opts.timeout
+
+
+    @property
+    def stub(self):
+        return self.__opts.stub
+
+
+    @property
+    def stub_duration(self):
+        return self.__opts.stub_duration
+
+
+    @property
+    def stub_failures(self):
+        return [] if self.__opts.stub_failures is None else self.__opts.stub_failures
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def group_names(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdAWSFleetDeployment:{rate:%s, concurrency:%s, timeout:%s, stub:%s, stub_duration:%s, " \
+               "stub_failures:%s, verbose:%s, group_names:%s}" % \
+               (self.rate, self.concurrency, self.timeout, self.stub, self.stub_duration,
+                self.stub_failures, self.verbose, self.group_names)
@@ -0,0 +1,113 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdAWSGroupSnapshot(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [{ -f [-r RATE] [-c CONCURRENCY] [GROUP_NAME_1 .. N] | "
+                                                    "-d BEFORE_FILE AFTER_FILE }] [-v]", version=version())
+
+        # modes...
+        self.__parser.add_option("--fleet", "-f", action="store_true", dest="fleet", default=False,
+                                 help="snapshot the given groups, or those on stdin, from the Greengrass API")
+
+        self.__parser.add_option("--diff", "-d", type="string", nargs=2, action="store", dest="diff",
+                                 help="compare the snapshots in BEFORE_FILE and AFTER_FILE")
+
+        # throughput...
+        self.__parser.add_option("--rate", "-r", type="float", action="store", dest="rate",
+                                 help="maximum AWS API requests per second (default 5)")
+
+        self.__parser.add_option("--concurrency", "-c", type="int", action="store", dest="concurrency",
+                                 help="maximum groups retrieved concurrently (default 8)")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.fleet and self.diff:
+            return False
+
+        if not self.fleet and (self.rate is not None or self.concurrency is not None or self.__args):
+            return False
+
+        if self.rate is not None and self.rate <= 0:
+            return False
+
+        if self.concurrency is not None and self.concurrency < 1:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def fleet(self):
+        return self.__opts.fleet
+
+
+    @property
+    def diff(self):
+        return self.__opts.diff is not None
+
+
+    @property
+    def before_filename(self):
+        return None if self.__opts.diff is None else self.__opts.diff[0]
+
+
+    @property
+    def after_filename(self):
+        return None if self.__opts.diff is None else self.__opts.diff[1]
+
+
+    @property
+    def rate(self):
+        return self.__opts.rate
+
+
+    @property
+    def concurrency(self):
+        return self.__opts.concurrency
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def group_names(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdAWSGroupSnapshot:{fleet:%s, diff:%s, rate:%s, concurrency:%s, verbose:%s, group_names:%s}" % \
+               (self.fleet, self.__opts.diff, self.rate, self.concurrency, self.verbose, self.group_names)
@@ -36,7 +36,9 @@ class CmdBaseline(object):
         """
         self.__parser = optparse.OptionParser(usage="%prog [{ -b GAS  | "
                                                     "{ { -s | -o } GAS VALUE | -c GAS CORRECT REPORTED } "
-                                                    "[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -z | -d }] "
+                                                    "[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -f FILENAME | "
+                                                    "-e DEVICE_FILE REFERENCE_FILE [-g GAS] [-a ALIGN] "
+                                                    "[-n TEMP_WIDTH HUMID_WIDTH] | -z | -d }] "
                                                     "[-i INDENT] [-v]", version=version())
 
         # operations...
@@ -52,6 +54,12 @@ class CmdBaseline(object):
         self.__parser.add_option("--correct", "-c", type="string", nargs=3, action="store", dest="correct",
                                  help="change offset for GAS, by the difference between CORRECT and REPORTED values")
 
+        self.__parser.add_option("--batch", "-f", type="string", action="store", dest="batch",
+                                 help="apply JSON lines corrections from FILENAME ('-' for stdin)")
+
+        self.__parser.add_option("--fit", "-e", type="string", nargs=2, action="store", dest="fit",
+                                 help="fit offsets from co-located DEVICE_FILE and REFERENCE_FILE (CSV or JSON lines)")
+
         self.__parser.add_option("--zero", "-z", action="store_true", dest="zero", default=False,
                                  help="zero all offsets")
 
@@ -68,6 +76,17 @@ class CmdBaseline(object):
         self.__parser.add_option("--sample-humid", "-m", type="float", action="store", dest="sample_humid",
                                  help="sample humidity")
 
+        # fit...
+        self.__parser.add_option("--fit-gas", "-g", type="string", action="append", dest="fit_gases",
+                                 help="fit GAS only (may be repeated, default all)")
+
+        self.__parser.add_option("--align", "-a", type="int", action="store", dest="align",
+                                 help="align device and reference rec on ALIGN seconds (default 60)")
+
+        self.__parser.add_option("--bins", "-n", type="float", nargs=2, action="store", dest="bins",
+                                 help="fit by temperature and humidity bins of TEMP_WIDTH and HUMID_WIDTH "
+                                      "(0 to ignore)")
+
         # output...
         self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
                                  help="pretty-print the output with INDENT")
@@ -96,6 +115,12 @@ class CmdBaseline(object):
         if self.correct is not None:
             count += 1
 
+        if self.batch is not None:
+            count += 1
+
+        if self.fit is not None:
+            count += 1
+
         if self.zero:
             count += 1
 
@@ -123,6 +148,17 @@ class CmdBaseline(object):
         if count == 3 and self.set is None and self.offset is None and self.correct is None:
             return False
 
+        # fit...
+        if self.fit is None and \
+                (self.fit_gases is not None or self.align is not None or self.__opts.bins is not None):
+            return False
+
+        if self.align is not None and self.align < 1:
+            return False
+
+        if self.__opts.bins is not None and (self.__opts.bins[0] < 0 or self.__opts.bins[1] < 0):
+            return False
+
         # VALUE...
         if self.set is not None and not self.__is_integer(self.set[1]):
             return False
@@ -211,6 +247,46 @@ class CmdBaseline(object):
         return int(self.correct[2]) if self.correct else None
 
 
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def fit(self):
+        return self.__opts.fit
+
+
+    @property
+    def device_filename(self):
+        return self.fit[0] if self.fit else None
+
+
+    @property
+    def reference_filename(self):
+        return self.fit[1] if self.fit else None
+
+
+    @property
+    def fit_gases(self):
+        return self.__opts.fit_gases
+
+
+    @property
+    def align(self):
+        return self.__opts.align
+
+
+    @property
+    def temp_bin(self):
+        return self.__opts.bins[0] if self.__opts.bins else None
+
+
+    @property
+    def humid_bin(self):
+        return self.__opts.bins[1] if self.__opts.bins else None
+
+
     @property
     def zero(self):
         return self.__opts.zero
@@ -253,7 +329,9 @@ class CmdBaseline(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdBaseline:{baseline:%s, set:%s, offset:%s, correct:%s, zero:%s, delete:%s, " \
+        return "CmdBaseline:{baseline:%s, set:%s, offset:%s, correct:%s, batch:%s, fit:%s, fit_gases:%s, " \
+               "align:%s, bins:%s, zero:%s, delete:%s, " \
                "sample_rec:%s, sample_temp:%s, sample_humid:%s, indent:%s, verbose:%s}" % \
-               (self.baseline, self.set, self.offset, self.correct, self.zero, self.delete,
+               (self.baseline, self.set, self.offset, self.correct, self.batch, self.fit, self.fit_gases,
+                self.align, self.__opts.bins, self.zero, self.delete,
                 self.sample_rec, self.sample_temp, self.sample_humid, self.indent, self.verbose)
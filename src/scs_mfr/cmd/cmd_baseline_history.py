@@ -0,0 +1,114 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_mfr import version
+from scs_mfr.baseline.baseline_history import BaselineHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdBaselineHistory(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        kinds = ' | '.join(BaselineHistory.KINDS)
+
+        self.__parser = optparse.OptionParser(usage="%prog -k KIND [-g GAS [-s START] [-e END]] [-v]",
+                                              version=version())
+
+        # identity...
+        self.__parser.add_option("--kind", "-k", type="string", action="store", dest="kind",
+                                 help="baseline kind { %s }" % kinds)
+
+        # query...
+        self.__parser.add_option("--gas", "-g", type="string", action="store", dest="gas",
+                                 help="list changes for GAS (otherwise list gases)")
+
+        self.__parser.add_option("--start", "-s", type="string", action="store", dest="start",
+                                 help="ISO 8601 datetime of earliest change")
+
+        self.__parser.add_option("--end", "-e", type="string", action="store", dest="end",
+                                 help="ISO 8601 datetime after latest change")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.kind not in BaselineHistory.KINDS:
+            return False
+
+        if self.gas is None and (self.__opts.start is not None or self.__opts.end is not None):
+            return False
+
+        if self.__args:
+            return False
+
+        return True
+
+
+    def is_valid_start(self):
+        if self.__opts.start is None:
+            return True
+
+        return self.start is not None
+
+
+    def is_valid_end(self):
+        if self.__opts.end is None:
+            return True
+
+        return self.end is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def kind(self):
+        return self.__opts.kind
+
+
+    @property
+    def gas(self):
+        return self.__opts.gas
+
+
+    @property
+    def start(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.start)
+
+
+    @property
+    def end(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.end)
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdBaselineHistory:{kind:%s, gas:%s, start:%s, end:%s, verbose:%s}" % \
+               (self.kind, self.gas, self.__opts.start, self.__opts.end, self.verbose)
@@ -0,0 +1,27 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+from scs_mfr.cmd.command_spec import CommandSpec, Option, Positional, SpecCmd
+from scs_mfr.estate.batch_query import BatchQuery
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdBatchQuery(SpecCmd):
+    """unix command line handler"""
+
+    SPEC = CommandSpec("%prog [-l] [-i INDENT] [-v] [DOCUMENT_1 .. DOCUMENT_N]",
+
+                       # modem...
+                       Option("--live", "-l", action="store_true", dest="live", default=False,
+                              help="query the modem, rather than the cached snapshot"),
+
+                       # output...
+                       Option.indent(),
+                       Option.verbose(),
+
+                       positional=Positional("documents"),
+                       validators=(lambda cmd: all(name in BatchQuery.DOCUMENTS for name in cmd.documents), ))
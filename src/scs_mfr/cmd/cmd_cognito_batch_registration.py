@@ -0,0 +1,105 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdCognitoBatchRegistration(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-c CONCURRENCY] [-m MAX_ATTEMPTS] [-s [-f FAILURE_RATE]] "
+                                                    "[-v] [MANIFEST_FILE]", version=version())
+
+        # optional...
+        self.__parser.add_option("--concurrency", "-c", type="int", action="store", dest="concurrency",
+                                 help="maximum registrations in flight (default 8)")
+
+        self.__parser.add_option("--max-attempts", "-m", type="int", action="store", dest="max_attempts",
+                                 help="maximum attempts for each request (default 5)")
+
+        # stand-in...
+        self.__parser.add_option("--stand-in", "-s", action="store_true", dest="stand_in", default=False,
+                                 help="use a local stand-in for the Cognito APIs")
+
+        self.__parser.add_option("--failure-rate", "-f", type="float", action="store", dest="failure_rate",
+                                 help="fraction of stand-in requests that fail transiently (default 0.0)")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if len(self.__args) > 1:
+            return False
+
+        if self.concurrency is not None and self.concurrency < 1:
+            return False
+
+        if self.max_attempts is not None and self.max_attempts < 1:
+            return False
+
+        if self.__opts.failure_rate is not None and (not self.stand_in or not 0.0 <= self.failure_rate < 1.0):
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def concurrency(self):
+        return self.__opts.concurrency
+
+
+    @property
+    def max_attempts(self):
+        return self.__opts.max_attempts
+
+
+    @property
+    def stand_in(self):
+        return self.__opts.stand_in
+
+
+    @property
+    def failure_rate(self):
+        return 0.0 if self.__opts.failure_rate is None else self.__opts.failure_rate
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def filename(self):
+        return self.__args[0] if self.__args else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdCognitoBatchRegistration:{concurrency:%s, max_attempts:%s, stand_in:%s, failure_rate:%s, " \
+               "verbose:%s, filename:%s}" % \
+               (self.concurrency, self.max_attempts, self.stand_in, self.failure_rate,
+                self.verbose, self.filename)
@@ -18,17 +18,26 @@ class CmdConfiguration(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s CONFIGURATION] [-x] [{ -i INDENT | -t }] [-v]",
-                                              version=version())
+        self.__parser = optparse.OptionParser(usage="%prog { -f | [{ -s CONFIGURATION | -d DESIRED_STATE_FILE }] "
+                                                    "[-x] [-l] [{ -i INDENT | -t }] } [-v]", version=version())
 
         # mode...
         self.__parser.add_option("--save", "-s", type="string", action="store", dest="configuration",
                                  help="save the given JSON configuration component(s)")
 
+        self.__parser.add_option("--desired-state", "-d", type="string", action="store", dest="desired_state",
+                                 help="save the sections of the configuration in the file that differ from the current")
+
+        self.__parser.add_option("--fleet-table", "-f", action="store_true", dest="fleet_table", default=False,
+                                 help="tabulate the configuration samples on stdin in comma-separated format")
+
         # output...
         self.__parser.add_option("--exclude-sim", "-x", action="store_true", dest="exclude_sim", default=False,
                                  help="exclude SIM information from output")
 
+        self.__parser.add_option("--live", "-l", action="store_true", dest="live", default=False,
+                                 help="query the modem, rather than the cached snapshot")
+
         self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
                                  help="pretty-print the output with INDENT")
 
@@ -44,9 +53,19 @@ class CmdConfiguration(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.save() and self.desired_state is not None:
+            return False
+
         if self.indent and self.table:
             return False
 
+        if self.desired_state is not None and self.table:
+            return False
+
+        if self.fleet_table and (self.save() or self.desired_state is not None or self.exclude_sim or self.live or
+                                 self.indent is not None or self.table):
+            return False
+
         if self.__args:
             return False
 
@@ -64,11 +83,26 @@ class CmdConfiguration(object):
         return self.__opts.configuration
 
 
+    @property
+    def desired_state(self):
+        return self.__opts.desired_state
+
+
+    @property
+    def fleet_table(self):
+        return self.__opts.fleet_table
+
+
     @property
     def exclude_sim(self):
         return self.__opts.exclude_sim
 
 
+    @property
+    def live(self):
+        return self.__opts.live
+
+
     @property
     def indent(self):
         return self.__opts.indent
@@ -91,5 +125,7 @@ class CmdConfiguration(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdConfiguration:{configuration:%s, exclude_sim:%s, indent:%s, table:%s, verbose:%s}" % \
-               (self.configuration, self.exclude_sim, self.indent, self.table, self.verbose)
+        return "CmdConfiguration:{configuration:%s, desired_state:%s, fleet_table:%s, exclude_sim:%s, live:%s, " \
+               "indent:%s, table:%s, verbose:%s}" % \
+               (self.configuration, self.desired_state, self.fleet_table, self.exclude_sim, self.live,
+                self.indent, self.table, self.verbose)
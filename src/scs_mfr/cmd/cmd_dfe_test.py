@@ -18,13 +18,16 @@ class CmdDFETest(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER",
+        self.__parser = optparse.OptionParser(usage="%prog [{ -e | -f }] [-g] [-r] [-v] DFE_SERIAL_NUMBER",
                                               version=version())
 
         # mode...
         self.__parser.add_option("--eeprom", "-e", action="store_true", dest="ignore_eeprom", default=False,
                                  help="ignore EEPROM")
 
+        self.__parser.add_option("--force-eeprom", "-f", action="store_true", dest="force_eeprom", default=False,
+                                 help="write the EEPROM even if the cached image hash matches")
+
         self.__parser.add_option("--gps", "-g", action="store_true", dest="ignore_gps", default=False,
                                  help="ignore GPS module")
 
@@ -44,6 +47,9 @@ class CmdDFETest(object):
         if self.dfe_serial_number is None:
             return False
 
+        if self.ignore_eeprom and self.force_eeprom:
+            return False
+
         return True
 
 
@@ -59,6 +65,11 @@ class CmdDFETest(object):
         return self.__opts.ignore_eeprom
 
 
+    @property
+    def force_eeprom(self):
+        return self.__opts.force_eeprom
+
+
     @property
     def ignore_gps(self):
         return self.__opts.ignore_gps
@@ -81,5 +92,7 @@ class CmdDFETest(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdDFETest:{dfe_serial_number:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, verbose:%s}" % \
-                    (self.dfe_serial_number, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc, self.verbose)
+        return "CmdDFETest:{dfe_serial_number:%s, ignore_eeprom:%s, force_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, " \
+               "verbose:%s}" % \
+                    (self.dfe_serial_number, self.ignore_eeprom, self.force_eeprom, self.ignore_gps, self.ignore_rtc,
+                     self.verbose)
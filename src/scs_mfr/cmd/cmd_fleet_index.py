@@ -0,0 +1,60 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+from scs_mfr.cmd.command_spec import CommandSpec, Exclusive, Option, Positional, SpecCmd
+from scs_mfr.estate.fleet_index import IndexFilter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdFleetIndex(SpecCmd):
+    """unix command line handler"""
+
+    SPEC = CommandSpec("%prog -f INDEX_FILE { -i [FILE_1 .. FILE_N] | -q [-c PATH] [FILTER_1 .. FILTER_N] } [-v]",
+
+                       # index...
+                       Option("--file", "-f", type="string", action="store", dest="index_file",
+                              help="the SQLite index file"),
+
+                       # operations...
+                       Option("--ingest", "-i", action="store_true", dest="ingest", default=False,
+                              help="index the configuration samples in the FILEs, or on stdin"),
+
+                       Option("--query", "-q", action="store_true", dest="query", default=False,
+                              help="report the devices that match all of the FILTERs"),
+
+                       # output...
+                       Option("--column", "-c", type="string", action="append", dest="columns", metavar="PATH",
+                              help="report the value of PATH for each device (may be repeated)"),
+
+                       Option.verbose(),
+
+                       exclusive=(Exclusive("ingest", "query"), ),
+                       positional=Positional("args"),
+                       validators=(lambda cmd: cmd.index_file is not None,
+                                   lambda cmd: cmd.ingest or cmd.query,
+                                   lambda cmd: cmd.query or not cmd.columns,
+                                   lambda cmd: not cmd.query or None not in cmd.filters))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def files(self):
+        return self._args if self.ingest else []
+
+
+    @property
+    def filters(self):
+        if not self.query:
+            return []
+
+        return [IndexFilter.construct_from_expression(arg) for arg in self._args]
+
+
+    @property
+    def paths(self):
+        return [] if self.columns is None else self.columns
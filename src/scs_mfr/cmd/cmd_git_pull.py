@@ -18,7 +18,7 @@ class CmdGitPull(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-p [-t TIMEOUT]] [-v]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-p [-t TIMEOUT] [-c]] [-v]", version=version())
 
         # pull...
         self.__parser.add_option("--pull", "-p", action="store_true", dest="pull", default=False,
@@ -27,6 +27,9 @@ class CmdGitPull(object):
         self.__parser.add_option("--timeout", "-t", type="int", action="store", dest="timeout", default=20,
                                  help="timeout for each pull (default 20 seconds)")
 
+        self.__parser.add_option("--compile", "-c", action="store_true", dest="compile", default=False,
+                                 help="compile the pulled repos to checked-hash byte-code")
+
         # narrative...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -37,6 +40,9 @@ class CmdGitPull(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.compile and not self.pull:
+            return False
+
         if self.__args:
             return False
 
@@ -55,6 +61,11 @@ class CmdGitPull(object):
         return self.__opts.timeout if self.pull else None
 
 
+    @property
+    def compile(self):
+        return self.__opts.compile
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -67,4 +78,5 @@ class CmdGitPull(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdGitPull:{pull:%s, timeout:%s, verbose:%s}" % (self.pull, self.timeout, self.verbose)
+        return "CmdGitPull:{pull:%s, timeout:%s, compile:%s, verbose:%s}" % \
+               (self.pull, self.timeout, self.compile, self.verbose)
@@ -14,11 +14,15 @@ from scs_mfr import version
 class CmdModem(object):
     """unix command line handler"""
 
+    DEFAULT_PERIOD = 6                              # samples
+    DEFAULT_WINDOW = 60                             # samples
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { -m | -c | -s } [-v]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog { -m | -c [-i INTERVAL [-p PERIOD] [-w WINDOW]] | -s } "
+                                                    "[{ -l | -t TTL }] [-v]", version=version())
 
         # modem...
         self.__parser.add_option("--model", "-m", action="store_true", dest="model", default=False,
@@ -30,6 +34,23 @@ class CmdModem(object):
         self.__parser.add_option("--sim", "-s", action="store_true", dest="sim", default=False,
                                  help="report on SIM")
 
+        # sampling...
+        self.__parser.add_option("--interval", "-i", type="float", action="store", dest="interval",
+                                 help="sample the connection every INTERVAL seconds")
+
+        self.__parser.add_option("--period", "-p", type="int", action="store", dest="period",
+                                 help="report every PERIOD samples (default 6)")
+
+        self.__parser.add_option("--window", "-w", type="int", action="store", dest="window",
+                                 help="report on the last WINDOW samples (default 60)")
+
+        # cache...
+        self.__parser.add_option("--live", "-l", action="store_true", dest="live", default=False,
+                                 help="query the modem, rather than the cached snapshot")
+
+        self.__parser.add_option("--ttl", "-t", type="float", action="store", dest="ttl",
+                                 help="maximum age of cached model and SIM reports (default 3600 seconds)")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -54,6 +75,21 @@ class CmdModem(object):
         if count != 1:
             return False
 
+        if self.interval is not None and (not self.connection or self.interval <= 0 or self.ttl is not None):
+            return False
+
+        if (self.__opts.period is not None or self.__opts.window is not None) and self.interval is None:
+            return False
+
+        if self.period < 1 or self.window < 1:
+            return False
+
+        if self.live and self.ttl is not None:
+            return False
+
+        if self.ttl is not None and self.ttl < 0:
+            return False
+
         if self.__args:
             return False
 
@@ -77,6 +113,31 @@ class CmdModem(object):
         return self.__opts.sim
 
 
+    @property
+    def interval(self):
+        return self.__opts.interval
+
+
+    @property
+    def period(self):
+        return self.DEFAULT_PERIOD if self.__opts.period is None else self.__opts.period
+
+
+    @property
+    def window(self):
+        return self.DEFAULT_WINDOW if self.__opts.window is None else self.__opts.window
+
+
+    @property
+    def live(self):
+        return self.__opts.live
+
+
+    @property
+    def ttl(self):
+        return self.__opts.ttl
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -89,5 +150,7 @@ class CmdModem(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdModem:{model:%s, connection:%s, sim:%s, verbose:%s}" % \
-               (self.model, self.connection, self.sim, self.verbose)
+        return "CmdModem:{model:%s, connection:%s, sim:%s, interval:%s, period:%s, window:%s, live:%s, ttl:%s, " \
+               "verbose:%s}" % \
+               (self.model, self.connection, self.sim, self.interval, self.period, self.window, self.live, self.ttl,
+                self.verbose)
@@ -4,79 +4,54 @@ Created on 13 Jul 2016
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import optparse
-
 from scs_dfe.particulate.opc_conf import OPCConf
-from scs_mfr import version
+
+from scs_mfr.cmd.command_spec import CommandSpec, Exclusive, Option, SpecCmd
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class CmdOPCConf(object):
+class CmdOPCConf(SpecCmd):
     """
     unix command line handler
     """
 
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def __init__(self):
-        self.__parser = optparse.OptionParser(usage="%prog [-n NAME] [{ [-m MODEL] [-s SAMPLE_PERIOD] [-z { 0 | 1 }] "
-                                                    "[-p { 0 | 1 }] [-c CUSTOM_DEV_PATH] | -d }] [-v]",
-                                              version=version())
+    SPEC = CommandSpec("%prog [-n NAME] [{ [-m MODEL] [-s SAMPLE_PERIOD] [-z { 0 | 1 }] [-p { 0 | 1 }] "
+                       "[-c CUSTOM_DEV_PATH] | -d }] [-v]",
 
-        # identity...
-        self.__parser.add_option("--name", "-n", type="string", action="store", dest="name",
-                                 help="the name of the OPC configuration")
+                       # identity...
+                       Option("--name", "-n", type="string", action="store", dest="name",
+                              help="the name of the OPC configuration"),
 
-        # fields...
-        self.__parser.add_option("--model", "-m", type="string", action="store", dest="model",
-                                 help="set MODEL { N2 | N3 | R1 | S30 }")
+                       # fields...
+                       Option("--model", "-m", type="string", action="store", dest="model",
+                              validator=OPCConf.is_valid_model,
+                              help="set MODEL { N2 | N3 | R1 | S30 }"),
 
-        self.__parser.add_option("--sample-period", "-s", type="int", action="store", dest="sample_period",
-                                 help="set SAMPLE_PERIOD")
+                       Option("--sample-period", "-s", type="int", action="store", dest="sample_period",
+                              help="set SAMPLE_PERIOD"),
 
-        self.__parser.add_option("--restart-on-zeroes", "-z", type="int", dest="restart_on_zeroes",
-                                 action="store", help="restart on zero readings (default 1)")
+                       Option("--restart-on-zeroes", "-z", type="int", action="store", dest="restart_on_zeroes",
+                              choices=(0, 1), help="restart on zero readings (default 1)"),
 
-        self.__parser.add_option("--power-saving", "-p", type="int", action="store", dest="power_saving",
-                                 help="enable power saving mode (default 0)")
+                       Option("--power-saving", "-p", type="int", action="store", dest="power_saving",
+                              choices=(0, 1), help="enable power saving mode (default 0)"),
 
-        self.__parser.add_option("--custom-dev-path", "-c", type="string", action="store", dest="custom_dev_path",
-                                 help="override default SPI path")
+                       Option("--custom-dev-path", "-c", type="string", action="store", dest="custom_dev_path",
+                              help="override default SPI path"),
 
-        self.__parser.add_option("--delete", "-d", action="store_true", dest="delete", default=False,
-                                 help="delete the OPC configuration")
+                       Option("--delete", "-d", action="store_true", dest="delete", default=False,
+                              help="delete the OPC configuration"),
 
-        # output...
-        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
-                                 help="report narrative to stderr")
+                       # output...
+                       Option.verbose(),
 
-        self.__opts, self.__args = self.__parser.parse_args()
+                       exclusive=(Exclusive(("model", "sample_period", "restart_on_zeroes", "power_saving",
+                                             "custom_dev_path"), "delete"), ))
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def is_valid(self):
-        if self.set() and self.delete:
-            return False
-
-        if self.model and not OPCConf.is_valid_model(self.model):
-            return False
-
-        if self.__opts.restart_on_zeroes is not None and \
-                not (self.__opts.restart_on_zeroes == 0 or self.__opts.restart_on_zeroes == 1):
-            return False
-
-        if self.__opts.power_saving is not None and \
-                not (self.__opts.power_saving == 0 or self.__opts.power_saving == 1):
-            return False
-
-        if self.__args:
-            return False
-
-        return True
-
-
     def is_complete(self):
         if self.model is None or self.sample_period is None:
             return False
@@ -92,54 +67,11 @@ class CmdOPCConf(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    @property
-    def name(self):
-        return self.__opts.name
-
-
-    @property
-    def model(self):
-        return self.__opts.model
-
-
-    @property
-    def sample_period(self):
-        return self.__opts.sample_period
-
-
     @property
     def restart_on_zeroes(self):
-        return None if self.__opts.restart_on_zeroes is None else bool(self.__opts.restart_on_zeroes)
+        return None if self._opts.restart_on_zeroes is None else bool(self._opts.restart_on_zeroes)
 
 
     @property
     def power_saving(self):
-        return None if self.__opts.power_saving is None else bool(self.__opts.power_saving)
-
-
-    @property
-    def custom_dev_path(self):
-        return self.__opts.custom_dev_path
-
-
-    @property
-    def delete(self):
-        return self.__opts.delete
-
-
-    @property
-    def verbose(self):
-        return self.__opts.verbose
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def print_help(self, file):
-        self.__parser.print_help(file)
-
-
-    def __str__(self, *args, **kwargs):
-        return "CmdOPCConf:{name:%s, model:%s, sample_period:%s, restart_on_zeroes:%s, power_saving:%s, " \
-               "custom_dev_path:%s, delete:%s, verbose:%s}" % \
-               (self.name, self.model, self.sample_period, self.restart_on_zeroes, self.power_saving,
-                self.custom_dev_path, self.delete, self.verbose)
+        return None if self._opts.power_saving is None else bool(self._opts.power_saving)
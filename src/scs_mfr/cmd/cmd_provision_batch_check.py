@@ -0,0 +1,80 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdProvisionBatchCheck(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-c CONCURRENCY] [-o] [-v] [MANIFEST_FILE]",
+                                              version=version())
+
+        # optional...
+        self.__parser.add_option("--concurrency", "-c", type="int", action="store", dest="concurrency",
+                                 help="maximum lookups in flight (default 8)")
+
+        self.__parser.add_option("--offline", "-o", action="store_true", dest="offline", default=False,
+                                 help="use cached calibration documents only")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if len(self.__args) > 1:
+            return False
+
+        if self.concurrency is not None and self.concurrency < 1:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def concurrency(self):
+        return self.__opts.concurrency
+
+
+    @property
+    def offline(self):
+        return self.__opts.offline
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def filename(self):
+        return self.__args[0] if self.__args else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdProvisionBatchCheck:{concurrency:%s, offline:%s, verbose:%s, filename:%s}" % \
+               (self.concurrency, self.offline, self.verbose, self.filename)
@@ -4,98 +4,67 @@ Created on 29 Jun 2017
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import optparse
-
-from scs_mfr import version
+from scs_mfr.cmd.command_spec import CommandSpec, Exclusive, Option, SpecCmd, Types
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class CmdSchedule(object):
+class CmdSchedule(SpecCmd):
     """unix command line handler"""
 
-    def __init__(self):
-        self.__parser = optparse.OptionParser(usage="%prog [{-s NAME INTERVAL TALLY | -r NAME }] [-v]",
-                                              version=version())
-
-        # operations...
-        self.__parser.add_option("--set", "-s", type="string", nargs=3, action="store", dest="set",
-                                 help="set schedule NAME, INTERVAL (seconds) and TALLY (count)")
-
-        self.__parser.add_option("--remove", "-r", type="string", action="store", dest="remove",
-                                 help="remove the named schedule")
-
-        # output...
-        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
-                                 help="report narrative to stderr")
+    SPEC = CommandSpec("%prog [{-s NAME INTERVAL TALLY | -r NAME | -a [-w WINDOW] }] [-v]",
 
-        self.__opts, self.__args = self.__parser.parse_args()
+                       # operations...
+                       Option("--set", "-s", type="string", nargs=3, action="store", dest="set",
+                              validator=Types(str, float, int),
+                              help="set schedule NAME, INTERVAL (seconds) and TALLY (count)"),
 
+                       Option("--remove", "-r", type="string", action="store", dest="remove",
+                              help="remove the named schedule"),
 
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def is_valid(self):
-        if self.set() and self.remove():
-            return False
+                       # analysis...
+                       Option("--analyse", "-a", action="store_true", dest="analyse", default=False,
+                              help="report the combined load of the schedule"),
 
-        if self.set():
-            try:
-                float(self.__opts.set[1])
-                int(self.__opts.set[2])
+                       Option("--window", "-w", type="float", action="store", dest="window",
+                              validator=lambda value: value is None or value > 0,
+                              help="count samplers that fire within WINDOW seconds as concurrent (default 1.0)"),
 
-            except ValueError:
-                return False
+                       # output...
+                       Option.verbose(),
 
-        if self.__args:
-            return False
-
-        return True
+                       exclusive=(Exclusive("set", "remove", "analyse"), ),
+                       validators=(lambda cmd: cmd.analyse or cmd.window is None, ))
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def set(self):
-        return self.__opts.set is not None
+        return self._opts.set is not None
 
 
     def remove(self):
-        return self.__opts.remove is not None
+        return self._opts.remove is not None
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
     def name(self):
-        if self.__opts.set is not None:
-            return self.__opts.set[0]
+        if self._opts.set is not None:
+            return self._opts.set[0]
 
-        if self.__opts.remove is not None:
-            return self.__opts.remove
+        if self._opts.remove is not None:
+            return self._opts.remove
 
         return None
 
 
     @property
     def interval(self):
-        return None if self.__opts.set is None else self.__opts.set[1]
+        return None if self._opts.set is None else self._opts.set[1]
 
 
     @property
     def count(self):
-        return None if self.__opts.set is None else self.__opts.set[2]
-
-
-    @property
-    def verbose(self):
-        return self.__opts.verbose
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def print_help(self, file):
-        self.__parser.print_help(file)
-
-
-    def __str__(self, *args, **kwargs):
-        return "CmdSchedule:{set:%s, remove:%s, verbose:%s}" % \
-                    (self.__opts.set, self.__opts.remove, self.verbose)
+        return None if self._opts.set is None else self._opts.set[2]
@@ -0,0 +1,134 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The registry of scs_mfr utilities. For each utility, the registry holds the location of its Cmd class, which is
+imported only when the utility's command line is required - a utility that has no options has no Cmd class.
+
+Where a Cmd class is generated from a CommandSpec, the spec is available without parsing the command line.
+"""
+
+import importlib
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CommandRegistry(object):
+    """
+    classdocs
+    """
+
+    __PACKAGE = 'scs_mfr'
+
+    __COMMANDS = OrderedDict((                  # utility name: cmd_module:CmdClass
+        ('afe_baseline',                'cmd_baseline:CmdBaseline'),
+        ('afe_calib',                   'cmd_afe_calib:CmdAFECalib'),
+        ('afe_calib_cache',             'cmd_afe_calib_cache:CmdAFECalibCache'),
+        ('airnow_site_conf',            'cmd_airnow_site_conf:CmdAirNowSiteConf'),
+        ('aws_client_auth',             'cmd_aws_client_auth:CmdAWSClientAuth'),
+        ('aws_deployment',              'cmd_aws_deployment:CmdAWSDeployment'),
+        ('aws_fleet_deployment',        'cmd_aws_fleet_deployment:CmdAWSFleetDeployment'),
+        ('aws_group_setup',             'cmd_aws_group_setup:CmdAWSGroupSetup'),
+        ('aws_group_snapshot',          'cmd_aws_group_snapshot:CmdAWSGroupSnapshot'),
+        ('aws_identity',                'cmd_aws_identity:CmdAWSIdentity'),
+        ('aws_identity_update',         'cmd_aws_identity_update:CmdAWSIdentityUpdate'),
+        ('aws_project',                 'cmd_aws_project:CmdAWSProject'),
+        ('baseline_history',            'cmd_baseline_history:CmdBaselineHistory'),
+        ('batch_query',                 'cmd_batch_query:CmdBatchQuery'),
+        ('cognito_batch_registration',  'cmd_cognito_batch_registration:CmdCognitoBatchRegistration'),
+        ('cognito_device_credentials',  'cmd_cognito_device_credentials:CmdCognitoDeviceCredentials'),
+        ('configuration',               'cmd_configuration:CmdConfiguration'),
+        ('csv_logger_conf',             'cmd_csv_logger_conf:CmdCSVLoggerConf'),
+        ('csv_reader',                  'cmd_csv_reader:CmdCSVReader'),
+        ('csv_writer',                  'cmd_csv_writer:CmdCSVWriter'),
+        ('dfe_id',                      None),
+        ('dfe_test',                    'cmd_dfe_test:CmdDFETest'),
+        ('display_conf',                'cmd_display_conf:CmdDisplayConf'),
+        ('eeprom_read',                 None),
+        ('eeprom_write',                'cmd_eeprom_write:CmdEEPROMWrite'),
+        ('fleet_index',                 'cmd_fleet_index:CmdFleetIndex'),
+        ('fuel_gauge_calib',            'cmd_fuel_gauge_calib:CmdFuelGaugeCalib'),
+        ('gas_baseline',                'cmd_baseline:CmdBaseline'),
+        ('gas_model_conf',              'cmd_model_conf:CmdModelConf'),
+        ('git_pull',                    'cmd_git_pull:CmdGitPull'),
+        ('gps_conf',                    'cmd_gps_conf:CmdGPSConf'),
+        ('host_id',                     None),
+        ('interface_conf',              'cmd_interface_conf:CmdInterfaceConf'),
+        ('modem',                       'cmd_modem:CmdModem'),
+        ('mpl115a2_calib',              'cmd_mpl115a2_calib:CmdMPL115A2Calib'),
+        ('mqtt_conf',                   'cmd_mqtt_conf:CmdMQTTConf'),
+        ('opc_cleaning_interval',       'cmd_opc_cleaning_interval:CmdOPCCleaningInterval'),
+        ('opc_conf',                    'cmd_opc_conf:CmdOPCConf'),
+        ('opc_error_log',               'cmd_opc_error_log:CmdOPCErrorLog'),
+        ('opc_firmware_conf',           'cmd_opc_firmware_conf:CmdOPCFirmwareConf'),
+        ('opc_version',                 'cmd_opc_version:CmdOPCVersion'),
+        ('pmx_model_conf',              'cmd_model_conf:CmdModelConf'),
+        ('pressure_conf',               'cmd_pressure_conf:CmdPressureConf'),
+        ('provision_batch_check',       'cmd_provision_batch_check:CmdProvisionBatchCheck'),
+        ('provision_new_root',          'cmd_provision_new_root:CmdProvisionNewRoot'),
+        ('provision_new_scs',           'cmd_provision_new_scs:CmdProvisionNewSCS'),
+        ('provision_service_scs',       'cmd_provision_service_scs:CmdProvisionServiceSCS'),
+        ('psu_conf',                    'cmd_psu_conf:CmdPSUConf'),
+        ('pt1000_calib',                'cmd_pt1000_calib:CmdPt1000Calib'),
+        ('rtc',                         'cmd_rtc:CmdRTC'),
+        ('scd30_baseline',              'cmd_scd30_baseline:CmdSCD30Baseline'),
+        ('scd30_conf',                  'cmd_scd30_conf:CmdSCD30Conf'),
+        ('schedule',                    'cmd_schedule:CmdSchedule'),
+        ('set_hostname',                'cmd_set_hostname:CmdSetHostname'),
+        ('shared_secret',               'cmd_shared_secret:CmdSharedSecret'),
+        ('sht_conf',                    'cmd_sht_conf:CmdSHTConf'),
+        ('system_id',                   'cmd_system_id:CmdSystemID'),
+        ('timezone',                    'cmd_timezone:CmdTimezone'),
+        ('vcal_baseline',               'cmd_vcal_baseline:CmdVCalBaseline'),
+    ))
+
+    __cmd_classes = {}                          # cache of utility name: Cmd class
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def names(cls):
+        return list(cls.__COMMANDS.keys())
+
+
+    @classmethod
+    def has(cls, name):
+        return name in cls.__COMMANDS
+
+
+    @classmethod
+    def module(cls, name):
+        if not cls.has(name):
+            raise KeyError(name)
+
+        return '.'.join((cls.__PACKAGE, name))
+
+
+    @classmethod
+    def cmd_class(cls, name):
+        if name in cls.__cmd_classes:
+            return cls.__cmd_classes[name]
+
+        location = cls.__COMMANDS[name]
+
+        if location is None:
+            cmd_class = None
+
+        else:
+            module_name, class_name = location.split(':')
+            module = importlib.import_module('.'.join((cls.__PACKAGE, 'cmd', module_name)))
+            cmd_class = getattr(module, class_name)
+
+        cls.__cmd_classes[name] = cmd_class
+
+        return cmd_class
+
+
+    @classmethod
+    def spec(cls, name):
+        cmd_class = cls.cmd_class(name)
+
+        return None if cmd_class is None else getattr(cmd_class, 'SPEC', None)
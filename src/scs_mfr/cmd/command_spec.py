@@ -0,0 +1,376 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A declarative specification of a command line - its options, mutually exclusive groups, positional arguments and
+validators - from which the optparse parser, validation, help and string representation of a Cmd are generated.
+
+A Cmd class declares its CommandSpec as the SPEC class attribute, and adds only those properties that interpret option
+values. Option values that need no interpretation are available as attributes named by their dest.
+
+example:
+class CmdSchedule(SpecCmd):
+    SPEC = CommandSpec("%prog [{-s NAME INTERVAL TALLY | -r NAME }] [-v]",
+                       Option("--set", "-s", type="string", nargs=3, dest="set", validator=Types(str, float, int)),
+                       Option("--remove", "-r", type="string", dest="remove"),
+                       Option.verbose(),
+                       exclusive=(Exclusive("set", "remove"), ))
+"""
+
+import optparse
+
+from scs_mfr import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Option(object):
+    """
+    an optparse option, with an optional validator
+    """
+
+    @classmethod
+    def verbose(cls):
+        return cls("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                   help="report narrative to stderr")
+
+
+    @classmethod
+    def indent(cls):
+        return cls("--indent", "-i", type="int", action="store", dest="indent",
+                   help="pretty-print the output with INDENT")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, *flags, choices=None, validator=None, **settings):
+        """
+        Constructor
+        """
+        self.__flags = flags                                # tuple of string
+        self.__choices = choices                            # tuple of permitted values
+        self.__validator = validator                        # callable(value) -> bool
+        self.__settings = settings                          # dict of optparse add_option keyword arguments
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add_to(self, parser):
+        parser.add_option(*self.__flags, **self.__settings)
+
+
+    def is_valid(self, value):
+        if value is None:
+            return True
+
+        if self.__choices is not None and value not in self.__choices:
+            return False
+
+        if self.__validator is not None:
+            try:
+                return bool(self.__validator(value))
+            except (TypeError, ValueError):
+                return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def flags(self):
+        return self.__flags
+
+
+    @property
+    def dest(self):
+        return self.__settings.get('dest')
+
+
+    @property
+    def takes_value(self):
+        return self.__settings.get('action', 'store') in ('store', 'append')
+
+
+    @property
+    def choices(self):
+        return self.__choices
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Option:{flags:%s, choices:%s, settings:%s}" % (self.flags, self.choices, self.__settings)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Types(object):
+    """
+    an Option validator - each value of a multi-valued option must be convertible to the corresponding type
+    """
+
+    def __init__(self, *types):
+        """
+        Constructor
+        """
+        self.__types = types                                # tuple of callable(string)
+
+
+    def __call__(self, values):
+        for convert, value in zip(self.__types, values):
+            convert(value)                                  # raises ValueError
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Types:{types:%s}" % [convert.__name__ for convert in self.__types]
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Exclusive(object):
+    """
+    a group of options, of which no more than one may be given - a member may be a dest, or a tuple of dests that
+    together count as one
+    """
+
+    def __init__(self, *members):
+        """
+        Constructor
+        """
+        self.__members = tuple(member if isinstance(member, tuple) else (member, ) for member in members)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self, opts):
+        given = [member for member in self.__members if any(CommandSpec.is_given(opts, dest) for dest in member)]
+
+        return len(given) < 2
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def members(self):
+        return self.__members
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Exclusive:{members:%s}" % (self.members, )
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Positional(object):
+    """
+    the positional arguments of a command
+    """
+
+    def __init__(self, name, minimum=0, maximum=None):
+        """
+        Constructor
+        """
+        self.__name = name                                  # string        attribute name on the Cmd
+        self.__minimum = minimum                            # int
+        self.__maximum = maximum                            # int or None   unbounded
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self, args):
+        if len(args) < self.minimum:
+            return False
+
+        return self.maximum is None or len(args) <= self.maximum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def minimum(self):
+        return self.__minimum
+
+
+    @property
+    def maximum(self):
+        return self.__maximum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Positional:{name:%s, minimum:%s, maximum:%s}" % (self.name, self.minimum, self.maximum)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CommandSpec(object):
+    """
+    classdocs
+    """
+
+    @staticmethod
+    def is_given(opts, dest):
+        value = getattr(opts, dest)
+
+        return value is not None and value is not False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, usage, *options, exclusive=(), positional=None, validators=()):
+        """
+        Constructor
+        """
+        self.__usage = usage                                # string
+        self.__options = options                            # tuple of Option
+        self.__exclusive = exclusive                        # tuple of Exclusive
+        self.__positional = positional                      # Positional or None    no positional arguments
+        self.__validators = validators                      # tuple of callable(cmd) -> bool
+
+        self.__parser = None                                # OptionParser          built on first use
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def parser(self):
+        if self.__parser is None:
+            parser = optparse.OptionParser(usage=self.usage, version=version())
+
+            for option in self.options:
+                option.add_to(parser)
+
+            self.__parser = parser
+
+        return self.__parser
+
+
+    def parse(self, args=None):
+        return self.parser().parse_args(args)
+
+
+    def is_valid(self, cmd, opts, args):
+        for option in self.options:
+            if option.dest is not None and not option.is_valid(getattr(opts, option.dest)):
+                return False
+
+        for exclusive in self.exclusive:
+            if not exclusive.is_valid(opts):
+                return False
+
+        if self.positional is None:
+            if args:
+                return False
+
+        elif not self.positional.is_valid(args):
+            return False
+
+        for validator in self.__validators:
+            if not validator(cmd):
+                return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def dests(self):
+        return [option.dest for option in self.options if option.dest is not None]
+
+
+    def flags(self):
+        return [flag for option in self.options for flag in option.flags]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def usage(self):
+        return self.__usage
+
+
+    @property
+    def options(self):
+        return self.__options
+
+
+    @property
+    def exclusive(self):
+        return self.__exclusive
+
+
+    @property
+    def positional(self):
+        return self.__positional
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CommandSpec:{usage:%s, options:%s, exclusive:%s, positional:%s}" % \
+               (self.usage, [str(option) for option in self.options], [str(group) for group in self.exclusive],
+                self.positional)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SpecCmd(object):
+    """
+    unix command line handler, generated from the SPEC class attribute
+    """
+
+    SPEC = None                                             # CommandSpec
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, args=None):
+        """
+        Constructor
+        """
+        self._opts, self._args = self.SPEC.parse(args)
+
+
+    def __getattr__(self, name):
+        spec = type(self).SPEC
+
+        if name in spec.dests():
+            return getattr(self._opts, name)
+
+        if spec.positional is not None and name == spec.positional.name:
+            return self._args
+
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        return self.SPEC.is_valid(self, self._opts, self._args)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.SPEC.parser().print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        fields = ["%s:%s" % (dest, getattr(self._opts, dest)) for dest in self.SPEC.dests()]
+
+        if self.SPEC.positional is not None:
+            fields.append("%s:%s" % (self.SPEC.positional.name, self._args))
+
+        return "%s:{%s}" % (type(self).__name__, ', '.join(fields))
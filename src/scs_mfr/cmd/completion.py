@@ -0,0 +1,96 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Generates a bash completion script for the scs-mfr entry point from the CommandRegistry. Subcommand names are always
+completed. Options are completed for utilities whose Cmd class is generated from a CommandSpec - for other utilities,
+and for arguments that are not options, file names are completed.
+
+usage:
+scs-mfr --completion > /etc/bash_completion.d/scs-mfr
+"""
+
+from scs_mfr.cmd.command_registry import CommandRegistry
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BashCompletion(object):
+    """
+    classdocs
+    """
+
+    __FUNCTION = '_scs_mfr'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, prog):
+        """
+        Constructor
+        """
+        self.__prog = prog                                  # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def script(self):
+        lines = [
+            '# bash completion for %s - generated by %s --completion' % (self.prog, self.prog),
+            '',
+            '%s() {' % self.__FUNCTION,
+            '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+            '',
+            '    if [ "$COMP_CWORD" -eq 1 ]; then',
+            '        COMPREPLY=( $(compgen -W "%s" -- "$cur") )' % ' '.join(CommandRegistry.names()),
+            '        return',
+            '    fi',
+            '',
+            '    if [[ "$cur" == -* ]]; then',
+            '        case "${COMP_WORDS[1]}" in'
+        ]
+
+        for name, flags in self.options().items():
+            lines.append('            %s) COMPREPLY=( $(compgen -W "%s" -- "$cur") ); return ;;' %
+                         (name, ' '.join(flags)))
+
+        lines.extend([
+            '        esac',
+            '    fi',
+            '',
+            '    COMPREPLY=( $(compgen -f -- "$cur") )',
+            '}',
+            '',
+            'complete -o filenames -F %s %s' % (self.__FUNCTION, self.prog)
+        ])
+
+        return '\n'.join(lines)
+
+
+    @staticmethod
+    def options():
+        options = {}
+
+        for name in CommandRegistry.names():
+            try:
+                spec = CommandRegistry.spec(name)
+            except ImportError:                             # eg. an optional subsystem is not installed
+                continue
+
+            if spec is not None:
+                options[name] = spec.flags() + ['--help', '--version']
+
+        return options
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def prog(self):
+        return self.__prog
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BashCompletion:{prog:%s}" % self.prog
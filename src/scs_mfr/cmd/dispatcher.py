@@ -0,0 +1,73 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The scs-mfr console entry point. The first argument names a utility in the CommandRegistry - only that utility's
+module is imported, and it is run exactly as if it had been invoked as a script, with the remaining arguments.
+
+usage:
+scs-mfr { SUBCOMMAND [ARGS] | --list | --completion | --version | --help }
+
+example:
+scs-mfr schedule -s scs-climate 10.0 1 -v
+"""
+
+import runpy
+import sys
+
+from scs_mfr import version
+from scs_mfr.cmd.command_registry import CommandRegistry
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+PROG = 'scs-mfr'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def usage(file):
+    print("usage: %s { SUBCOMMAND [ARGS] | --list | --completion | --version | --help }" % PROG, file=file)
+
+
+def main(args=None):
+    args = sys.argv[1:] if args is None else args
+
+    if not args:
+        usage(sys.stderr)
+        return 2
+
+    if args[0] in ('--help', '-h'):
+        usage(sys.stdout)
+        print("subcommands: %s" % ', '.join(CommandRegistry.names()))
+        return 0
+
+    if args[0] == '--version':
+        print(version())
+        return 0
+
+    if args[0] == '--list':
+        for name in CommandRegistry.names():
+            print(name)
+
+        return 0
+
+    if args[0] == '--completion':
+        from scs_mfr.cmd.completion import BashCompletion                               # late import
+
+        print(BashCompletion(PROG).script())
+        return 0
+
+    name = args[0][:-3] if args[0].endswith('.py') else args[0]
+    name = name.replace('-', '_')
+
+    if not CommandRegistry.has(name):
+        print("%s: unknown subcommand: %s" % (PROG, args[0]), file=sys.stderr)
+        usage(sys.stderr)
+        return 2
+
+    sys.argv = [name + '.py'] + list(args[1:])
+    runpy.run_module(CommandRegistry.module(name), run_name='__main__', alter_sys=True)
+
+    return 0
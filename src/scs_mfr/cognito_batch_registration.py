@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_mfr
+
+DESCRIPTION
+The cognito_batch_registration utility is used to assert a batch of devices in the Cognito devices pool, for example
+before a shipment is provisioned. It is intended to be run from a management host, rather than a device. For a single
+device, see cognito_device_credentials.py.
+
+The manifest is read from MANIFEST_FILE or - if none is given - from stdin, and may be written as CSV with a header
+row, or as JSON lines, with the fields username, password and invoice. Registrations are made concurrently, subject to
+a limit on the number in flight.
+
+Registration is idempotent: a device that is already known to Cognito is reported as Exists if it can be logged in
+with the given password, and has the given invoice number - otherwise it is reported as Mismatch. Transient HTTP
+errors, and connection errors, are retried with exponential backoff.
+
+A JSON result is written to stdout for each device, and a summary of throughput and failures is written to stderr. The
+utility exits with status 1 if any device is not registered. In --stand-in mode, a local stand-in for the Cognito APIs
+is used.
+
+SYNOPSIS
+cognito_batch_registration.py [-c CONCURRENCY] [-m MAX_ATTEMPTS] [-s [-f FAILURE_RATE]] [-v] [MANIFEST_FILE]
+
+EXAMPLES
+./cognito_batch_registration.py -v -c 16 shipment_2026_10.csv
+
+./cognito_batch_registration.py -v -s -f 0.2 < shipment_2026_10.jsonl
+
+MANIFEST EXAMPLE - CSV
+username,password,invoice
+scs-bbe-401,Rk3nN8wq2Zt7YpLx,INV-0000
+
+DOCUMENT EXAMPLE - OUTPUT
+{"username": "scs-bbe-401", "invoice": "INV-0000", "status": "Created", "attempts": 1, "elapsed": 0.412}
+
+SEE ALSO
+scs_mfr/cognito_device_credentials
+scs_mfr/provision_batch_check
+"""
+
+import sys
+
+from scs_core.aws.security.cognito_device_creator import CognitoDeviceCreator
+from scs_core.aws.security.cognito_device_finder import CognitoDeviceIntrospector
+from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_mfr.cmd.cmd_cognito_batch_registration import CmdCognitoBatchRegistration
+from scs_mfr.security.device_registrar import DeviceRegistrar
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    registrations = []
+    stand_in = None
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdCognitoBatchRegistration()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('cognito_batch_registration', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        try:
+            if cmd.filename is None:
+                identities = DeviceRegistrar.read_manifest(sys.stdin)
+
+            else:
+                with open(cmd.filename) as file:
+                    identities = DeviceRegistrar.read_manifest(file)
+
+        except (OSError, ValueError) as ex:
+            logger.error("the manifest could not be read: %s" % repr(ex))
+            exit(1)
+
+        if not identities:
+            logger.error("the manifest is empty.")
+            exit(2)
+
+        if cmd.stand_in:
+            from scs_mfr.security.cognito_stand_in import CognitoStandIn                # late import
+
+            stand_in = CognitoStandIn(failure_rate=cmd.failure_rate)
+            stand_in.start()
+            logger.info(stand_in)
+
+            client = stand_in.client()
+            registrar = DeviceRegistrar(client, client, client, concurrency=cmd.concurrency,
+                                        max_attempts=cmd.max_attempts)
+
+        else:
+            registrar = DeviceRegistrar(CognitoDeviceCreator(), CognitoLoginManager(), CognitoDeviceIntrospector(),
+                                        concurrency=cmd.concurrency, max_attempts=cmd.max_attempts)
+
+        logger.info(registrar)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        timer = Timer()
+
+        for registration in registrar.register(identities):
+            print(JSONify.dumps(registration))
+            sys.stdout.flush()
+
+            registrations.append(registration)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # end...
+
+        elapsed = timer.total()
+
+        statuses = [registration.status for registration in registrations]
+        failures = [registration.tag for registration in registrations if not registration.is_successful()]
+
+        logger.info("created: %s exists: %s failed: %s of %s in %s seconds (%0.1f devices per second)" %
+                    (statuses.count(DeviceRegistrar.CREATED), statuses.count(DeviceRegistrar.EXISTS), len(failures),
+                     len(registrations), elapsed, len(registrations) / elapsed if elapsed else 0.0))
+
+        if failures:
+            logger.error("not registered: %s" % ', '.join(failures))
+            exit(1)
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    finally:
+        if stand_in:
+            stand_in.stop()
@@ -13,7 +13,7 @@ of the Cognito identity for the device. The credentials are derived from the dev
 Additionally, an invoice number must be provided.
 
 In --assert and --test modes, the utility outputs the Cognito device record. Otherwise, the utility outputs the
-credentials.
+credentials. In --test mode, the device always logs in afresh - the new session is cached for use by the AWS utilities.
 
 SYNOPSIS
 cognito_device_credentials.py [{ -a INVOICE | -t }] [-v]
@@ -28,7 +28,11 @@ DOCUMENT EXAMPLE - DEVICE
 {"username": "scs-be2-3", "invoice": "INV-TEST008", "created": "2023-04-25T10:05:55Z",
 "last-updated": "2023-06-26T13:32:33Z"}
 
+FILES
+~/SCS/aws/device_session.json
+
 SEE ALSO
+scs_mfr/cognito_batch_registration
 scs_mfr/shared_secret
 scs_mfr/system_id
 """
@@ -38,7 +42,6 @@ import sys
 from scs_core.aws.security.cognito_device import CognitoDeviceCredentials, CognitoDeviceIdentity
 from scs_core.aws.security.cognito_device_creator import CognitoDeviceCreator
 from scs_core.aws.security.cognito_device_finder import CognitoDeviceIntrospector
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPException, HTTPConflictException
 
@@ -49,6 +52,7 @@ from scs_core.sys.logging import Logging
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_cognito_device_credentials import CmdCognitoDeviceCredentials
+from scs_mfr.security.device_session import DeviceSession, DeviceSessionException
 
 
 # TODO: also add to OrganisationDevices?
@@ -94,17 +98,15 @@ if __name__ == '__main__':
             report = creator.create(identity)
 
         elif cmd.test:
-            gatekeeper = CognitoLoginManager()
-            auth = gatekeeper.device_login(credentials)
-
-            if auth.is_ok():
-                finder = CognitoDeviceIntrospector()
-                report = finder.find_self(auth.id_token)
-
-            else:
-                logger.error(auth.authentication_status.description)
+            try:
+                session = DeviceSession.authenticate(Host, credentials, refresh=True)
+            except DeviceSessionException as ex:
+                logger.error(ex)
                 exit(1)
 
+            finder = CognitoDeviceIntrospector()
+            report = finder.find_self(session.id_token)
+
         else:
             report = credentials
 
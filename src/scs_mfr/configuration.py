@@ -11,16 +11,36 @@ It is intended to be used as one component of a centralised estate management sy
 
 The utility can be used to update a setting on the device. To do this, a JSON document containing at least one field
 of the configuration document must be supplied on the command line. Any fields that are not named will not be updated.
+The named fields are written together - if any of them cannot be set, none is written.
+
+Alternatively, the --desired-state flag may be used to supply a full configuration document, or configuration sample,
+in a file. Each section of the document is compared with the current configuration, and only the sections that differ
+are written. Read-only sections - such as hostname, packs, modem and SIM - are never written, and sections that are
+absent or null are left unchanged. In this mode, a report of the changed and skipped sections is written to stdout,
+in place of the configuration, so the --table flag may not be used.
+
+The --fleet-table flag is used to tabulate configuration samples collected from many devices. Configuration samples
+are read from stdin, one JSON document per line, and a single comma-separated table is written to stdout, with one
+row per sample and one column per configuration field. The columns are the union of the fields of every sample, so
+that the table has a consistent column set. Rows are held in a temporary file, rather than in memory, until the
+header is known. In this mode, the device's own configuration is not read.
 
 Note that the hostname field cannot be updated by the configuration utility. If this field is included in the
 update JSON specification, it is silently ignored.
 
+The modem and SIM reports are served from the cached snapshot maintained by the modem utility, and are refreshed in
+the background while the rest of the configuration is gathered. The --live flag forces a query of the modem.
+
 SYNOPSIS
-configuration.py [-s CONFIGURATION] [-x] [{ -i INDENT | -t }] [-v]
+configuration.py { -f | [{ -s CONFIGURATION | -d DESIRED_STATE_FILE }] [-x] [-l] [{ -i INDENT | -t }] } [-v]
 
 EXAMPLES
 ./configuration.py -i4 -s '{"timezone-conf": {"name": "Europe/London"}}'
 
+./configuration.py -v -d desired_configuration.json
+
+cat configuration_samples.jsonl | ./configuration.py -f > estate_configuration.csv
+
 DOCUMENT EXAMPLE
 {
     "rec": "2024-04-04T09:28:16Z",
@@ -225,10 +245,14 @@ DOCUMENT EXAMPLE
     }
 }
 
+FILES
+~/SCS/conf/modem_snapshot.json
+
 SEE ALSO
 scs_mfr/modem
 """
 
+import json
 import sys
 
 from scs_core.data.datetime import LocalizedDatetime
@@ -236,6 +260,8 @@ from scs_core.data.json import JSONify
 
 from scs_core.estate.configuration import Configuration
 
+from scs_core.interface.interface_conf import InterfaceConf
+
 from scs_core.psu.psu_version import PSUVersion
 
 from scs_core.sample.configuration_sample import ConfigurationSample
@@ -243,17 +269,14 @@ from scs_core.sample.configuration_sample import ConfigurationSample
 from scs_core.sys.logging import Logging
 from scs_core.sys.system_id import SystemID
 
-from scs_dfe.interface.interface_conf import InterfaceConf
-
 from scs_host.lock.lock_timeout import LockTimeout
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_configuration import CmdConfiguration
-
-try:
-    from scs_psu.psu.psu_conf import PSUConf
-except ImportError:
-    from scs_core.psu.psu_conf import PSUConf
+from scs_mfr.estate.configuration_table import ConfigurationTable
+from scs_mfr.estate.desired_state import DesiredState
+from scs_mfr.sys.conf_transaction import ConfTransaction
+from scs_mfr.sys.modem_cache import ModemCache, ModemCachingManager, ModemSnapshot
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -278,6 +301,36 @@ if __name__ == '__main__':
     logger.info(cmd)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # fleet table...
+
+    if cmd.fleet_table:
+        try:
+            with ConfigurationTable() as table:
+                for line in sys.stdin:
+                    if not line.strip():
+                        continue
+
+                    try:
+                        sample = ConfigurationSample.construct_from_jdict(json.loads(line))
+                    except (AttributeError, ValueError):
+                        sample = None
+
+                    if sample is None:
+                        logger.error("invalid configuration sample: %s" % line.strip())
+                        continue
+
+                    table.add(sample)
+
+                logger.info(table)
+                table.write(sys.stdout)
+
+        except KeyboardInterrupt:
+            print(file=sys.stderr)
+
+        exit(0)
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
@@ -290,11 +343,29 @@ if __name__ == '__main__':
 
     logger.info(system_id)
 
+    # modem...
+    modem_cache = ModemCache(Host, live=cmd.live)
+    logger.info(modem_cache)
+
+    if cmd.exclude_sim:
+        modem_cache.refresh(ModemSnapshot.MODEM)
+    else:
+        modem_cache.refresh(ModemSnapshot.MODEM, ModemSnapshot.SIM)
+
     # PSU...
     interface_conf = InterfaceConf.load(Host)
     interface_model = None if interface_conf is None else interface_conf.model
 
-    psu_conf = None if interface_model is None else PSUConf.load(Host)
+    psu_conf = None
+
+    if interface_model is not None:
+        try:
+            from scs_psu.psu.psu_conf import PSUConf                                    # late import
+        except ImportError:
+            from scs_core.psu.psu_conf import PSUConf
+
+        psu_conf = PSUConf.load(Host)
+
     psu = None if psu_conf is None else psu_conf.psu(Host, interface_model)
 
 
@@ -319,12 +390,44 @@ if __name__ == '__main__':
                 exit(2)
 
             try:
-                conf.save(Host)
+                with ConfTransaction(Host) as transaction:
+                    conf.save(transaction)
+
             except ValueError as ex:
                 logger.error(repr(ex))
                 exit(1)
 
-        configuration = Configuration.load(Host, psu_version=psu_version, exclude_sim=cmd.exclude_sim)
+        configuration = Configuration.load(ModemCachingManager(Host, modem_cache), psu_version=psu_version,
+                                           exclude_sim=cmd.exclude_sim)
+
+        if cmd.desired_state is not None:
+            try:
+                with open(cmd.desired_state) as file:
+                    desired_state = DesiredState.construct_from_jdict(json.load(file))
+
+            except (OSError, ValueError) as ex:
+                logger.error("the desired state could not be read: %s" % repr(ex))
+                exit(1)
+
+            if desired_state is None:
+                logger.error('invalid desired state: %s' % cmd.desired_state)
+                exit(2)
+
+            report = desired_state.compare(configuration)
+            logger.info(report)
+
+            if report.has_changes():
+                try:
+                    with ConfTransaction(Host) as transaction:
+                        desired_state.update(report).save(transaction)
+
+                except ValueError as ex:
+                    logger.error(repr(ex))
+                    exit(1)
+
+            print(JSONify.dumps(report, indent=cmd.indent))
+            exit(0)
+
         sample = ConfigurationSample(system_id.message_tag(), LocalizedDatetime.now().utc(), configuration)
 
         if cmd.table:
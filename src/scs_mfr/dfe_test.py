@@ -13,8 +13,11 @@ The output of the test is a JSON document, summarising the result of each of a s
 
 Ideally, a standard resistor load should be attached to the AFE connector of the DFE before the test is run.
 
+The hash of the last verified EEPROM image is recorded for each DFE serial number. If the board already holds that
+image, the EEPROM is read back and compared by hash instead of being rewritten. The --force-eeprom flag overrides this.
+
 SYNOPSIS
-dfe_test.py [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER
+dfe_test.py [{ -e | -f }] [-g] [-r] [-v] DFE_SERIAL_NUMBER
 
 EXAMPLES
 ./dfe_test.py -g -r -v 123
@@ -28,6 +31,9 @@ DOCUMENT EXAMPLE - OUTPUT
 "SO2": {"weV": 0.267942, "aeV": 0.275942, "weC": -0.009696, "cnc": -26.4},
 "H2S": {"weV": 0.296192, "aeV": 0.285754, "weC": 0.026254, "cnc": 19.4},
 "VOC": {"weV": 0.102627, "weC": 0.102037, "cnc": 1300.9}}}}}
+
+FILES
+~/SCS/conf/eeprom_image_cache.json
 """
 
 import sys
@@ -227,7 +233,8 @@ if __name__ == '__main__':
 
     else:
         try:
-            test = EEPROMTest(interface, cmd.verbose)
+            test = EEPROMTest(interface, cmd.verbose, dfe_serial_number=cmd.dfe_serial_number,
+                              force=cmd.force_eeprom)
 
             test_ok = test.conduct()
             reporter.report_test("EEPROM", test_ok)
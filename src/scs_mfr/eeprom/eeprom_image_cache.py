@@ -0,0 +1,130 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A record of the content hash of the last verified EEPROM image, for each DFE serial number.
+
+example JSON:
+{"123": {"hash": "6e340b9cffb37a989ca544e6bb780a2c78901d3fb33738768511a30617afa01d",
+"verified-on": "2026-10-19T10:12:31Z"}}
+"""
+
+import hashlib
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import PersistentJSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMImageCache(PersistentJSONable):
+    """
+    classdocs
+    """
+
+    __FILENAME = "eeprom_image_cache.json"
+
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), cls.__FILENAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def image_hash(image):
+        return hashlib.sha256(bytes(image.content)).hexdigest()
+
+
+    @staticmethod
+    def __key(serial_number):
+        return str(serial_number).strip()                   # the serial number may be given as an int or a string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return cls({}) if skeleton else None
+
+        entries = OrderedDict()
+
+        for serial_number, entry in jdict.items():
+            verified_on = LocalizedDatetime.construct_from_iso8601(entry.get('verified-on'))
+            entries[cls.__key(serial_number)] = (entry.get('hash'), verified_on)
+
+        return cls(entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, entries):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__entries = entries                    # dict of serial_number: (hash, LocalizedDatetime)
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def matches(self, serial_number, image):
+        image_hash = self.hash(serial_number)
+
+        return image_hash is not None and image_hash == self.image_hash(image)
+
+
+    def record(self, serial_number, image):
+        self.__entries[self.__key(serial_number)] = (self.image_hash(image), LocalizedDatetime.now().utc())
+
+
+    def discard(self, serial_number):
+        try:
+            del self.__entries[self.__key(serial_number)]
+        except KeyError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        for serial_number, (image_hash, verified_on) in self.__entries.items():
+            entry = OrderedDict()
+
+            entry['hash'] = image_hash
+            entry['verified-on'] = None if verified_on is None else verified_on.as_iso8601()
+
+            jdict[serial_number] = entry
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def hash(self, serial_number):
+        entry = self.__entries.get(self.__key(serial_number))
+
+        return None if entry is None else entry[0]
+
+
+    def verified_on(self, serial_number):
+        entry = self.__entries.get(self.__key(serial_number))
+
+        return None if entry is None else entry[1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMImageCache:{entries:%s}" % len(self)
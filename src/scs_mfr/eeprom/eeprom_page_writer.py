@@ -0,0 +1,131 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A differential writer for the CAT24C32 EEPROM: the current image is read once, only the pages that differ from the
+target image are written, and only those pages are read back for verification.
+
+Warning: the write-protect jumper must be fitted to update the EEPROM.
+
+https://www.onsemi.com/pub/Collateral/CAT24C32-D.PDF
+"""
+
+import time
+
+from scs_core.sys.eeprom_image import EEPROMImage
+from scs_core.sys.timer import Timer
+
+from scs_dfe.interface.component.cat24c32 import CAT24C32
+
+from scs_host.bus.i2c import I2C
+
+from scs_mfr.eeprom.eeprom_write_report import EEPROMWriteReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMPageWriter(object):
+    """
+    page-aligned differential writer for the CAT24C32
+    """
+
+    PAGE_SIZE =         32          # bytes - the CAT24C32 page write buffer
+
+    __TWR =             0.005       # seconds - write cycle time
+    __ADDR =            0x50
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def changed_pages(cls, current, target):
+        if len(current) != len(target):
+            raise ValueError("EEPROMPageWriter.changed_pages: images have differing lengths.")
+
+        pages = []
+
+        for addr in range(0, len(target), cls.PAGE_SIZE):
+            if current.content[addr: addr + cls.PAGE_SIZE] != target.content[addr: addr + cls.PAGE_SIZE]:
+                pages.append(addr)
+
+        return pages
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __read(cls, memory_addr, count):
+        try:
+            I2C.EEPROM.start_tx(cls.__ADDR)
+
+            return list(I2C.EEPROM.read_cmd16(memory_addr, count))
+
+        finally:
+            I2C.EEPROM.end_tx()
+
+
+    @classmethod
+    def __write(cls, memory_addr, values):
+        try:
+            I2C.EEPROM.start_tx(cls.__ADDR)
+
+            I2C.EEPROM.write_addr16(memory_addr, *values)
+            time.sleep(cls.__TWR)
+
+        finally:
+            I2C.EEPROM.end_tx()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__image = EEPROMImage(self.__read(0, CAT24C32.SIZE))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, image):
+        if len(image) != CAT24C32.SIZE:
+            raise ValueError("EEPROMPageWriter.write: image has incorrect length.")
+
+        timer = Timer()
+
+        pages = self.changed_pages(self.__image, image)
+        failed = []
+
+        content = list(self.__image.content)
+
+        for addr in pages:
+            values = image.content[addr: addr + self.PAGE_SIZE]
+
+            # write...
+            self.__write(addr, values)
+
+            # verify...
+            written = self.__read(addr, self.PAGE_SIZE)
+            content[addr: addr + self.PAGE_SIZE] = written
+
+            if written != list(values):
+                failed.append(addr)
+
+        self.__image = EEPROMImage(content)
+
+        total_pages = len(image) // self.PAGE_SIZE
+
+        return EEPROMWriteReport(pages, total_pages - len(pages), failed, timer.total())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def image(self):
+        return self.__image
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMPageWriter:{page_size:%s, image_len:%s}" % (self.PAGE_SIZE, len(self.image))
@@ -0,0 +1,86 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+example JSON:
+{"verified": true, "written": 3, "skipped": 125, "failed": [], "pages": ["0x0000", "0x0020", "0x0fe0"],
+"elapsed": 0.412}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMWriteReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pages, skipped, failed, elapsed):
+        """
+        Constructor
+        """
+        self.__pages = pages                                # list of int       page start addresses
+        self.__skipped = int(skipped)                       # int               pages
+        self.__failed = failed                              # list of int       page start addresses
+        self.__elapsed = elapsed                            # float             seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['verified'] = self.verified
+        jdict['written'] = self.written
+        jdict['skipped'] = self.skipped
+        jdict['failed'] = ["0x%04x" % addr for addr in self.failed]
+        jdict['pages'] = ["0x%04x" % addr for addr in self.pages]
+        jdict['elapsed'] = self.elapsed
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def verified(self):
+        return len(self.failed) == 0
+
+
+    @property
+    def written(self):
+        return len(self.pages)
+
+
+    @property
+    def pages(self):
+        return self.__pages
+
+
+    @property
+    def skipped(self):
+        return self.__skipped
+
+
+    @property
+    def failed(self):
+        return self.__failed
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMWriteReport:{pages:%s, skipped:%s, failed:%s, elapsed:%s}" % \
+               (self.pages, self.skipped, self.failed, self.elapsed)
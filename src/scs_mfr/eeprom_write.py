@@ -14,12 +14,20 @@ the Raspberry Pi HAT or BeagleBone cape standards.
 
 A jumper link must be fitted to the DFE board in order to enable the write operation.
 
+The EEPROM is written differentially: its current contents are read once, only the 32-byte pages that differ from the
+file image are written, and only those pages are read back for verification. A report of pages written and skipped,
+together with the elapsed time, is written to stdout.
+
 SYNOPSIS
 eeprom_write.py [-v] FILENAME
 
 EXAMPLES
 ./eeprom_write.py ~/SCS/hat.eep
 
+DOCUMENT EXAMPLE - OUTPUT
+{"verified": true, "written": 3, "skipped": 125, "failed": [], "pages": ["0x0000", "0x0020", "0x0fe0"],
+"elapsed": 0.412}
+
 SEE ALSO
 scs_mfr/dfe_id
 scs_mfr/eeprom_read
@@ -46,6 +54,7 @@ from os import path
 
 import sys
 
+from scs_core.data.json import JSONify
 from scs_core.sys.eeprom_image import EEPROMImage
 
 from scs_dfe.interface.component.cat24c32 import CAT24C32
@@ -53,6 +62,7 @@ from scs_dfe.interface.component.cat24c32 import CAT24C32
 from scs_host.bus.i2c import I2C
 
 from scs_mfr.cmd.cmd_eeprom_write import CmdEEPROMWrite
+from scs_mfr.eeprom.eeprom_page_writer import EEPROMPageWriter
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -75,14 +85,12 @@ if __name__ == '__main__':
 
         if cmd.verbose:
             print(cmd, file=sys.stderr)
-            print("-")
+            print("-", file=sys.stderr)
 
 
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        eeprom = CAT24C32()
-
         if not cmd.is_valid():
             cmd.print_help(sys.stderr)
             exit(2)
@@ -91,10 +99,7 @@ if __name__ == '__main__':
             print("eeprom_write: file not found", file=sys.stderr)
             exit(1)
 
-        if cmd.verbose:
-            print("current eeprom image:")
-            eeprom.image.formatted(32)
-            print("-")
+        writer = EEPROMPageWriter()
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -104,27 +109,21 @@ if __name__ == '__main__':
         file_image = EEPROMImage.construct_from_file(cmd.filename, CAT24C32.SIZE)
 
         if cmd.verbose:
-            print("file image:")
-            file_image.formatted(32)
-            print("-")
-
-        # write...
-        eeprom.write(file_image)
+            pages = EEPROMPageWriter.changed_pages(writer.image, file_image)
+            print("changed pages: %s" % ', '.join("0x%04x" % addr for addr in pages), file=sys.stderr)
+            print("-", file=sys.stderr)
 
-        if cmd.verbose:
-            print("eeprom:")
-            eeprom.image.formatted(32)
-            print("-")
+        # write and verify...
+        report = writer.write(file_image)
 
-        # verify...
-        verified = eeprom.image == file_image
+        print(JSONify.dumps(report))
 
-        if not verified:
+        if not report.verified:
             print("eeprom_write: verification failed", file=sys.stderr)
             exit(1)
 
         if cmd.verbose:
-            print("verified:%s" % verified)
+            print("verified:%s" % report.verified, file=sys.stderr)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,254 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Answers a batch of document queries in a single response, so that a remote management system can obtain a device
+health snapshot in one control round trip and one interpreter start, rather than one of each per utility.
+
+The queries share their context: the Host, the SystemID, and a single ModemCache, whose stale reports are refreshed
+in the background while the other documents are read. The modules needed by each document are imported only if that
+document is requested. A document that cannot be read is reported as null, with the reason given in the errors field -
+one failed query does not lose the rest of the snapshot.
+
+Documents are read-only: reports that are maintained by other utilities, such as opc-version and git-pull, are served
+as last saved.
+
+example JSON:
+{"tag": "scs-be2-3", "rec": "2026-10-19T09:01:12Z", "documents": {"host-id": "0000000040d4d158",
+"opc-version": {"serial": "177336702", "firmware": "OPC-N3 Iss1.1 FirmwareVer=1.17a...BS"},
+"git-pull": {"pulled-on": "2026-10-18T08:37:09Z", "success": true, "installed": ["scs_core", "scs_mfr"],
+"pulled": ["scs_core", "scs_mfr"], "excluded": []}, "dfe-id": null}, "errors": {"dfe-id": "OSError(121)"}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchQuery(object):
+    """
+    classdocs
+    """
+
+    CONFIGURATION = 'configuration'
+    SYSTEM_ID = 'system-id'
+    HOST_ID = 'host-id'
+    DFE_ID = 'dfe-id'
+    MODEM = 'modem'
+    MODEM_CONN = 'modem-conn'
+    SIM = 'sim'
+    OPC_VERSION = 'opc-version'
+    GIT_PULL = 'git-pull'
+
+    DOCUMENTS = (CONFIGURATION, SYSTEM_ID, HOST_ID, DFE_ID, MODEM, MODEM_CONN, SIM, OPC_VERSION, GIT_PULL)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager, system_id, modem_cache):
+        """
+        Constructor
+        """
+        self.__manager = manager                            # Host
+        self.__system_id = system_id                        # SystemID or None
+        self.__modem_cache = modem_cache                    # ModemCache
+
+        self.__queries = {self.CONFIGURATION: self.__configuration,
+                          self.SYSTEM_ID: self.__system,
+                          self.HOST_ID: self.__host_id,
+                          self.DFE_ID: self.__dfe_id,
+                          self.MODEM: modem_cache.modem,
+                          self.MODEM_CONN: modem_cache.modem_conn,
+                          self.SIM: modem_cache.sim,
+                          self.OPC_VERSION: self.__opc_version,
+                          self.GIT_PULL: self.__git_pull}
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, *names):
+        from scs_mfr.sys.modem_cache import ModemSnapshot                               # late import
+
+        names = names if names else self.DOCUMENTS
+
+        modem_sections = {self.CONFIGURATION: (ModemSnapshot.MODEM, ModemSnapshot.SIM),
+                          self.MODEM: (ModemSnapshot.MODEM, ), self.MODEM_CONN: (ModemSnapshot.CONNECTION, ),
+                          self.SIM: (ModemSnapshot.SIM, )}
+
+        # start the modem queries, so that they run while the other documents are read...
+        refresh = [section for name in names for section in modem_sections.get(name, ())]
+
+        if refresh:
+            self.__modem_cache.refresh(*OrderedDict.fromkeys(refresh))
+
+        documents = OrderedDict()
+        errors = OrderedDict()
+
+        for name in names:
+            try:
+                documents[name] = self.__queries[name]()
+
+            except Exception as ex:                         # one document must not lose the snapshot
+                self.__logger.error("%s: %s" % (name, repr(ex)))
+                documents[name] = None
+                errors[name] = repr(ex)
+
+        tag = None if self.__system_id is None else self.__system_id.message_tag()
+
+        return BatchResponse(tag, LocalizedDatetime.now().utc(), documents, errors)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __configuration(self):
+        from scs_core.estate.configuration import Configuration                         # late import
+        from scs_mfr.sys.modem_cache import ModemCachingManager
+
+        return Configuration.load(ModemCachingManager(self.__manager, self.__modem_cache),
+                                  psu_version=self.__psu_version())
+
+
+    def __system(self):
+        return self.__system_id
+
+
+    def __host_id(self):
+        return self.__manager.serial_number()
+
+
+    @staticmethod
+    def __dfe_id():
+        from scs_dfe.interface.interface_id import InterfaceID                          # late import
+
+        return InterfaceID()
+
+
+    def __opc_version(self):
+        from scs_core.particulate.opc_version import OPCVersion                         # late import
+
+        return OPCVersion.load(self.__manager)
+
+
+    def __git_pull(self):
+        from scs_core.estate.git_pull import GitPull                                    # late import
+
+        return GitPull.load(self.__manager)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __psu_version(self):
+        from scs_core.interface.interface_conf import InterfaceConf                     # late import
+        from scs_core.psu.psu_version import PSUVersion
+
+        interface_conf = InterfaceConf.load(self.__manager)
+
+        if interface_conf is None or interface_conf.model is None:
+            return None
+
+        try:
+            from scs_psu.psu.psu_conf import PSUConf                                    # late import
+        except ImportError:
+            from scs_core.psu.psu_conf import PSUConf
+
+        from scs_host.lock.lock_timeout import LockTimeout                              # late import
+
+        psu_conf = PSUConf.load(self.__manager)
+        psu = None if psu_conf is None else psu_conf.psu(self.__manager, interface_conf.model)
+
+        if psu is None:
+            return None
+
+        try:
+            psu.open()
+            return psu.version()
+
+        except LockTimeout:
+            return PSUVersion.load(self.__manager)          # a report will be present if psu_monitor is running
+
+        except OSError:
+            return None                                     # PSU fault
+
+        finally:
+            psu.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchQuery:{manager:%s, system_id:%s, modem_cache:%s}" % \
+               (self.__manager, self.__system_id, self.__modem_cache)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchResponse(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, rec, documents, errors):
+        """
+        Constructor
+        """
+        self.__tag = tag                                    # string or None
+        self.__rec = rec                                    # LocalizedDatetime
+        self.__documents = documents                        # OrderedDict of name: JSONable or None
+        self.__errors = errors                              # OrderedDict of name: string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has_errors(self):
+        return bool(self.errors)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tag'] = self.tag
+        jdict['rec'] = self.rec.as_iso8601()
+        jdict['documents'] = self.documents
+        jdict['errors'] = self.errors
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def documents(self):
+        return self.__documents
+
+
+    @property
+    def errors(self):
+        return self.__errors
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchResponse:{tag:%s, rec:%s, documents:%s, errors:%s}" % \
+               (self.tag, self.rec, list(self.documents), self.errors)
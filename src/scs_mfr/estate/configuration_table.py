@@ -0,0 +1,120 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A wide table of ConfigurationSamples - one row per sample, one column per configuration field - for estate-wide
+configuration reports. Column names are the sample's paths, with the val. prefix removed, as ConfigurationSample
+as_table(). Hidden values, such as the shared secret, are masked.
+
+The column set is the union of the fields of every sample, in the order in which they are first seen. So that memory
+use is bounded by the number of columns rather than the number of samples, each flattened sample is spooled to a
+temporary file as it is added, and the rows are read back when the table is written. Where a section is null in one
+sample but populated in another, the column for the null section is dropped in favour of the populated fields.
+
+example CSV:
+tag,rec,ver,hostname,schedule.scs-climate.interval,schedule.scs-climate.tally,...
+scs-be2-3,2026-10-19T09:01:12Z,1.0,scs-bbe-003,60.0,1,...
+"""
+
+import csv
+import json
+import tempfile
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationTable(object):
+    """
+    classdocs
+    """
+
+    HIDDEN_PATHS = ('val.aws-api-auth.api-key', 'val.shared-secret.key')
+    HIDDEN_VALUE = '######'
+
+    __VAL_PREFIX = 'val.'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def column(cls, path):
+        return path[len(cls.__VAL_PREFIX):] if path.startswith(cls.__VAL_PREFIX) else path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__columns = OrderedDict()                      # OrderedDict of column: None     insertion-ordered set
+        self.__spool = tempfile.TemporaryFile(mode='w+')    # one JSON row per sample
+        self.__length = 0                                   # int
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+    def __len__(self):
+        return self.__length
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, sample):
+        path_dict = PathDict.construct_from_jstr(JSONify.dumps(sample))
+        row = OrderedDict()
+
+        for path in path_dict.paths():
+            column = self.column(path)
+            row[column] = self.HIDDEN_VALUE if path in self.HIDDEN_PATHS else path_dict.node(path)
+
+            self.__columns[column] = None
+
+        self.__spool.write(json.dumps(row, separators=(',', ':')) + '\n')
+        self.__length += 1
+
+
+    def write(self, file):
+        columns = self.columns()
+        writer = csv.writer(file)
+
+        writer.writerow(columns)
+
+        self.__spool.seek(0)
+
+        for line in self.__spool:
+            row = json.loads(line)
+            writer.writerow([row.get(column) for column in columns])
+
+
+    def close(self):
+        self.__spool.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def columns(self):
+        columns = list(self.__columns)
+        parents = set()
+
+        for column in columns:                              # a column for a null section, populated elsewhere
+            parents.update(column[:i] for i, char in enumerate(column) if char in '.:')
+
+        return [column for column in columns if column not in parents]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationTable:{length:%s, columns:%s}" % (len(self), len(self.__columns))
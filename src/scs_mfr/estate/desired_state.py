@@ -0,0 +1,177 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Applies a desired-state configuration document to a device, writing only those sections that differ from the current
+configuration. The desired state may be a Configuration document, or a ConfigurationSample, whose val field is used.
+
+Sections are compared in their canonical JSON form, after construction by their Configuration classes, so differences
+in formatting or field order do not count as changes. Sections that are absent, or null, in the desired state are not
+changed - a desired state cannot delete a document. Read-only sections, such as the hostname and the modem report,
+are never written: they are reported as skipped if they differ.
+
+example JSON:
+{"changed": ["schedule", "timezone-conf"], "skipped": ["packs"], "unchanged": 9}
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable, JSONify
+
+from scs_core.estate.configuration import Configuration
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DesiredState(object):
+    """
+    classdocs
+    """
+
+    READ_ONLY = ('hostname', 'platform', 'packs', 'afe-id', 'data-log', 'opc-version', 'opc-errors', 'psu-version',
+                 'modem', 'sim')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict or not isinstance(jdict, dict):
+            return None
+
+        if 'val' in jdict and 'rec' in jdict:                   # ConfigurationSample
+            jdict = jdict.get('val')
+
+            if not isinstance(jdict, dict):
+                return None
+
+        try:
+            configuration = Configuration.construct_from_jdict(jdict)
+        except (AttributeError, TypeError):                     # a section that is not of the expected form
+            return None
+
+        return None if configuration is None else cls(configuration)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __sections(configuration):
+        sections = configuration.as_json().items()
+
+        return OrderedDict((name, JSONify.dumps(section, sort_keys=True)) for name, section in sections
+                           if section is not None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, configuration):
+        """
+        Constructor
+        """
+        self.__configuration = configuration                    # Configuration
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def compare(self, current):
+        desired_sections = self.__sections(self.configuration)
+        current_sections = self.__sections(current)
+
+        changed = []
+        skipped = []
+        unchanged = 0
+
+        for name, section in desired_sections.items():
+            if section == current_sections.get(name):
+                unchanged += 1
+                continue
+
+            if name in self.READ_ONLY:
+                skipped.append(name)
+            else:
+                changed.append(name)
+
+        return DesiredStateReport(changed, skipped, unchanged)
+
+
+    def update(self, report):
+        jdict = self.configuration.as_json()
+        changes = OrderedDict((name, jdict[name]) for name in report.changed)
+
+        return Configuration.construct_from_jdict(json.loads(JSONify.dumps(changes)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def configuration(self):
+        return self.__configuration
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DesiredState:{configuration:%s}" % self.configuration
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DesiredStateReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, changed, skipped, unchanged):
+        """
+        Constructor
+        """
+        self.__changed = changed                                # list of string section names
+        self.__skipped = skipped                                # list of string section names
+        self.__unchanged = unchanged                            # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has_changes(self):
+        return bool(self.changed)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['changed'] = self.changed
+        jdict['skipped'] = self.skipped
+        jdict['unchanged'] = self.unchanged
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def changed(self):
+        return self.__changed
+
+
+    @property
+    def skipped(self):
+        return self.__skipped
+
+
+    @property
+    def unchanged(self):
+        return self.__unchanged
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DesiredStateReport:{changed:%s, skipped:%s, unchanged:%s}" % \
+               (self.changed, self.skipped, self.unchanged)
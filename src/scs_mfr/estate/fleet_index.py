@@ -0,0 +1,329 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A local SQLite index of the latest ConfigurationSample from each device, for answering fleet configuration queries
+without loading every document.
+
+Each sample is flattened to the dotted-path scheme of the CSV utilities, with the val. prefix removed - for example,
+opc-conf.model or schedule.scs-climate.interval. Each field is held as a typed row: its JSON value, its text, its
+numeric value (if any), and a version key (for dotted version strings, such as 2.2.5). Hidden values, such as the
+shared secret, are not indexed.
+
+Ingest is incremental: a sample replaces the indexed sample for its tag only if its rec is later.
+
+A filter has the form PATH OP VALUE, where OP is one of = != < <= > >=. If VALUE is numeric, or a dotted version
+string, fields are compared numerically - or, for string fields that are dotted version strings, component by
+component, so that 2.10 is greater than 2.9, and 2.9.0 is equal to 2.9. Otherwise, fields are compared as text. A
+device matches if all of the filters match.
+
+example filters:
+opc-conf.model=N3 psu-version.tag<2.3
+"""
+
+import json
+import re
+import sqlite3
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable, JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_core.sys.logging import Logging
+
+from scs_mfr.estate.configuration_table import ConfigurationTable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FleetIndex(object):
+    """
+    classdocs
+    """
+
+    __SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS sample (tag TEXT PRIMARY KEY, rec TEXT NOT NULL, ver REAL)",
+        "CREATE TABLE IF NOT EXISTS setting (tag TEXT NOT NULL, path TEXT NOT NULL, value TEXT, text TEXT, "
+        "num REAL, version TEXT)",
+        "CREATE INDEX IF NOT EXISTS setting_tag ON setting (tag, path)",
+        "CREATE INDEX IF NOT EXISTS setting_text ON setting (path, text)",
+        "CREATE INDEX IF NOT EXISTS setting_num ON setting (path, num)",
+        "CREATE INDEX IF NOT EXISTS setting_version ON setting (path, version)"
+    )
+
+    __TAG_PATHS = ('tag', 'rec', 'ver')
+
+    __CACHE_SIZE = 65536                                    # KiB       holds the indices during a batch ingest
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename):
+        """
+        Constructor
+        """
+        self.__filename = filename                          # string
+
+        self.__connection = None                            # sqlite3.Connection
+        self.__logger = Logging.getLogger()
+
+
+    def __enter__(self):
+        self.open()
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__connection is not None:
+            return
+
+        self.__connection = sqlite3.connect(self.filename)
+        self.__connection.execute("PRAGMA cache_size = -%d" % self.__CACHE_SIZE)
+
+        with self.__connection:
+            for statement in self.__SCHEMA:
+                self.__connection.execute(statement)
+
+
+    def close(self):
+        if self.__connection is None:
+            return
+
+        self.__connection.close()
+        self.__connection = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def ingest(self, samples):
+        report = IngestReport()
+
+        with self.__connection:                             # one transaction for the batch
+            for sample in samples:
+                if sample is None or sample.tag is None or sample.rec is None:
+                    report.invalid += 1
+                    continue
+
+                rec = sample.rec.utc().as_iso8601()
+                row = self.__connection.execute("SELECT rec FROM sample WHERE tag = ?", (sample.tag, )).fetchone()
+
+                if row is not None and row[0] >= rec:
+                    report.skipped += 1
+                    continue
+
+                self.__connection.execute("DELETE FROM setting WHERE tag = ?", (sample.tag, ))
+                self.__connection.execute("INSERT OR REPLACE INTO sample VALUES (?, ?, ?)",
+                                          (sample.tag, rec, sample.version))
+                self.__connection.executemany("INSERT INTO setting VALUES (?, ?, ?, ?, ?, ?)",
+                                              self.__settings(sample))
+
+                report.ingested += 1
+
+        self.__logger.info(report)
+
+        return report
+
+
+    def query(self, filters, paths=()):
+        clauses = []
+        params = []
+
+        for index_filter in filters:
+            clause, clause_params = index_filter.clause()
+
+            clauses.append("tag IN (SELECT tag FROM setting WHERE path = ? AND %s)" % clause)
+            params.extend([index_filter.path] + clause_params)
+
+        statement = "SELECT tag, rec FROM sample"
+
+        if clauses:
+            statement += " WHERE " + " AND ".join(clauses)
+
+        statement += " ORDER BY tag"
+
+        for tag, rec in self.__connection.execute(statement, params).fetchall():
+            match = OrderedDict((('tag', tag), ('rec', rec)))
+
+            for path in paths:
+                row = self.__connection.execute("SELECT value FROM setting WHERE tag = ? AND path = ?",
+                                                (tag, path)).fetchone()
+                match[path] = None if row is None else json.loads(row[0])
+
+            yield match
+
+
+    def count(self):
+        return self.__connection.execute("SELECT COUNT(*) FROM sample").fetchone()[0]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __settings(cls, sample):
+        path_dict = PathDict.construct_from_jstr(JSONify.dumps(sample))
+
+        for path in path_dict.paths():
+            if path in cls.__TAG_PATHS or path in ConfigurationTable.HIDDEN_PATHS:
+                continue
+
+            value = path_dict.node(path)
+            text = value if isinstance(value, str) else json.dumps(value)
+
+            yield sample.tag, ConfigurationTable.column(path), json.dumps(value), text, \
+                IndexFilter.numeric(value), IndexFilter.version_key(value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FleetIndex:{filename:%s, open:%s}" % (self.filename, self.__connection is not None)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class IndexFilter(object):
+    """
+    classdocs
+    """
+
+    OPERATORS = ('<=', '>=', '!=', '=', '<', '>')
+
+    __PATTERN = re.compile(r'^([^<>=!]+)(<=|>=|!=|=|<|>)(.*)$')
+    __VERSION = re.compile(r'^\d+(\.\d+)+$')
+    __VERSION_WIDTH = 6
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_expression(cls, expression):
+        match = cls.__PATTERN.match(expression.strip())
+
+        if match is None:
+            return None
+
+        path, operator, value = match.groups()
+
+        return cls(path.strip(), operator, value.strip())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def numeric(value):
+        if isinstance(value, bool) or value is None:
+            return None
+
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
+    @classmethod
+    def version_key(cls, value):
+        if not isinstance(value, str) or not cls.__VERSION.match(value):
+            return None
+
+        components = [int(component) for component in value.split('.')]
+
+        while len(components) > 1 and components[-1] == 0:  # 2.9.0 is 2.9
+            components.pop()
+
+        return '.'.join(str(component).zfill(cls.__VERSION_WIDTH) for component in components)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, operator, value):
+        """
+        Constructor
+        """
+        self.__path = path                                  # string
+        self.__operator = operator                          # string
+        self.__value = value                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def clause(self):
+        num = self.numeric(self.value)
+        version = self.version_key(self.value)
+
+        if num is None and version is None:
+            return "text %s ?" % self.operator, [self.value]
+
+        if num is None:
+            return "version %s ?" % self.operator, [version]
+
+        if version is None:
+            return "num %s ?" % self.operator, [num]
+
+        return "((num IS NOT NULL AND num %s ?) OR (num IS NULL AND version %s ?))" % \
+               (self.operator, self.operator), [num, version]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def operator(self):
+        return self.__operator
+
+
+    @property
+    def value(self):
+        return self.__value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "IndexFilter:{path:%s, operator:%s, value:%s}" % (self.path, self.operator, self.value)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class IngestReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ingested=0, skipped=0, invalid=0):
+        """
+        Constructor
+        """
+        self.ingested = ingested                            # int       samples added or replaced
+        self.skipped = skipped                              # int       samples no later than the indexed sample
+        self.invalid = invalid                              # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        return OrderedDict((('ingested', self.ingested), ('skipped', self.skipped), ('invalid', self.invalid)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "IngestReport:{ingested:%s, skipped:%s, invalid:%s}" % (self.ingested, self.skipped, self.invalid)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The fleet_index utility maintains a local SQLite index of the configuration samples collected from a fleet of devices,
+and answers queries on the index - such as "which devices have an N3 OPC and a PSU firmware tag earlier than 2.3" -
+without loading every document.
+
+In --ingest mode, configuration samples are read from the named files, or from stdin if no file is named. A file may
+hold a single JSON document, or one document per line. Ingest is incremental: a sample replaces the indexed sample
+for its device tag only if its rec is later. A report of the number of samples ingested, skipped and invalid is
+written to stdout.
+
+In --query mode, the tag and rec of each device that matches all of the FILTERs are written to stdout, one JSON
+document per line, together with the value of any PATH named with the --column flag. If no FILTER is given, every
+indexed device is reported.
+
+Fields are named by their dotted paths, as in the CSV utilities, without the val. prefix. A filter has the form
+PATH OP VALUE, where OP is one of = != < <= > >=. If VALUE is numeric, or a dotted version string, fields are compared
+numerically, or component by component for dotted version strings, so that 2.10 is greater than 2.9. Otherwise,
+fields are compared as text. Filters should be quoted, to protect the operators from the shell.
+
+SYNOPSIS
+fleet_index.py -f INDEX_FILE { -i [FILE_1 .. FILE_N] | -q [-c PATH] [FILTER_1 .. FILTER_N] } [-v]
+
+EXAMPLES
+./fleet_index.py -f fleet.db -i configurations/*.json
+
+./fleet_index.py -f fleet.db -q -c psu-version.tag 'opc-conf.model=N3' 'psu-version.tag<2.3'
+
+DOCUMENT EXAMPLE - INGEST
+{"ingested": 412, "skipped": 1877, "invalid": 2}
+
+DOCUMENT EXAMPLE - QUERY
+{"tag": "scs-be2-3", "rec": "2026-10-19T09:01:12Z", "psu-version.tag": "2.2.5"}
+
+SEE ALSO
+scs_mfr/configuration
+scs_mfr/csv_writer
+"""
+
+import json
+import sqlite3
+import sys
+
+from scs_core.data.json import JSONify
+
+from scs_core.sample.configuration_sample import ConfigurationSample
+
+from scs_core.sys.logging import Logging
+
+from scs_mfr.cmd.cmd_fleet_index import CmdFleetIndex
+from scs_mfr.estate.fleet_index import FleetIndex
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def samples(files):
+    for file in files:
+        text = file.read()
+
+        try:
+            documents = [json.loads(text)]                  # a single document
+        except ValueError:
+            documents = [line for line in text.splitlines() if line.strip()]
+
+        for document in documents:
+            try:
+                jdict = json.loads(document) if isinstance(document, str) else document
+                yield ConfigurationSample.construct_from_jdict(jdict)
+
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+                logger.error("invalid configuration sample: %s" % file.name)
+                yield None
+
+
+def open_files(filenames):
+    if not filenames:
+        yield sys.stdin
+        return
+
+    for filename in filenames:
+        try:
+            with open(filename) as file:
+                yield file
+
+        except OSError as ex:
+            logger.error(repr(ex))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdFleetIndex()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('fleet_index', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        with FleetIndex(cmd.index_file) as index:
+            logger.info(index)
+
+            if cmd.ingest:
+                report = index.ingest(samples(open_files(cmd.files)))
+                print(JSONify.dumps(report))
+
+            if cmd.query:
+                for match in index.query(cmd.filters, paths=cmd.paths):
+                    print(JSONify.dumps(match))
+
+    except sqlite3.Error as ex:
+        logger.error("index not available: %s" % repr(ex))
+        exit(1)
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
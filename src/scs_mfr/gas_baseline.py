@@ -17,29 +17,53 @@ an ozone sensor is identified as Ox.
 
 Note that the scs_dev/gasses_sampler and greengrass processes must be restarted for changes to take effect.
 
+Every change of offset is also appended to the device's baseline history - see scs_mfr/baseline_history.
+
 WARNING:
 
+In --batch mode, corrections are read as JSON lines from FILENAME, or stdin if FILENAME is '-'. Each correction has
+the form {"gas": GAS, "correct": CORRECT, "reported": REPORTED, "sample": SAMPLE}, where the sample is optional.
+All corrections are applied in a single load / save cycle - if any line is invalid, nothing is written. The utility
+then reports the resulting baseline, together with a before / after summary for each gas.
+
+In --fit mode, offsets are estimated from a co-location campaign. DEVICE_FILE holds the device's gas samples, and
+REFERENCE_FILE the reference analyser's readings, as CSV or JSON lines. Rows are aligned on rec, to ALIGN seconds, and
+the offset change for each gas is the median of the differences (reference - device) - device values are found at
+val.GAS.cnc, reference values at GAS. If TEMP_WIDTH and / or HUMID_WIDTH are given, the offset change is the median of
+the medians for each temperature / humidity bin. The fit statistics are included in the report. --fit requires NumPy,
+which is installed with the scs_mfr[fit] extra.
+
 SYNOPSIS
 gas_baseline.py [{ -b GAS  | { { -s | -o } GAS VALUE | -c GAS CORRECT REPORTED }
-[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -z | -d }] [-i INDENT] [-v]
+[-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] | -f FILENAME |
+-e DEVICE_FILE REFERENCE_FILE [-g GAS] [-a ALIGN] [-n TEMP_WIDTH HUMID_WIDTH] | -z | -d }] [-i INDENT] [-v]
 
 EXAMPLES
 ./baseline.py -c NO2 10 23
 
+./gas_baseline.py -f corrections.jsonl
+
+DOCUMENT EXAMPLE - BATCH CORRECTION
+{"gas": "NO2", "correct": 10, "reported": 23, "sample": {"rec": "2022-03-16T07:45:00Z", "hmd": 51.6, "tmp": 21.8}}
+
 DOCUMENT EXAMPLE
 {"CO": {"calibrated-on": "2021-01-19T10:07:27Z", "offset": 2},
 "NO2": {"calibrated-on": "2021-01-19T10:07:27Z", "offset": 1}}
 
 FILES
-~/SCS/conf/baseline.json
+~/SCS/conf/gas_baseline.json
+~/SCS/conf/baseline_history/gas_*.bhr
 
 SEE ALSO
 scs_dev/gases_sampler
+scs_mfr/baseline_history
 scs_mfr/afe_calib
 """
 
 import sys
 
+from scs_core.csv.csv_reader import CSVReaderException
+
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
 
@@ -51,6 +75,8 @@ from scs_core.sys.logging import Logging
 
 from scs_host.sys.host import Host
 
+from scs_mfr.baseline.baseline_correction import BaselineCorrection, BaselineCorrectionReport
+from scs_mfr.baseline.baseline_history import BaselineHistory
 from scs_mfr.cmd.cmd_baseline import CmdBaseline
 
 
@@ -60,6 +86,7 @@ if __name__ == '__main__':
 
     sht = None
     barometer = None
+    report = None
 
     now = LocalizedDatetime.now().utc()
 
@@ -87,6 +114,7 @@ if __name__ == '__main__':
         # resources...
 
         baseline = GasBaseline.load(Host, skeleton=True)
+        history = BaselineHistory(Host, 'gas')
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -112,8 +140,80 @@ if __name__ == '__main__':
             baseline.set_sensor_baseline(cmd.gas_name(), SensorBaseline(now, new_offset, sample=sample))
             baseline.save(Host)
 
+            history.append(cmd.gas_name(), old_offset, baseline.sensor_baseline(cmd.gas_name()))
+
             logger.info("%s: was: %s now: %s" % (cmd.gas_name(), old_offset, new_offset))
 
+        # batch...
+        if cmd.batch:
+            try:
+                if cmd.batch == '-':
+                    corrections = BaselineCorrection.construct_from_lines(sys.stdin)
+                else:
+                    with open(cmd.batch) as f:
+                        corrections = BaselineCorrection.construct_from_lines(f)
+
+            except OSError as ex:
+                logger.error(repr(ex))
+                exit(1)
+
+            except ValueError as ex:
+                logger.error("invalid correction: %s" % ex)
+                exit(2)
+
+            changes = [(correction.gas, correction.gas, correction.delta(), correction.sample, None)
+                       for correction in corrections]
+
+            report = BaselineCorrectionReport.apply(baseline, changes, history, Host, now)
+
+        # fit...
+        if cmd.fit:
+            gases = cmd.fit_gases if cmd.fit_gases else sorted(baseline.gases)
+
+            if not gases:
+                logger.error("no gases to fit.")
+                exit(1)
+
+            try:
+                from scs_mfr.baseline.baseline_fit import BaselineFitter              # late import
+            except ImportError as ex:
+                logger.error("--fit requires NumPy - install scs_mfr[fit]: %s" % repr(ex))
+                exit(1)
+
+            fitter = BaselineFitter(gases, alignment=cmd.align, temp_bin=cmd.temp_bin, humid_bin=cmd.humid_bin)
+
+            try:
+                with open(cmd.device_filename) as f:
+                    fitter.load_device(f)
+
+                with open(cmd.reference_filename) as f:
+                    fitter.load_reference(f)
+
+            except OSError as ex:
+                logger.error(repr(ex))
+                exit(1)
+
+            except (CSVReaderException, ValueError) as ex:
+                logger.error("invalid data: %s" % ex)
+                exit(1)
+
+            logger.info(fitter)
+
+            changes = []
+
+            for gas_name in gases:
+                fit = fitter.fit(gas_name)
+
+                if fit is None:
+                    logger.error("%s: no aligned device and reference data." % gas_name)
+                    exit(1)
+
+                logger.info(fit)
+
+                changes.append((gas_name, gas_name, fit.delta, fit.sample, fit))
+
+            report = BaselineCorrectionReport.apply(baseline, changes, history, Host, now)
+
         # baseline...
         if cmd.baseline:
             gas_name = cmd.gas_name()
@@ -127,18 +227,26 @@ if __name__ == '__main__':
 
         # zero...
         if cmd.zero:
-            for gas in baseline.gases():
+            old_offsets = baseline.offsets()
+
+            for gas in baseline.gases:
                 baseline.set_sensor_baseline(gas, SensorBaseline(now, 0))
 
             baseline.save(Host)
 
+            for gas in sorted(old_offsets.keys()):
+                history.append(gas, old_offsets[gas], baseline.sensor_baseline(gas))
+
         # delete...
         if cmd.delete:
             GasBaseline.delete(Host)
             baseline = None
 
         # report...
-        if baseline:
+        if report:
+            print(JSONify.dumps(report, indent=cmd.indent))
+
+        elif baseline:
             print(JSONify.dumps(baseline, indent=cmd.indent))
 
 
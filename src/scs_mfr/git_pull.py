@@ -10,17 +10,24 @@ The git_pull utility is used to perform a git pull on all the repos in the ~/SCS
 are complete, a JSON document is saved, summarising the state of the installed repos. When run without the --pull flag
 the git_pull utility  reports on the most recent operation.
 
+If the --compile flag is set, each repo that was pulled successfully is then compiled to byte-code, with checked-hash
+.pyc files. This saves the first run of each utility from compiling its modules on the SD card, and from failing to
+cache byte-code where the user running the utility cannot write to __pycache__ directories. A compile failure does not
+change the "success" field of the report, but the utility exits with a non-zero status.
+
 Note that the utility skips private repos (such as scs_exegesis).
 
 Warning: the overall operation is not atomic - if one or more repo pulls fail, the resulting set will lose consistency.
 The "success" field  report indicates whether the outcome is consistent.
 
 SYNOPSIS
-git_pull.py [-p [-t TIMEOUT]] [-v]
+git_pull.py [-p [-t TIMEOUT] [-c]] [-v]
 
 EXAMPLES
 ./git_pull.py -vp
 
+./git_pull.py -vpc
+
 DOCUMENT EXAMPLE
 {"pulled-on": "2021-02-27T08:37:09Z", "success": true,
 "installed": ["scs_core", "scs_dev", "scs_dfe_eng", "scs_host_cpc", "scs_mfr", "scs_psu"],
@@ -53,6 +60,7 @@ if __name__ == '__main__':
     pulled = []
     excluded = []
     success = True
+    compiled = True
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
@@ -120,6 +128,17 @@ if __name__ == '__main__':
             git = GitPull(start, success, installed, pulled, excluded)
             git.save(Host)
 
+            if cmd.compile:
+                from scs_mfr.sys.bytecode_compiler import BytecodeCompiler                   # late import
+
+                compiler = BytecodeCompiler()
+                logger.info(compiler)
+
+                for repo in pulled:
+                    if not compiler.compile(os.path.join(root, repo)):
+                        logger.error("%s: compile failed" % repo)
+                        compiled = False
+
         else:
             git = GitPull.load(Host)
 
@@ -133,4 +152,4 @@ if __name__ == '__main__':
         print(file=sys.stderr)
 
     finally:
-        exit(0 if success else 1)
+        exit(0 if success and compiled else 1)
@@ -0,0 +1,94 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Drives an AWSGroupConfigurator so that the resource, function and subscription definitions - which depend only on the
+collected group information, and not on each other - are created concurrently. The group version is created when all
+three are complete. The time taken by each step is logged, and returned by run().
+
+If any definition fails, its exception is raised once the others are complete, and no group version is created.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConcurrentConfigurator(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, configurator, host):
+        """
+        Constructor
+        """
+        self.__configurator = configurator                  # AWSGroupConfigurator
+        self.__host = host                                  # Host
+
+        self.__timings = OrderedDict()                      # dict of step: float seconds
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self):
+        configurator = self.__configurator
+        timer = Timer()
+
+        self.__timings.clear()
+
+        # group information...
+        self.__step('collect_information', configurator.collect_information, self.__host)
+
+        # independent definitions...
+        definitions = (('define_aws_group_resources', configurator.define_aws_group_resources, (self.__host, )),
+                       ('define_aws_group_functions', configurator.define_aws_group_functions, ()),
+                       ('define_aws_group_subscriptions', configurator.define_aws_group_subscriptions, ()))
+
+        with ThreadPoolExecutor(max_workers=len(definitions)) as executor:
+            futures = [executor.submit(self.__step, name, method, *args) for name, method, args in definitions]
+
+        for future in futures:
+            future.result()                                 # raises the exception of a failed definition
+
+        # group version...
+        self.__step('create_aws_group_definition', configurator.create_aws_group_definition)
+
+        self.__timings['total'] = timer.total()
+        self.__logger.info("total: %0.3f seconds" % self.__timings['total'])
+
+        return self.timings
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __step(self, name, method, *args):
+        timer = Timer()
+
+        try:
+            method(*args)
+
+        finally:
+            self.__timings[name] = timer.total()
+            self.__logger.info("%s: %0.3f seconds" % (name, self.__timings[name]))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def timings(self):
+        return self.__timings
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConcurrentConfigurator:{configurator:%s, timings:%s}" % (self.__configurator, self.timings)
@@ -0,0 +1,221 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Tracks the status of a Greengrass group deployment, reporting a progress record for each status transition. The
+elapsed time is measured from the construction of the tracker, which should follow the deployment request. The
+interval is the time since the previous transition.
+
+example JSON:
+{"group": "scs-bbe-401-group", "deployment": "cb645f98-7737", "status": "Success", "was": "InProgress",
+"elapsed": 14.2, "interval": 9.8, "polls": 6}
+"""
+
+from collections import OrderedDict
+
+from scs_core.aws.greengrass.v1.aws_deployer import AWSGroupDeployer
+
+from scs_core.data.json import JSONable
+
+from scs_core.sys.timer import Timer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeploymentTracker(object):
+    """
+    classdocs
+    """
+
+    TIMEOUT = "Timeout"
+
+    __TERMINAL = (AWSGroupDeployer.SUCCESS, AWSGroupDeployer.FAILURE)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_name, group_id, deployment_id):
+        """
+        Constructor
+        """
+        self.__group_name = group_name                      # string
+        self.__group_id = group_id                          # string
+        self.__deployment_id = deployment_id                # string
+
+        self.__status = None                                # string
+        self.__error = None                                 # string
+        self.__polls = 0                                    # int
+        self.__timer = Timer()                              # Timer
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def poll(self, client):
+        response = client.get_deployment_status(DeploymentId=self.deployment_id, GroupId=self.group_id)
+        self.__polls += 1
+
+        return self.update(response.get('DeploymentStatus'), error=response.get('ErrorMessage'))
+
+
+    def update(self, status, error=None):
+        if status == self.__status:
+            return None
+
+        progress = DeploymentProgress(self.group_name, self.deployment_id, status, self.__status,
+                                      self.__timer.total(), self.__timer.checkpoint(), self.polls, error=error)
+
+        self.__status = status
+        self.__error = error
+
+        return progress
+
+
+    def timeout(self):
+        return self.update(self.TIMEOUT)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_complete(self):
+        return self.status in self.__TERMINAL or self.status == self.TIMEOUT
+
+
+    def is_successful(self):
+        return self.status == AWSGroupDeployer.SUCCESS
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def group_name(self):
+        return self.__group_name
+
+
+    @property
+    def group_id(self):
+        return self.__group_id
+
+
+    @property
+    def deployment_id(self):
+        return self.__deployment_id
+
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    @property
+    def polls(self):
+        return self.__polls
+
+
+    @property
+    def elapsed(self):
+        return self.__timer.total()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeploymentTracker:{group_name:%s, group_id:%s, deployment_id:%s, status:%s, error:%s, polls:%s}" % \
+               (self.group_name, self.group_id, self.deployment_id, self.status, self.error, self.polls)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeploymentProgress(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_name, deployment_id, status, was, elapsed, interval, polls, error=None):
+        """
+        Constructor
+        """
+        self.__group_name = group_name                      # string
+        self.__deployment_id = deployment_id                # string
+        self.__status = status                              # string
+        self.__was = was                                    # string or None
+        self.__elapsed = elapsed                            # float seconds
+        self.__interval = interval                          # float seconds
+        self.__polls = int(polls)                           # int
+        self.__error = error                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['group'] = self.group_name
+        jdict['deployment'] = self.deployment_id
+        jdict['status'] = self.status
+        jdict['was'] = self.was
+        jdict['elapsed'] = round(self.elapsed, 1)
+        jdict['interval'] = round(self.interval, 1)
+        jdict['polls'] = self.polls
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def group_name(self):
+        return self.__group_name
+
+
+    @property
+    def deployment_id(self):
+        return self.__deployment_id
+
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    @property
+    def was(self):
+        return self.__was
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def polls(self):
+        return self.__polls
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeploymentProgress:{group_name:%s, deployment_id:%s, status:%s, was:%s, elapsed:%s, interval:%s, " \
+               "polls:%s, error:%s}" % \
+               (self.group_name, self.deployment_id, self.status, self.was, self.elapsed, self.interval,
+                self.polls, self.error)
@@ -0,0 +1,321 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Deploys the latest version of each of a list of Greengrass groups. The group IDs are found with a single paged listing
+of the account's groups. Deployments are requested by a bounded pool of threads, and all in-flight deployments are then
+tracked by a single polling loop. Every API call - request or poll - is subject to a shared rate limit, and throttled
+calls are retried with backoff. A deployment that cannot be requested or polled - because of an API error or a
+connection failure - is reported as failed, and the other deployments continue.
+
+The submitted time is measured from the start of the run, the elapsed time from the deployment request.
+
+example JSON:
+{"group": "scs-bbe-401-group", "deployment": "cb645f98-7737", "status": "Success", "submitted": 0.4,
+"elapsed": 14.2, "polls": 6}
+"""
+
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from scs_core.aws.greengrass.v1.aws_deployer import AWSGroupDeployer
+
+from scs_core.data.json import JSONable
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_mfr.greengrass.deployment_tracker import DeploymentTracker
+from scs_mfr.sys.backoff import Backoff
+from scs_mfr.sys.rate_limiter import RateLimiter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FleetDeployer(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_RATE = 5.0                              # requests per second
+    DEFAULT_CONCURRENCY = 8
+
+    MAX_ATTEMPTS = 6
+
+    NOT_FOUND = "NotFound"
+    REJECTED = "Rejected"
+    POLL_FAILED = "PollFailed"
+
+    __THROTTLING_CODES = ('ThrottlingException', 'TooManyRequestsException')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def is_throttling(cls, error):
+        return error.response.get('Error', {}).get('Code') in cls.__THROTTLING_CODES
+
+
+    @staticmethod
+    def error_message(error):
+        if isinstance(error, ClientError):
+            return error.response.get('Error', {}).get('Message')
+
+        return str(error)                                   # BotoCoreError - eg. EndpointConnectionError
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, client, rate=None, concurrency=None, timeout=None):
+        """
+        Constructor
+        """
+        self.__client = client                                                          # boto3 greengrass client
+        self.__limiter = RateLimiter(self.DEFAULT_RATE if rate is None else rate)       # RateLimiter
+        self.__concurrency = self.DEFAULT_CONCURRENCY if concurrency is None else int(concurrency)     # int
+        self.__timeout = timeout                                                        # float seconds or None
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def group_index(self):
+        index = OrderedDict()
+        next_token = None
+
+        while True:
+            kwargs = {'MaxResults': '1000'} if next_token is None else {'MaxResults': '1000', 'NextToken': next_token}
+            response = self.__call(self.__client.list_groups, **kwargs)
+
+            for group in response.get('Groups', []):
+                index[group['Name']] = (group['Id'], group.get('LatestVersion'))
+
+            next_token = response.get('NextToken')
+
+            if not next_token:
+                return index
+
+
+    def deploy(self, group_names):
+        timer = Timer()
+        index = self.group_index()
+
+        self.__logger.info("groups: %s found in %s seconds" % (len(index), timer.total()))
+
+        in_flight = []                                      # list of (DeploymentTracker, float submitted)
+        backoff = Backoff()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = {}
+
+            for group_name in group_names:
+                if group_name not in index:
+                    yield FleetDeploymentResult(group_name, None, self.NOT_FOUND, None, None, 0)
+                    continue
+
+                group_id, version_id = index[group_name]
+                pending[executor.submit(self.__submit, group_name, group_id, version_id, timer)] = group_name
+
+            while pending or in_flight:
+                # submissions...
+                for future in [future for future in pending if future.done()]:
+                    group_name = pending.pop(future)
+
+                    try:
+                        in_flight.append(future.result())
+                        backoff.reset()
+
+                    except (BotoCoreError, ClientError) as ex:
+                        self.__logger.error("%s: deployment failed: %s" % (group_name, repr(ex)))
+
+                        yield FleetDeploymentResult(group_name, None, self.REJECTED, timer.total(), None, 0,
+                                                    error=self.error_message(ex))
+
+                # polling...
+                for tracker, submitted in list(in_flight):
+                    self.__limiter.acquire()
+
+                    try:
+                        progress = tracker.poll(self.__client)
+
+                    except (BotoCoreError, ClientError) as ex:
+                        if isinstance(ex, ClientError) and self.is_throttling(ex):
+                            self.__logger.info("%s: throttled" % tracker.group_name)
+                            continue
+
+                        self.__logger.error("%s: poll failed: %s" % (tracker.group_name, repr(ex)))
+
+                        in_flight.remove((tracker, submitted))
+                        yield FleetDeploymentResult(tracker.group_name, tracker.deployment_id, self.POLL_FAILED,
+                                                    submitted, tracker.elapsed, tracker.polls,
+                                                    error=self.error_message(ex))
+                        continue
+
+                    if progress is not None:
+                        self.__logger.info("%s: %s" % (tracker.group_name, tracker.status))
+
+                    if not tracker.is_complete() and self.timeout is not None and tracker.elapsed >= self.timeout:
+                        tracker.timeout()
+
+                    if tracker.is_complete():
+                        in_flight.remove((tracker, submitted))
+                        yield FleetDeploymentResult.construct(tracker, submitted)
+
+                # wait...
+                if in_flight:
+                    backoff.sleep()
+
+                elif pending:
+                    wait(pending, return_when=FIRST_COMPLETED)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __submit(self, group_name, group_id, version_id, timer):
+        response = self.__call(self.__client.create_deployment, DeploymentType="NewDeployment", GroupId=group_id,
+                               GroupVersionId=version_id)
+
+        return DeploymentTracker(group_name, group_id, response.get('DeploymentId')), timer.total()
+
+
+    def __call(self, method, **kwargs):
+        backoff = Backoff()
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            self.__limiter.acquire()
+
+            try:
+                return method(**kwargs)
+
+            except ClientError as ex:
+                if not self.is_throttling(ex) or attempt == self.MAX_ATTEMPTS:
+                    raise
+
+                backoff.sleep()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rate(self):
+        return self.__limiter.rate
+
+
+    @property
+    def concurrency(self):
+        return self.__concurrency
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FleetDeployer:{client:%s, rate:%s, concurrency:%s, timeout:%s}" % \
+               (self.__client, self.rate, self.concurrency, self.timeout)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FleetDeploymentResult(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, tracker, submitted):
+        return cls(tracker.group_name, tracker.deployment_id, tracker.status, submitted, tracker.elapsed,
+                   tracker.polls, error=tracker.error)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_name, deployment_id, status, submitted, elapsed, polls, error=None):
+        """
+        Constructor
+        """
+        self.__group_name = group_name                      # string
+        self.__deployment_id = deployment_id                # string
+        self.__status = status                              # string
+        self.__submitted = submitted                        # float seconds
+        self.__elapsed = elapsed                            # float seconds
+        self.__polls = int(polls)                           # int
+        self.__error = error                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_successful(self):
+        return self.status == AWSGroupDeployer.SUCCESS
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['group'] = self.group_name
+        jdict['deployment'] = self.deployment_id
+        jdict['status'] = self.status
+        jdict['submitted'] = None if self.submitted is None else round(self.submitted, 1)
+        jdict['elapsed'] = None if self.elapsed is None else round(self.elapsed, 1)
+        jdict['polls'] = self.polls
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def group_name(self):
+        return self.__group_name
+
+
+    @property
+    def deployment_id(self):
+        return self.__deployment_id
+
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    @property
+    def submitted(self):
+        return self.__submitted
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    @property
+    def polls(self):
+        return self.__polls
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FleetDeploymentResult:{group_name:%s, deployment_id:%s, status:%s, submitted:%s, elapsed:%s, " \
+               "polls:%s, error:%s}" % \
+               (self.group_name, self.deployment_id, self.status, self.submitted, self.elapsed, self.polls,
+                self.error)
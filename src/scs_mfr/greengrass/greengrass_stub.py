@@ -0,0 +1,118 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A local stand-in for the boto3 Greengrass client, implementing only the calls made by the fleet deployer. Each
+deployment reports Building, then InProgress, then Success - or Failure, for groups named as failures - over the given
+duration. A fraction of calls may be rejected with a ThrottlingException, to exercise the caller's retry logic.
+"""
+
+import random
+import threading
+import time
+import uuid
+
+from botocore.exceptions import ClientError
+
+from scs_core.aws.greengrass.v1.aws_deployer import AWSGroupDeployer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GreengrassStub(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_DURATION = 5.0                          # seconds
+    PAGE_SIZE = 50
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_names, duration=None, failures=(), throttling=0.0):
+        """
+        Constructor
+        """
+        self.__groups = [{'Name': name, 'Id': str(uuid.uuid4()), 'LatestVersion': str(uuid.uuid4())}
+                         for name in group_names]           # list of dict
+
+        self.__duration = self.DEFAULT_DURATION if duration is None else float(duration)   # float seconds
+        self.__failures = set(failures)                     # set of string
+        self.__throttling = float(throttling)               # float probability
+
+        self.__deployments = {}                             # dict of deployment_id: (group dict, float start)
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def list_groups(self, MaxResults=None, NextToken=None):
+        self.__throttle('ListGroups')
+
+        start = 0 if NextToken is None else int(NextToken)
+        end = start + self.PAGE_SIZE
+
+        response = {'Groups': self.__groups[start:end]}
+
+        if end < len(self.__groups):
+            response['NextToken'] = str(end)
+
+        return response
+
+
+    def create_deployment(self, DeploymentType=None, GroupId=None, GroupVersionId=None):
+        self.__throttle('CreateDeployment')
+
+        group = self.__group(GroupId)
+        deployment_id = str(uuid.uuid4())
+
+        with self.__lock:
+            self.__deployments[deployment_id] = (group, time.monotonic())
+
+        return {'DeploymentId': deployment_id,
+                'DeploymentArn': 'arn:aws:greengrass:stub:/greengrass/groups/%s/deployments/%s' %
+                                 (GroupId, deployment_id)}
+
+
+    def get_deployment_status(self, DeploymentId=None, GroupId=None):
+        self.__throttle('GetDeploymentStatus')
+
+        with self.__lock:
+            group, start = self.__deployments[DeploymentId]
+
+        elapsed = time.monotonic() - start
+
+        if elapsed < self.__duration * 0.2:
+            return {'DeploymentStatus': AWSGroupDeployer.BUILDING}
+
+        if elapsed < self.__duration:
+            return {'DeploymentStatus': AWSGroupDeployer.IN_PROGRESS}
+
+        if group['Name'] in self.__failures:
+            return {'DeploymentStatus': AWSGroupDeployer.FAILURE, 'ErrorMessage': "stub failure"}
+
+        return {'DeploymentStatus': AWSGroupDeployer.SUCCESS}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __group(self, group_id):
+        for group in self.__groups:
+            if group['Id'] == group_id:
+                return group
+
+        raise ClientError({'Error': {'Code': 'BadRequestException', 'Message': group_id}}, 'CreateDeployment')
+
+
+    def __throttle(self, operation_name):
+        if random.random() < self.__throttling:
+            raise ClientError({'Error': {'Code': 'ThrottlingException', 'Message': "stub throttling"}},
+                              operation_name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GreengrassStub:{groups:%s, duration:%s, failures:%s, throttling:%s}" % \
+               (len(self.__groups), self.__duration, self.__failures, self.__throttling)
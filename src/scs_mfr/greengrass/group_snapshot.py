@@ -0,0 +1,355 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A compact, hashed summary of a Greengrass group version, for auditing drift across the fleet without comparing whole
+group documents.
+
+The group version is divided into components - cores, functions, logging, resources and subscriptions - and, for a
+device snapshot, the group configuration. Each item of a component is hashed, keyed by its Id, and each component is
+hashed from its items. The snapshot hash is formed from the component hashes. Identifiers that change with every
+version - ARNs, version IDs and timestamps - are not part of any hash, so two groups with the same definitions have the
+same hash.
+
+A snapshot may be made from the deployed group version on the device (AWSGroupVersion) and the device's
+AWSGroupConfiguration, or from the Greengrass API, for any number of groups, by a GroupSnapshotter. Snapshots are
+comparable when made from the same source.
+
+example JSON:
+{"group": "scs-bbe-401-group", "version": "4c8ba1d3-1b2e-4b3f-9d0e-9e3f1b0a7c2d", "hash": "9f2c61d0a4b7e815",
+"components": {"functions": {"hash": "0be4f5d7a3c29e61", "items": {"gas-inference": "77a1d6e0c4b3f2a9"}}}}
+"""
+
+import hashlib
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GroupSnapshot(JSONable):
+    """
+    classdocs
+    """
+
+    HASH_LENGTH = 16                                # hex digits
+
+    CONFIGURATION = 'configuration'
+
+    __CONFIGURATION_FIELDS = ('group-name', 'unix-group', 'ml')           # time-initiated changes with every setup
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def digest(cls, obj):
+        jstr = json.dumps(obj, sort_keys=True, separators=(',', ':'), default=str)
+
+        return hashlib.sha256(jstr.encode()).hexdigest()[:cls.HASH_LENGTH]
+
+
+    @classmethod
+    def component(cls, content):
+        items = OrderedDict()
+
+        for index, item in enumerate(content or []):
+            key = item.get('Id', str(index)) if isinstance(item, dict) else str(index)
+            items[key] = cls.digest(item)
+
+        return GroupSnapshotComponent(cls.digest(items), items)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        group_name = jdict.get('group')
+        version = jdict.get('version')
+        components = OrderedDict((name, GroupSnapshotComponent.construct_from_jdict(component))
+                                 for name, component in jdict.get('components', {}).items())
+        error = jdict.get('error')
+
+        return cls(group_name, version, components, error=error)
+
+
+    @classmethod
+    def construct_from_device(cls, group_version, configuration=None):
+        jdict = group_version.as_json()
+        definitions = jdict.get('GroupDefinitions', {})
+
+        components = OrderedDict()
+        components['cores'] = cls.component(jdict.get('Cores'))
+
+        for name, definition in sorted(definitions.items()):
+            content = definition.get('Content') if isinstance(definition, dict) else definition
+            components[name.lower()] = cls.component(content)
+
+        if configuration is not None:
+            jdict = configuration.as_json()
+            items = OrderedDict((field, cls.digest(jdict.get(field))) for field in cls.__CONFIGURATION_FIELDS)
+            components[cls.CONFIGURATION] = GroupSnapshotComponent(cls.digest(items), items)
+
+        return cls(group_version.group_name, None, components)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_name, version, components, error=None):
+        """
+        Constructor
+        """
+        self.__group_name = group_name                      # string
+        self.__version = version                            # string
+        self.__components = components                      # dict of name: GroupSnapshotComponent
+        self.__error = error                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def diff(self, other):
+        return GroupSnapshotDiff.construct(self, other)
+
+
+    @property
+    def hash(self):
+        if self.error is not None:
+            return None
+
+        return self.digest(OrderedDict((name, component.hash) for name, component in self.components.items()))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['group'] = self.group_name
+        jdict['version'] = self.version
+        jdict['hash'] = self.hash
+        jdict['components'] = self.components
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def group_name(self):
+        return self.__group_name
+
+
+    @property
+    def version(self):
+        return self.__version
+
+
+    @property
+    def components(self):
+        return self.__components
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GroupSnapshot:{group_name:%s, version:%s, hash:%s, components:%s, error:%s}" % \
+               (self.group_name, self.version, self.hash, list(self.components), self.error)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GroupSnapshotComponent(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        return cls(jdict.get('hash'), OrderedDict(jdict.get('items', {})))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, content_hash, items):
+        """
+        Constructor
+        """
+        self.__hash = content_hash                          # string
+        self.__items = items                                # dict of item ID: string hash
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['hash'] = self.hash
+        jdict['items'] = self.items
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def hash(self):
+        return self.__hash
+
+
+    @property
+    def items(self):
+        return self.__items
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GroupSnapshotComponent:{hash:%s, items:%s}" % (self.hash, self.items)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GroupSnapshotDiff(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, before, after):
+        group_name = before.group_name if after is None else after.group_name
+
+        before_version = None if before is None else before.version
+        after_version = None if after is None else after.version
+
+        errors = ["%s: %s" % (name, snapshot.error) for name, snapshot in (('before', before), ('after', after))
+                  if snapshot is not None and snapshot.error is not None]
+
+        if errors:                                          # a failed snapshot has no components to compare
+            return cls(group_name, before_version, after_version, [], [], [], error='; '.join(errors))
+
+        before_items = {} if before is None else cls.__items(before)
+        after_items = {} if after is None else cls.__items(after)
+
+        added = sorted(path for path in after_items if path not in before_items)
+        removed = sorted(path for path in before_items if path not in after_items)
+        changed = sorted(path for path in after_items
+                         if path in before_items and after_items[path] != before_items[path])
+
+        return cls(group_name, before_version, after_version, added, removed, changed)
+
+
+    @staticmethod
+    def __items(snapshot):
+        items = {}
+
+        for name, component in snapshot.components.items():
+            if not component.items:
+                items[name] = component.hash
+
+            for key, item_hash in component.items.items():
+                items['/'.join((name, key))] = item_hash
+
+        return items
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_name, before, after, added, removed, changed, error=None):
+        """
+        Constructor
+        """
+        self.__group_name = group_name                      # string
+        self.__before = before                              # string version
+        self.__after = after                                # string version
+        self.__added = added                                # list of string component/item
+        self.__removed = removed                            # list of string component/item
+        self.__changed = changed                            # list of string component/item
+        self.__error = error                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has_changes(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['group'] = self.group_name
+        jdict['before'] = self.before
+        jdict['after'] = self.after
+        jdict['added'] = self.added
+        jdict['removed'] = self.removed
+        jdict['changed'] = self.changed
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def group_name(self):
+        return self.__group_name
+
+
+    @property
+    def before(self):
+        return self.__before
+
+
+    @property
+    def after(self):
+        return self.__after
+
+
+    @property
+    def added(self):
+        return self.__added
+
+
+    @property
+    def removed(self):
+        return self.__removed
+
+
+    @property
+    def changed(self):
+        return self.__changed
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GroupSnapshotDiff:{group_name:%s, before:%s, after:%s, added:%s, removed:%s, changed:%s, error:%s}" % \
+               (self.group_name, self.before, self.after, self.added, self.removed, self.changed, self.error)
@@ -0,0 +1,174 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Retrieves GroupSnapshots of the latest version of any number of Greengrass groups from the Greengrass API. Groups are
+retrieved concurrently, subject to a limit on the number in flight and a limit on the rate of API calls. Throttled
+calls are retried with backoff. A group that cannot be retrieved is reported as a snapshot with its error set.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_mfr.greengrass.fleet_deployer import FleetDeployer
+from scs_mfr.greengrass.group_snapshot import GroupSnapshot
+from scs_mfr.sys.backoff import Backoff
+from scs_mfr.sys.rate_limiter import RateLimiter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GroupSnapshotter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_RATE = 5.0                              # requests per second
+    DEFAULT_CONCURRENCY = 8
+
+    MAX_ATTEMPTS = 6
+
+    NOT_FOUND = "group not found"
+
+    # ARN field: (component, getter, parameter prefix, content field)
+    __DEFINITIONS = OrderedDict((
+        ('CoreDefinitionVersionArn', ('cores', 'get_core_definition_version', 'CoreDefinition', 'Cores')),
+        ('FunctionDefinitionVersionArn',
+         ('functions', 'get_function_definition_version', 'FunctionDefinition', 'Functions')),
+        ('LoggerDefinitionVersionArn', ('logging', 'get_logger_definition_version', 'LoggerDefinition', 'Loggers')),
+        ('ResourceDefinitionVersionArn',
+         ('resources', 'get_resource_definition_version', 'ResourceDefinition', 'Resources')),
+        ('SubscriptionDefinitionVersionArn',
+         ('subscriptions', 'get_subscription_definition_version', 'SubscriptionDefinition', 'Subscriptions'))
+    ))
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def split_arn(arn):
+        # arn:aws:greengrass:REGION:ACCOUNT:/greengrass/definition/functions/ID/versions/VERSION_ID
+        pieces = arn.split('/')
+
+        return pieces[-3], pieces[-1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, client, rate=None, concurrency=None):
+        """
+        Constructor
+        """
+        self.__client = client                                                          # boto3 greengrass client
+        self.__limiter = RateLimiter(self.DEFAULT_RATE if rate is None else rate)       # RateLimiter
+        self.__concurrency = self.DEFAULT_CONCURRENCY if concurrency is None else int(concurrency)     # int
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def retrieve(self, group_names):
+        timer = Timer()
+        index = self.group_index()
+
+        self.__logger.info("groups: %s found in %s seconds" % (len(index), timer.total()))
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self.__snapshot, group_name, index.get(group_name))
+                       for group_name in group_names]
+
+            for future in futures:
+                yield future.result()
+
+
+    def group_index(self):
+        index = OrderedDict()
+        next_token = None
+
+        while True:
+            kwargs = {'MaxResults': '1000'} if next_token is None else {'MaxResults': '1000', 'NextToken': next_token}
+            response = self.__call(self.__client.list_groups, **kwargs)
+
+            for group in response.get('Groups', []):
+                index[group['Name']] = (group['Id'], group.get('LatestVersion'))
+
+            next_token = response.get('NextToken')
+
+            if not next_token:
+                return index
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __snapshot(self, group_name, ids):
+        if ids is None:
+            return GroupSnapshot(group_name, None, OrderedDict(), error=self.NOT_FOUND)
+
+        group_id, version_id = ids
+
+        try:
+            response = self.__call(self.__client.get_group_version, GroupId=group_id, GroupVersionId=version_id)
+            definition = response.get('Definition', {})
+
+            components = OrderedDict()
+
+            for arn_field, (name, getter, prefix, content_field) in self.__DEFINITIONS.items():
+                arn = definition.get(arn_field)
+
+                if not arn:
+                    continue
+
+                definition_id, definition_version_id = self.split_arn(arn)
+                kwargs = {prefix + 'Id': definition_id, prefix + 'VersionId': definition_version_id}
+
+                response = self.__call(getattr(self.__client, getter), **kwargs)
+                components[name] = GroupSnapshot.component(response.get('Definition', {}).get(content_field))
+
+        except ClientError as ex:
+            return GroupSnapshot(group_name, version_id, OrderedDict(),
+                                 error=ex.response.get('Error', {}).get('Message'))
+
+        snapshot = GroupSnapshot(group_name, version_id, components)
+        self.__logger.info(snapshot)
+
+        return snapshot
+
+
+    def __call(self, method, **kwargs):
+        backoff = Backoff()
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            self.__limiter.acquire()
+
+            try:
+                return method(**kwargs)
+
+            except ClientError as ex:
+                if not FleetDeployer.is_throttling(ex) or attempt == self.MAX_ATTEMPTS:
+                    raise
+
+                backoff.sleep()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rate(self):
+        return self.__limiter.rate
+
+
+    @property
+    def concurrency(self):
+        return self.__concurrency
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GroupSnapshotter:{client:%s, rate:%s, concurrency:%s}" % (self.__client, self.rate, self.concurrency)
@@ -9,12 +9,25 @@ DESCRIPTION
 The modem utility is used to report on the modem connection status and SIM parameters. The reports provided by this
 utility are included in the configuration utility report.
 
+Querying the modem can take several seconds, or fail while the modem is busy, so reports are served from a cached
+snapshot. The model and SIM reports are held for TTL seconds (default one hour), and the connection report for 30
+seconds. If the modem cannot be queried, the cached report is served. The --live flag forces a query.
+
+In --interval mode, the connection is queried every INTERVAL seconds, and the state and signal quality are kept for
+the last WINDOW samples. Every PERIOD samples, a summary of the window is written to stdout - the fraction of samples
+in the connected state, the minimum, mean and maximum signal quality, the number of dropouts from the connected state,
+and the number of samples in each state.
+
 SYNOPSIS
-modem.py { -m | -c | -s } [-v]
+modem.py { -m | -c [-i INTERVAL [-p PERIOD] [-w WINDOW]] | -s } [{ -l | -t TTL }] [-v]
 
 EXAMPLES
 ./modem.py -s
 
+./modem.py -c -l
+
+./modem.py -c -i 10 -p 6 -w 60
+
 DOCUMENT EXAMPLE - MODEL
 {"id": "3f07553c31ce11715037ac16c24ceddcfb6f7a0b", "imei": "867962041294151", "mfr": "QUALCOMM INCORPORATED",
 "model": "QUECTEL Mobile Broadband Module", "rev": "EC21EFAR06A01M4G"}
@@ -22,9 +35,16 @@ DOCUMENT EXAMPLE - MODEL
 DOCUMENT EXAMPLE - CONNECTION
 {"state": "connected", "signal": {"quality": 34, "recent": true}}
 
+DOCUMENT EXAMPLE - CONNECTION STATS
+{"rec": "2026-10-19T09:01:12Z", "samples": 60, "connected": 0.95, "quality": {"min": 18, "mean": 31.4, "max": 40},
+"dropouts": 1, "states": {"connected": 57, "searching": 3}}
+
 DOCUMENT EXAMPLE - SIM
 {"imsi": "234104886708567", "iccid": "8944110068257270054", "operator-code": "23410", "operator-name": "O2 - UK"}
 
+FILES
+~/SCS/conf/modem_snapshot.json
+
 SEE ALSO
 scs_dev/status_sampler
 scs_mfr/configuration
@@ -33,11 +53,14 @@ scs_mfr/configuration
 import sys
 
 from scs_core.data.json import JSONify
+from scs_core.sync.interval_timer import IntervalTimer
 from scs_core.sys.logging import Logging
 
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_modem import CmdModem
+from scs_mfr.sys.connection_sampler import ConnectionSampler
+from scs_mfr.sys.modem_cache import ModemCache
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -61,17 +84,50 @@ if __name__ == '__main__':
     logger.info(cmd)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    cache = ModemCache(Host, ttl=cmd.ttl, live=cmd.live)
+    logger.info(cache)
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # run...
 
+    if cmd.interval:
+        sampler = ConnectionSampler(window=cmd.window)
+        logger.info(sampler)
+
+        timer = IntervalTimer(cmd.interval)
+        count = 0
+
+        try:
+            while timer.true():
+                try:
+                    sampler.add(Host.modem_conn())
+                except (OSError, ValueError) as ex:
+                    logger.warning(repr(ex))
+                    sampler.add(None)
+
+                count += 1
+
+                if count % cmd.period == 0:
+                    print(JSONify.dumps(sampler.stats()))
+                    sys.stdout.flush()
+
+        except KeyboardInterrupt:
+            print(file=sys.stderr)
+
+        exit(0)
+
     if cmd.model:
-        report = Host.modem()
+        report = cache.modem()
 
     if cmd.connection:
-        report = Host.modem_conn()
+        report = cache.modem_conn()
 
     if cmd.sim:
-        report = Host.sim()
+        report = cache.sim()
 
     if report:
         print(JSONify.dumps(report))
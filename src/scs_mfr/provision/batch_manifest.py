@@ -0,0 +1,262 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A manifest of the devices in a production batch, one row per device, with the values that would otherwise be given
+to provision_new_scs. A manifest may be written as CSV with a header row, or as JSON lines.
+
+Columns are:
+serial (the device tag), afe_serial, dsi_serial, dsi_calibrated_on, model_map, timezone, project, invoice
+
+The project is given as ORG/GROUP/LOCATION. Empty cells are read as None. A JSON line that is empty, or is not an
+object, is read as a row with its error set.
+
+example CSV:
+serial,afe_serial,dsi_serial,dsi_calibrated_on,model_map,timezone,project,invoice
+scs-bbe-401,26-000345,,,,Europe/London,south-coast-science-dev/development/_,INV-0000
+
+example JSON:
+{"line": 2, "serial": "scs-bbe-401", "afe_serial": "26-000345", "dsi_serial": null, "dsi_calibrated_on": null,
+"model_map": null, "timezone": "Europe/London", "project": "south-coast-science-dev/development/_",
+"invoice": "INV-0000"}
+"""
+
+import csv
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchManifest(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_lines(cls, lines):
+        lines = list(lines)
+        first = next((index for index, line in enumerate(lines) if line.strip()), None)
+
+        if first is None:
+            return cls([])
+
+        # JSON lines - numbered as in the input, including blank lines...
+        if lines[first].strip().startswith('{'):
+            rows = [cls.__json_row(json.loads(line), number)
+                    for number, line in enumerate(lines, start=1) if line.strip()]
+
+            return cls(rows)
+
+        # CSV - the first line that is not blank is the header...
+        reader = csv.DictReader(line if line.strip() else '\n' for line in lines[first:])     # blank rows are skipped
+        rows = [BatchManifestRow.construct_from_jdict(jdict, first + reader.line_num) for jdict in reader]
+
+        return cls(rows)
+
+
+    @staticmethod
+    def __json_row(jdict, line):
+        if not isinstance(jdict, dict):
+            return BatchManifestRow.construct_invalid(line, "the row is not a JSON object.")
+
+        row = BatchManifestRow.construct_from_jdict(jdict, line)
+
+        return BatchManifestRow.construct_invalid(line, "the row is empty.") if row is None else row
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rows):
+        """
+        Constructor
+        """
+        self.__rows = rows                                  # list of BatchManifestRow
+
+
+    def __len__(self):
+        return len(self.__rows)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def duplicates(self, field):
+        counts = {}
+
+        for row in self.rows:
+            value = getattr(row, field)
+
+            if value is not None:
+                counts[value] = counts.get(value, 0) + 1
+
+        return {value for value, count in counts.items() if count > 1}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rows(self):
+        return self.__rows
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchManifest:{rows:%s}" % len(self)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchManifestRow(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __value(jdict, field):
+        value = jdict.get(field)
+
+        if value is None:
+            return None
+
+        value = str(value).strip()
+
+        return value if value else None
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, line=None):
+        if not jdict:
+            return None
+
+        line = jdict.get('line', line)
+
+        serial = cls.__value(jdict, 'serial')
+        afe_serial = cls.__value(jdict, 'afe_serial')
+        dsi_serial = cls.__value(jdict, 'dsi_serial')
+        dsi_calibrated_on = cls.__value(jdict, 'dsi_calibrated_on')
+        model_map = cls.__value(jdict, 'model_map')
+        timezone = cls.__value(jdict, 'timezone')
+        project = cls.__value(jdict, 'project')
+        invoice = cls.__value(jdict, 'invoice')
+
+        return cls(line, serial, afe_serial, dsi_serial, dsi_calibrated_on, model_map, timezone, project, invoice)
+
+
+    @classmethod
+    def construct_invalid(cls, line, error):
+        return cls(line, None, None, None, None, None, None, None, None, error=error)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, line, serial, afe_serial, dsi_serial, dsi_calibrated_on, model_map, timezone, project,
+                 invoice, error=None):
+        """
+        Constructor
+        """
+        self.__line = line                                  # int
+        self.__serial = serial                              # string device tag
+        self.__afe_serial = afe_serial                      # string
+        self.__dsi_serial = dsi_serial                      # string
+        self.__dsi_calibrated_on = dsi_calibrated_on        # string ISO 8601 date
+        self.__model_map = model_map                        # string
+        self.__timezone = timezone                          # string
+        self.__project = project                            # string ORG/GROUP/LOCATION
+        self.__invoice = invoice                            # string
+        self.__error = error                                # string        the row could not be read
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['line'] = self.line
+        jdict['serial'] = self.serial
+        jdict['afe_serial'] = self.afe_serial
+        jdict['dsi_serial'] = self.dsi_serial
+        jdict['dsi_calibrated_on'] = self.dsi_calibrated_on
+        jdict['model_map'] = self.model_map
+        jdict['timezone'] = self.timezone
+        jdict['project'] = self.project
+        jdict['invoice'] = self.invoice
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def line(self):
+        return self.__line
+
+
+    @property
+    def serial(self):
+        return self.__serial
+
+
+    @property
+    def afe_serial(self):
+        return self.__afe_serial
+
+
+    @property
+    def dsi_serial(self):
+        return self.__dsi_serial
+
+
+    @property
+    def dsi_calibrated_on(self):
+        return self.__dsi_calibrated_on
+
+
+    @property
+    def model_map(self):
+        return self.__model_map
+
+
+    @property
+    def timezone(self):
+        return self.__timezone
+
+
+    @property
+    def project(self):
+        return self.__project
+
+
+    @property
+    def project_nodes(self):
+        return None if self.project is None else self.project.split('/')
+
+
+    @property
+    def invoice(self):
+        return self.__invoice
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchManifestRow:{line:%s, serial:%s, afe_serial:%s, dsi_serial:%s, dsi_calibrated_on:%s, " \
+               "model_map:%s, timezone:%s, project:%s, invoice:%s, error:%s}" % \
+               (self.line, self.serial, self.afe_serial, self.dsi_serial, self.dsi_calibrated_on,
+                self.model_map, self.timezone, self.project, self.invoice, self.error)
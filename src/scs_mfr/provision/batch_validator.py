@@ -0,0 +1,263 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Validates every row of a BatchManifest, applying the checks made by provision_new_scs before any device is touched.
+
+Remote lookups - the Cognito device tag whitelist, and the availability of AFE and DSI calibration documents - are
+made once for each distinct value in the manifest, concurrently, before the rows are validated. Calibration documents
+are fetched through the CalibCache, so that they are already in place when the devices are provisioned. The model map
+names and the timezone names are read once. Values that appear in more than one row of the manifest are reported.
+
+example JSON:
+{"line": 3, "serial": "scs-bbe-402", "valid": false, "errors": ["unrecognised AFE serial number: '26-000999'."]}
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_core.aws.config.project import Project
+from scs_core.aws.security.cognito_device import CognitoDeviceCredentials
+
+from scs_core.client.http_exception import HTTPException, HTTPNotFoundException
+from scs_core.client.resource_unavailable_exception import ResourceUnavailableException
+
+from scs_core.data.datetime import Date
+from scs_core.data.json import JSONable
+
+from scs_core.location.timezone import Timezone
+
+from scs_core.model.model_map import ModelMap
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_mfr.calib.calib_cache import CalibCache
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchValidator(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CONCURRENCY = 8
+
+    __UNIQUE_FIELDS = ('serial', 'afe_serial', 'dsi_serial')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, creator, calib_cache, concurrency=None):
+        """
+        Constructor
+        """
+        self.__creator = creator                            # CognitoDeviceCreator
+        self.__calib_cache = calib_cache                    # CalibCache
+        self.__concurrency = self.DEFAULT_CONCURRENCY if concurrency is None else int(concurrency)
+
+        self.__model_maps = frozenset(ModelMap.names())
+        self.__timezones = frozenset(Timezone.zones())
+
+        self.__whitelist = {}                               # dict of tag: error string or None
+        self.__calibrations = {}                            # dict of (kind, serial): error string or None
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def validate(self, manifest):
+        self.__lookup(manifest)
+
+        duplicates = {field: manifest.duplicates(field) for field in self.__UNIQUE_FIELDS}
+
+        for row in manifest.rows:
+            yield BatchValidationReport(row.line, row.serial, self.__validate(row, duplicates))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __lookup(self, manifest):
+        timer = Timer()
+
+        tags = {row.serial for row in manifest.rows if CognitoDeviceCredentials.is_valid_tag(row.serial)}
+
+        calibrations = {(CalibCache.BOARD, row.afe_serial) for row in manifest.rows if row.afe_serial is not None}
+        calibrations |= {(CalibCache.SENSOR, row.dsi_serial) for row in manifest.rows if row.dsi_serial is not None}
+
+        with ThreadPoolExecutor(max_workers=self.__concurrency) as executor:
+            tag_futures = {tag: executor.submit(self.__may_create, tag) for tag in tags}
+            calib_futures = {key: executor.submit(self.__calib_is_available, *key) for key in calibrations}
+
+        self.__whitelist = {tag: future.result() for tag, future in tag_futures.items()}
+        self.__calibrations = {key: future.result() for key, future in calib_futures.items()}
+
+        self.__logger.info("lookups: tags:%s calibrations:%s in %s seconds" %
+                           (len(tags), len(calibrations), timer.total()))
+
+
+    def __may_create(self, tag):
+        try:
+            if not self.__creator.may_create(tag):
+                return "device tag '%s' is not whitelisted." % tag
+
+        except (HTTPException, OSError) as ex:
+            return "whitelist lookup for '%s' failed: %s" % (tag, repr(ex))
+
+        return None
+
+
+    def __calib_is_available(self, kind, serial):
+        name = 'AFE' if kind == CalibCache.BOARD else 'DSI'
+
+        try:
+            self.__calib_cache.fetch(kind, serial)
+
+        except HTTPNotFoundException:
+            return "unrecognised %s serial number: '%s'." % (name, serial)
+
+        except (HTTPException, ResourceUnavailableException, ValueError) as ex:
+            return "%s calibration for '%s' is unavailable: %s" % (name, serial, repr(ex))
+
+        return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __validate(self, row, duplicates):
+        if row.error is not None:
+            return [row.error]
+
+        errors = []
+
+        # identity...
+        if row.serial is None:
+            errors.append("no device tag.")
+
+        elif not CognitoDeviceCredentials.is_valid_tag(row.serial):
+            errors.append("invalid device tag: '%s'." % row.serial)
+
+        elif self.__whitelist.get(row.serial):
+            errors.append(self.__whitelist[row.serial])
+
+        if row.invoice is None:
+            errors.append("no invoice number.")
+
+        # project...
+        nodes = row.project_nodes
+
+        if nodes is None or len(nodes) != 3:
+            errors.append("the project '%s' is not of the form ORG/GROUP/LOCATION." % row.project)
+
+        else:
+            for name, node in zip(('organisation', 'group', 'location'), nodes):
+                if not Project.is_valid_path_node(node):
+                    errors.append("the project %s '%s' is not valid." % (name, node))
+
+        # electrochems...
+        if row.afe_serial is not None and row.dsi_serial is not None:
+            errors.append("an AFE serial number and a DSI serial number may not both be given.")
+
+        if row.afe_serial is not None and self.__calibrations.get((CalibCache.BOARD, row.afe_serial)):
+            errors.append(self.__calibrations[(CalibCache.BOARD, row.afe_serial)])
+
+        if row.dsi_serial is not None and self.__calibrations.get((CalibCache.SENSOR, row.dsi_serial)):
+            errors.append(self.__calibrations[(CalibCache.SENSOR, row.dsi_serial)])
+
+        if row.dsi_serial is not None and row.dsi_calibrated_on is None:
+            errors.append("no DSI calibration date.")
+
+        if row.dsi_calibrated_on is not None and not Date.is_valid_iso_format(row.dsi_calibrated_on):
+            errors.append("invalid ISO date: '%s'." % row.dsi_calibrated_on)
+
+        # configuration...
+        if row.model_map is not None and row.model_map not in self.__model_maps:
+            errors.append("model map '%s' cannot be found." % row.model_map)
+
+        if row.timezone is not None and row.timezone not in self.__timezones:
+            errors.append("unrecognised timezone: '%s'." % row.timezone)
+
+        # batch...
+        for field in self.__UNIQUE_FIELDS:
+            value = getattr(row, field)
+
+            if value in duplicates[field]:
+                errors.append("%s '%s' appears more than once in the manifest." % (field, value))
+
+        return errors
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def concurrency(self):
+        return self.__concurrency
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchValidator:{creator:%s, calib_cache:%s, concurrency:%s}" % \
+               (self.__creator, self.__calib_cache, self.concurrency)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchValidationReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, line, serial, errors):
+        """
+        Constructor
+        """
+        self.__line = line                                  # int
+        self.__serial = serial                              # string device tag
+        self.__errors = errors                              # list of string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        return not self.errors
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['line'] = self.line
+        jdict['serial'] = self.serial
+        jdict['valid'] = self.is_valid()
+        jdict['errors'] = self.errors
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def line(self):
+        return self.__line
+
+
+    @property
+    def serial(self):
+        return self.__serial
+
+
+    @property
+    def errors(self):
+        return self.__errors
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchValidationReport:{line:%s, serial:%s, errors:%s}" % (self.line, self.serial, self.errors)
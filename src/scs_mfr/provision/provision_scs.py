@@ -4,9 +4,13 @@ Created on 14 Jul 2023
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import spidev
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
 
+from scs_core.model.gas.gas_baseline import GasBaseline
 from scs_core.model.gas.gas_model_conf import GasModelConf
+from scs_core.model.gas.vcal_baseline import VCalBaseline
 from scs_core.model.pmx.pmx_model_conf import PMxModelConf
 
 from scs_core.sync.schedule import Schedule
@@ -14,6 +18,7 @@ from scs_core.sync.schedule import Schedule
 from scs_host.sys.host import Host
 
 from scs_mfr.provision.provision import Provision
+from scs_mfr.sys.conf_transaction import ConfTransaction
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -90,6 +95,8 @@ class ProvisionSCS(Provision):
         self._clu.s(['pip', 'install', '--upgrade', 'pip'], no_verbose=True)
         self._clu.s(['pip', 'install', '--upgrade', 'requests'], no_verbose=True)
 
+        import spidev                                                                   # late import
+
         if spidev.__version__ != self.SPIDEV_VERSION:
             self._clu.s(['pip', 'uninstall', '-y', 'spidev', '&&',
                          'pip', 'install', 'git+https://github.com/tim-seoss/py-spidev.git@v' + self.SPIDEV_VERSION],
@@ -132,14 +139,15 @@ class ProvisionSCS(Provision):
     def remove_gases(self):
         self._logger.info("Remove gases...")
 
-        self._clu.s([self.MFR + 'schedule.py', '-r', 'scs-gases'])
+        with ConfTransaction(Host) as transaction:
+            schedule = Schedule.load(transaction, skeleton=True)
+            schedule.clear('scs-gases')
+            schedule.save(transaction)
+
+            for conf in (AFECalib, AFEBaseline, GasBaseline, VCalBaseline, SCD30Baseline, GasModelConf):
+                conf.delete(transaction)
 
-        self._clu.s([self.MFR + 'afe_calib.py', '-d'])
-        self._clu.s([self.MFR + 'afe_baseline.py', '-d'])
-        self._clu.s([self.MFR + 'gas_baseline.py', '-d'])
-        self._clu.s([self.MFR + 'vcal_baseline.py', '-d'])
-        self._clu.s([self.MFR + 'scd30_baseline.py', '-d'])
-        self._clu.s([self.MFR + 'gas_model_conf.py', '-d'])
+            self._logger.info(transaction)
 
 
     def update_models(self, electrochems_are_being_set):
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The provision_batch_check utility is used to validate a manifest of an entire production batch before any device is
+provisioned. Each row of the manifest gives the values that would be supplied to provision_new_scs for one device, and
+is subject to the same checks: the device tag must be whitelisted for Cognito registration, the AFE or DSI calibration
+documents must be available, and the model map, timezone and project must be valid. In addition, device tags, AFE
+serial numbers and DSI serial numbers must not appear more than once in the batch.
+
+The manifest is read from MANIFEST_FILE or - if none is given - from stdin, and may be written as CSV with a header
+row, or as JSON lines. Remote lookups are made once for each distinct value, concurrently. Calibration documents are
+stored in the local calibration cache, so that they are available when the batch is provisioned. In --offline mode,
+only calibration documents that are already cached are accepted.
+
+A JSON report is written to stdout for each row. The utility exits with status 1 if any row is not valid.
+
+SYNOPSIS
+provision_batch_check.py [-c CONCURRENCY] [-o] [-v] [MANIFEST_FILE]
+
+EXAMPLES
+./provision_batch_check.py -v -c 16 batch_2026_10.csv
+
+MANIFEST EXAMPLE - CSV
+serial,afe_serial,dsi_serial,dsi_calibrated_on,model_map,timezone,project,invoice
+scs-bbe-401,26-000345,,,,Europe/London,south-coast-science-dev/development/_,INV-0000
+scs-cube-402,,143800348,2026-09-30,oE.1,Europe/London,south-coast-science-dev/development/_,INV-0000
+
+DOCUMENT EXAMPLE - REPORT
+{"line": 2, "serial": "scs-bbe-401", "valid": true, "errors": []}
+
+FILES
+~/SCS/conf/calib_cache/*
+
+SEE ALSO
+scs_mfr/afe_calib_cache
+scs_mfr/provision_new_scs
+"""
+
+import sys
+
+from scs_core.aws.security.cognito_device_creator import CognitoDeviceCreator
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_host.sys.host import Host
+
+from scs_mfr.calib.calib_cache import CalibCache
+from scs_mfr.cmd.cmd_provision_batch_check import CmdProvisionBatchCheck
+from scs_mfr.provision.batch_manifest import BatchManifest
+from scs_mfr.provision.batch_validator import BatchValidator
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    failures = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdProvisionBatchCheck()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('provision_batch_check', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        try:
+            if cmd.filename is None:
+                manifest = BatchManifest.construct_from_lines(sys.stdin)
+
+            else:
+                with open(cmd.filename) as file:
+                    manifest = BatchManifest.construct_from_lines(file)
+
+        except (OSError, ValueError) as ex:
+            logger.error("the manifest could not be read: %s" % repr(ex))
+            exit(1)
+
+        if not len(manifest):
+            logger.error("the manifest is empty.")
+            exit(2)
+
+        logger.info(manifest)
+
+        validator = BatchValidator(CognitoDeviceCreator(), CalibCache(Host, offline=cmd.offline),
+                                   concurrency=cmd.concurrency)
+        logger.info(validator)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        timer = Timer()
+
+        for report in validator.validate(manifest):
+            print(JSONify.dumps(report))
+            sys.stdout.flush()
+
+            if not report.is_valid():
+                failures += 1
+
+        logger.info("valid: %s of %s in %s seconds" % (len(manifest) - failures, len(manifest), timer.total()))
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # end...
+
+        if failures:
+            exit(1)
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
@@ -48,6 +48,7 @@ from scs_core.sys.system_id import SystemID
 
 from scs_host.sys.host import Host
 
+from scs_mfr.calib.calib_cache import CalibCache
 from scs_mfr.cmd.cmd_provision_new_scs import CmdProvisionNewSCS
 from scs_mfr.provision.provision_scs import ProvisionSCS
 
@@ -79,6 +80,8 @@ if __name__ == '__main__':
     provision = ProvisionSCS(model_map=cmd.model_map, verbose=cmd.verbose)
     logger.info(provision)
 
+    calib_cache = CalibCache(Host)
+
     creator = CognitoDeviceCreator()
 
 
@@ -102,14 +105,14 @@ if __name__ == '__main__':
 
     try:
         if cmd.afe_serial is not None:
-            AFECalib.download(cmd.afe_serial, parse=False)
+            calib_cache.download(AFECalib, cmd.afe_serial, parse=False)
     except HTTPNotFoundException:
         logger.error("unrecognised AFE serial number: '%s'." % cmd.afe_serial)
         exit(2)
 
     try:
         if cmd.dsi_serial is not None:
-            DSICalib.download(cmd.dsi_serial, parse=False)
+            calib_cache.download(DSICalib, cmd.dsi_serial, parse=False)
     except HTTPNotFoundException:
         logger.error("unrecognised DSI serial number: '%s'." % cmd.dsi_serial)
         exit(2)
@@ -44,6 +44,9 @@ from scs_core.model.model_map import ModelMap
 
 from scs_core.sys.logging import Logging
 
+from scs_host.sys.host import Host
+
+from scs_mfr.calib.calib_cache import CalibCache
 from scs_mfr.cmd.cmd_provision_service_scs import CmdProvisionServiceSCS
 from scs_mfr.provision.provision_scs import ProvisionSCS
 
@@ -74,6 +77,8 @@ if __name__ == '__main__':
     provision = ProvisionSCS(model_map=cmd.model_map, verbose=cmd.verbose)
     logger.info(provision)
 
+    calib_cache = CalibCache(Host)
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # validation...
@@ -82,14 +87,14 @@ if __name__ == '__main__':
 
     try:
         if cmd.afe_serial is not None:
-            AFECalib.download(cmd.afe_serial, parse=False)
+            calib_cache.download(AFECalib, cmd.afe_serial, parse=False)
     except HTTPNotFoundException:
         logger.error("unrecognised AFE serial number: '%s'." % cmd.afe_serial)
         exit(2)
 
     try:
         if cmd.dsi_serial is not None:
-            DSICalib.download(cmd.dsi_serial, parse=False)
+            calib_cache.download(DSICalib, cmd.dsi_serial, parse=False)
     except HTTPNotFoundException:
         logger.error("unrecognised DSI serial number: '%s'." % cmd.dsi_serial)
         exit(2)
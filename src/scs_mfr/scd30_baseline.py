@@ -13,6 +13,8 @@ The date / time of any change is recorded.
 
 Note that the scs_dev/gasses_sampler process must be restarted for changes to take effect.
 
+Every change of offset is also appended to the device's baseline history - see scs_mfr/baseline_history.
+
 SYNOPSIS
 scd30_baseline.py [{ { { -s | -o } VALUE | -c CORRECT REPORTED } [-t TEMP -m HUMID [-p PRESS]] | -z  | -d }] [-v]
 
@@ -23,10 +25,12 @@ DOCUMENT EXAMPLE
 {"CO2": {"calibrated-on": "2022-03-21T12:46:52Z", "offset": 321, "env": {"hmd": 54.3, "tmp": 21.3, "pA": 99.6}}}
 
 FILES
-~/SCS/conf/baseline.json
+~/SCS/conf/scd30_baseline.json
+~/SCS/conf/baseline_history/scd30_CO2.bhr
 
 SEE ALSO
 scs_dev/gases_sampler
+scs_mfr/baseline_history
 scs_mfr/scd30_conf
 """
 
@@ -43,6 +47,7 @@ from scs_core.sys.logging import Logging
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.baseline.baseline_history import BaselineHistory
 from scs_mfr.cmd.cmd_scd30_baseline import CmdSCD30Baseline
 
 
@@ -76,6 +81,7 @@ if __name__ == '__main__':
         # resources...
 
         baseline = SCD30Baseline.load(Host)
+        history = BaselineHistory(Host, 'scd30')
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -105,13 +111,19 @@ if __name__ == '__main__':
             print("baseline: %s" % baseline)
             baseline.save(Host)
 
+            history.append('CO2', old_offset, baseline.sensor_baseline)
+
             logger.info("was: %s now: %s" % (old_offset, new_offset))
 
         # zero...
         elif cmd.zero:
+            old_offset = 0 if baseline is None else baseline.sensor_baseline.offset
+
             baseline = SCD30Baseline(SensorBaseline(now, 0))
             baseline.save(Host)
 
+            history.append('CO2', old_offset, baseline.sensor_baseline)
+
         # delete...
         if cmd.delete:
             SCD30Baseline.delete(Host)
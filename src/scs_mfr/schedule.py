@@ -23,16 +23,34 @@ averaged data.
 
 Note that the ssc_dev_/scheduler process must be restarted for changes to take effect.
 
+The --analyse flag is used to report the combined load of the schedule. The scheduler aligns each sampler to its own
+interval, so the firing timeline is built over the hyperperiod of the intervals (or one day, if this is longer). The
+report gives the worst-case number of samplers that fire within WINDOW seconds of one another, both as scheduled and
+with suggested phase offsets, and estimates of the messages and bytes published per hour. Offsets are advisory - the
+scheduler does not currently apply them - and bytes are estimated from the typical document size for each sampler.
+
 SYNOPSIS
-schedule.py [{-s NAME INTERVAL TALLY | -r NAME }] [-v]
+schedule.py [{-s NAME INTERVAL TALLY | -r NAME | -a [-w WINDOW] }] [-v]
 
 EXAMPLES
 ./schedule.py -s scs-climate 10.0 1
 
+./schedule.py -a -w 2
+
 DOCUMENT EXAMPLE
 {"scs-climate": {"interval": 60.0, "tally": 1}, "scs-gases": {"interval": 10.0, "tally": 1},
 "scs-particulates": {"interval": 10.0, "tally": 1}, "scs-status": {"interval": 60.0, "tally": 1}}
 
+DOCUMENT EXAMPLE - ANALYSIS
+{"hyperperiod": 60.0, "horizon": 60.0, "window": 1.0, "items": {"scs-climate": {"interval": 60.0, "tally": 1,
+"firings": 1, "messages-per-hour": 60.0, "bytes-per-hour": 18000, "offset": 2.0}, "scs-gases": {"interval": 10.0,
+"tally": 1, "firings": 6, "messages-per-hour": 360.0, "bytes-per-hour": 216000, "offset": 0.0},
+"scs-particulates": {"interval": 10.0, "tally": 1, "firings": 6, "messages-per-hour": 360.0,
+"bytes-per-hour": 324000, "offset": 1.0}, "scs-status": {"interval": 60.0, "tally": 1, "firings": 1,
+"messages-per-hour": 60.0, "bytes-per-hour": 72000, "offset": 3.0}}, "worst-case": {"concurrent": 4,
+"occurrences": 1, "at": [0.0]}, "suggested-worst-case": {"concurrent": 1, "occurrences": 6, "at": [0.0, 10.0, 20.0]},
+"messages-per-hour": 840.0, "bytes-per-hour": 630000, "mbytes-per-month": 453.6}
+
 FILES
 ~/SCS/conf/schedule.json
 
@@ -53,6 +71,7 @@ from scs_core.sync.schedule import ScheduleItem
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_schedule import CmdSchedule
+from scs_mfr.sys.schedule_analysis import ScheduleAnalysis
 
 
 # TODO: implement tally / averaging functionality on sampling processes
@@ -98,4 +117,13 @@ if __name__ == '__main__':
         schedule.clear(cmd.name)
         schedule.save(Host)
 
+    if cmd.analyse:
+        analysis = ScheduleAnalysis(schedule, window=cmd.window)
+
+        if cmd.verbose:
+            print("schedule: %s" % analysis, file=sys.stderr)
+
+        print(JSONify.dumps(analysis.report()))
+        exit(0)
+
     print(JSONify.dumps(schedule))
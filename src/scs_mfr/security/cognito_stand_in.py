@@ -0,0 +1,257 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A local HTTP stand-in for the Cognito device creator, login and introspection APIs, for testing batch registration
+without touching the Cognito devices pool. The stand-in serves on the loopback interface, holds its devices in memory,
+and may be made to fail a given fraction of requests with 503 Service Unavailable.
+
+The CognitoStandInClient provides the create, device_login and find_self methods of the scs_core clients.
+"""
+
+import json
+import random
+import threading
+
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from scs_core.aws.client.api_client import APIClient
+from scs_core.aws.security.cognito_authentication import AuthenticationResult, AuthenticationStatus
+from scs_core.aws.security.cognito_device import CognitoDeviceIdentity
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CognitoStandIn(object):
+    """
+    classdocs
+    """
+
+    __TOKEN_PREFIX = 'stand-in:'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, existing=(), failure_rate=0.0):
+        """
+        Constructor
+        """
+        self.__failure_rate = float(failure_rate)           # float 0.0 - 1.0
+
+        self.__devices = OrderedDict()                      # dict of tag: CognitoDeviceIdentity
+        self.__lock = threading.Lock()
+
+        for identity in existing:
+            self.__add(identity)
+
+        self.__server = None                                # ThreadingHTTPServer
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.__server.stand_in = self
+
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+
+
+    def stop(self):
+        if self.__server is None:
+            return
+
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__server = None
+
+
+    def client(self):
+        return CognitoStandInClient(self.url)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_failing(self):
+        return random.random() < self.__failure_rate
+
+
+    def create(self, jdict):
+        identity = CognitoDeviceIdentity.construct_from_jdict(jdict)
+
+        with self.__lock:
+            if identity.tag in self.__devices:
+                return None
+
+            return self.__add(identity)
+
+
+    def login(self, jdict):
+        with self.__lock:
+            identity = self.__devices.get(jdict.get('username'))
+
+        if identity is None or identity.password != jdict.get('password'):
+            return None
+
+        return self.__TOKEN_PREFIX + identity.tag
+
+
+    def find(self, token):
+        if token is None or not token.startswith(self.__TOKEN_PREFIX):
+            return None
+
+        with self.__lock:
+            return self.__devices.get(token[len(self.__TOKEN_PREFIX):])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __add(self, identity):
+        now = LocalizedDatetime.now().utc()
+        identity = CognitoDeviceIdentity(identity.tag, password=identity.password,
+                                         invoice_number=identity.invoice_number, created=now, last_updated=now)
+
+        self.__devices[identity.tag] = identity
+
+        return identity
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def url(self):
+        return None if self.__server is None else 'http://127.0.0.1:%s' % self.__server.server_address[1]
+
+
+    @property
+    def devices(self):
+        with self.__lock:
+            return list(self.__devices.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CognitoStandIn:{url:%s, failure_rate:%s, devices:%s}" % \
+               (self.url, self.__failure_rate, len(self.devices))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    request handler for CognitoStandIn
+    """
+
+    def do_GET(self):
+        stand_in = self.server.stand_in
+
+        if stand_in.is_failing():
+            return self.__respond(503, {"message": "Service Unavailable"})
+
+        if self.path != '/self':
+            return self.__respond(404, {"message": "Not Found"})
+
+        identity = stand_in.find(self.headers.get('Token'))
+
+        if identity is None:
+            return self.__respond(401, {"message": "Unauthorized"})
+
+        self.__respond(200, CognitoDeviceIdentity(identity.tag, invoice_number=identity.invoice_number,
+                                                  created=identity.created, last_updated=identity.last_updated))
+
+
+    def do_POST(self):
+        stand_in = self.server.stand_in
+        jdict = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or 'null')
+
+        if stand_in.is_failing():
+            return self.__respond(503, {"message": "Service Unavailable"})
+
+        if self.path == '/creator':
+            identity = stand_in.create(jdict)
+
+            if identity is None:
+                return self.__respond(409, {"message": "Conflict"})
+
+            return self.__respond(200, CognitoDeviceIdentity(identity.tag, invoice_number=identity.invoice_number,
+                                                             created=identity.created,
+                                                             last_updated=identity.last_updated))
+
+        if self.path == '/login/device':
+            token = stand_in.login(jdict)
+
+            if token is None:
+                return self.__respond(200, {"authentication-status": AuthenticationStatus.InvalidCredentials.name})
+
+            session = {"AccessToken": token, "ExpiresIn": 3600, "TokenType": "Bearer", "IdToken": token}
+
+            return self.__respond(200, {"authentication-status": AuthenticationStatus.Ok.name,
+                                        "content": {"AuthenticationResult": session}})
+
+        self.__respond(404, {"message": "Not Found"})
+
+
+    def log_message(self, *args):
+        pass
+
+
+    def __respond(self, status, body):
+        content = JSONify.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+
+        self.wfile.write(content)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CognitoStandInClient(APIClient):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, url):
+        super().__init__()
+
+        self.__url = url                                    # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def create(self, identity: CognitoDeviceIdentity):
+        response = requests.post(self.__url + '/creator', headers=self._auth_headers(), data=JSONify.dumps(identity))
+        self._check_response(response)
+
+        return CognitoDeviceIdentity.construct_from_jdict(response.json())
+
+
+    def device_login(self, credentials):
+        response = requests.post(self.__url + '/login/device', headers=self._auth_headers(),
+                                 json=credentials.as_json())
+        self._check_response(response)
+
+        return AuthenticationResult.construct_from_res(response)
+
+
+    def find_self(self, token):
+        response = requests.get(self.__url + '/self', headers=self._token_headers(token))
+        self._check_response(response)
+
+        return CognitoDeviceIdentity.construct_from_jdict(response.json())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CognitoStandInClient:{url:%s}" % self.__url
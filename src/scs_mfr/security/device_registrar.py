@@ -0,0 +1,275 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Registers a batch of devices in the Cognito devices pool, with a bounded number of registrations in flight.
+
+Registration is idempotent: if a device is already known to Cognito, it is logged in with the given credentials and
+its invoice number is checked - if both match, the registration is reported as Exists, and is successful. Transient
+HTTP errors, and connection errors, are retried with exponential backoff.
+
+The creator, login manager and introspector are normally the scs_core CognitoDeviceCreator, CognitoLoginManager and
+CognitoDeviceIntrospector - any objects with their create, device_login and find_self methods may be used.
+
+A manifest may be written as CSV with a header row, or as JSON lines, with the fields username, password and invoice.
+
+example JSON:
+{"username": "scs-bbe-401", "invoice": "INV-0000", "status": "Created", "attempts": 1, "elapsed": 0.412}
+"""
+
+import csv
+import json
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_core.aws.security.cognito_device import CognitoDeviceCredentials, CognitoDeviceIdentity
+
+from scs_core.client.http_exception import HTTPException, HTTPConflictException
+
+from scs_core.data.json import JSONable
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+from scs_mfr.sys.backoff import Backoff
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeviceRegistrar(object):
+    """
+    classdocs
+    """
+
+    CREATED = 'Created'
+    EXISTS = 'Exists'
+    MISMATCH = 'Mismatch'
+    INVALID = 'Invalid'
+    FAILED = 'Failed'
+
+    DEFAULT_CONCURRENCY = 8
+    DEFAULT_MAX_ATTEMPTS = 5
+
+    TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def read_manifest(lines):
+        lines = [line for line in lines if line.strip()]
+
+        if not lines:
+            return []
+
+        if lines[0].strip().startswith('{'):
+            jdicts = [json.loads(line) for line in lines]
+        else:
+            jdicts = list(csv.DictReader(lines))
+
+        return [CognitoDeviceIdentity.construct_from_jdict(jdict) for jdict in jdicts if jdict]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, creator, login_manager, introspector, concurrency=None, max_attempts=None):
+        """
+        Constructor
+        """
+        self.__creator = creator                            # CognitoDeviceCreator
+        self.__login_manager = login_manager                # CognitoLoginManager
+        self.__introspector = introspector                  # CognitoDeviceIntrospector
+
+        self.__concurrency = self.DEFAULT_CONCURRENCY if concurrency is None else int(concurrency)
+        self.__max_attempts = self.DEFAULT_MAX_ATTEMPTS if max_attempts is None else int(max_attempts)
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def register(self, identities):
+        with ThreadPoolExecutor(max_workers=self.__concurrency) as executor:
+            for registration in executor.map(self.__register, identities):
+                yield registration
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __register(self, identity):
+        attempts = _Attempts(self.__max_attempts)
+        timer = Timer()
+
+        if not CognitoDeviceIdentity.is_valid_tag(identity.tag):
+            return DeviceRegistration(identity, self.INVALID, 0, timer.total(), error="invalid device tag")
+
+        if not CognitoDeviceIdentity.is_valid_password(identity.password):
+            return DeviceRegistration(identity, self.INVALID, 0, timer.total(), error="invalid password")
+
+        try:
+            try:
+                attempts.call(self.__creator.create, identity)
+                status, error = self.CREATED, None
+
+            except HTTPConflictException:
+                status, error = self.__check_existing(identity, attempts)
+
+        except (HTTPException, OSError) as ex:
+            status, error = self.FAILED, repr(ex)
+
+        registration = DeviceRegistration(identity, status, attempts.count, timer.total(), error=error)
+        self.__logger.info(registration)
+
+        return registration
+
+
+    def __check_existing(self, identity, attempts):
+        credentials = CognitoDeviceCredentials(identity.tag, identity.password)
+        result = attempts.call(self.__login_manager.device_login, credentials)
+
+        if not result.is_ok():
+            return self.MISMATCH, "existing device: %s" % result.authentication_status.description
+
+        existing = attempts.call(self.__introspector.find_self, result.id_token)
+
+        if existing.invoice_number != identity.invoice_number:
+            return self.MISMATCH, "existing device: invoice %s" % existing.invoice_number
+
+        return self.EXISTS, None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def concurrency(self):
+        return self.__concurrency
+
+
+    @property
+    def max_attempts(self):
+        return self.__max_attempts
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeviceRegistrar:{creator:%s, login_manager:%s, introspector:%s, concurrency:%s, max_attempts:%s}" % \
+               (self.__creator.__class__.__name__, self.__login_manager.__class__.__name__,
+                self.__introspector.__class__.__name__, self.concurrency, self.max_attempts)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class _Attempts(object):
+    """
+    calls to remote services for a single device, retried with backoff on transient errors
+    """
+
+    def __init__(self, max_attempts):
+        self.__max_attempts = max_attempts                  # int
+        self.__backoff = Backoff()                          # Backoff
+
+        self.count = 0                                      # int total attempts
+
+
+    def call(self, method, *args):
+        self.__backoff.reset()
+
+        for attempt in range(1, self.__max_attempts + 1):
+            self.count += 1
+
+            try:
+                return method(*args)
+
+            except HTTPException as ex:
+                if ex.status not in DeviceRegistrar.TRANSIENT_STATUSES or attempt == self.__max_attempts:
+                    raise
+
+            except OSError:
+                if attempt == self.__max_attempts:
+                    raise
+
+            self.__backoff.sleep()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeviceRegistration(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, identity, status, attempts, elapsed, error=None):
+        """
+        Constructor
+        """
+        self.__identity = identity                          # CognitoDeviceIdentity
+        self.__status = status                              # string
+        self.__attempts = attempts                          # int
+        self.__elapsed = elapsed                            # float seconds
+        self.__error = error                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_successful(self):
+        return self.status in (DeviceRegistrar.CREATED, DeviceRegistrar.EXISTS)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['username'] = self.tag
+        jdict['invoice'] = self.invoice_number
+        jdict['status'] = self.status
+        jdict['attempts'] = self.attempts
+        jdict['elapsed'] = self.elapsed
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__identity.tag
+
+
+    @property
+    def invoice_number(self):
+        return self.__identity.invoice_number
+
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    @property
+    def attempts(self):
+        return self.__attempts
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeviceRegistration:{tag:%s, invoice_number:%s, status:%s, attempts:%s, elapsed:%s, error:%s}" % \
+               (self.tag, self.invoice_number, self.status, self.attempts, self.elapsed, self.error)
@@ -0,0 +1,225 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A device-local cache of the Cognito ID token and the AWS access key obtained with it, so that a sequence of
+provisioning utilities performs the device login and the access key request only once, rather than once per utility.
+
+The session is bound to the device's credentials by digest - if the system ID or shared secret change, the session is
+discarded. The session is also discarded when the ID token is within the safety margin of its expiry time, or when a
+fresh login is requested. The file is readable and writable by its owner only.
+
+example JSON:
+{"credentials": "2c6a...", "id-token": "eyJraWQ...", "expires": "2026-10-19T13:51:12Z",
+"access-key": {"key-id": "ABC", "secret-key": "123"}}
+"""
+
+import hashlib
+import os
+
+from collections import OrderedDict
+
+from scs_core.aws.client.access_key import AccessKey
+from scs_core.aws.security.access_key_manager import AccessKeyManager
+from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import PersistentJSONable
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeviceSessionException(RuntimeError):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, authentication_status):
+        """
+        Constructor
+        """
+        super().__init__(authentication_status.description)
+
+        self.__authentication_status = authentication_status        # AuthenticationStatus
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def authentication_status(self):
+        return self.__authentication_status
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeviceSession(PersistentJSONable):
+    """
+    classdocs
+    """
+
+    DEFAULT_EXPIRES_IN = 3600                       # seconds           Cognito default ID token lifetime
+    EXPIRY_MARGIN = 300                             # seconds           time left for a utility to use the token
+
+    __FILENAME = "device_session.json"
+
+    __MODE = 0o600
+
+    @classmethod
+    def persistence_location(cls):
+        return cls.aws_dir(), cls.__FILENAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def credentials_digest(credentials):
+        text = ':'.join((str(credentials.tag), str(credentials.password)))
+
+        return hashlib.sha256(text.encode()).hexdigest()
+
+
+    @classmethod
+    def authenticate(cls, manager, credentials, refresh=False):
+        logger = Logging.getLogger()
+
+        try:
+            session = None if refresh else cls.load(manager)
+        except (OSError, ValueError):                       # unreadable or corrupt cache
+            session = None
+
+        if session is not None and session.is_valid(credentials):
+            logger.info("session: cached until %s" % session.expires.as_iso8601())
+            return session
+
+        # login...
+        auth = CognitoLoginManager().device_login(credentials)
+
+        if not auth.is_ok():
+            cls.delete(manager)
+            raise DeviceSessionException(auth.authentication_status)
+
+        expires_in = auth.content.expires_in
+
+        if expires_in is None:
+            expires_in = cls.DEFAULT_EXPIRES_IN
+
+        expires = LocalizedDatetime.now().utc().timedelta(seconds=int(expires_in) - cls.EXPIRY_MARGIN)
+
+        session = cls(cls.credentials_digest(credentials), auth.id_token, expires)
+        session.cache(manager)
+
+        logger.info("session: new until %s" % session.expires.as_iso8601())
+
+        return session
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return None
+
+        credentials = jdict.get('credentials')
+        id_token = jdict.get('id-token')
+        expires = LocalizedDatetime.construct_from_iso8601(jdict.get('expires'))
+        access_key = AccessKey.construct_from_jdict(jdict.get('access-key'))
+
+        return cls(credentials, id_token, expires, access_key=access_key)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, credentials, id_token, expires, access_key=None):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__credentials = credentials                    # string        digest of CognitoDeviceCredentials
+        self.__id_token = id_token                          # string
+        self.__expires = expires                            # LocalizedDatetime
+        self.__access_key = access_key                      # AccessKey
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def save(self, manager, encryption_key=None):
+        umask = os.umask(0o077)                             # temporary file must not be readable by others
+
+        try:
+            super().save(manager, encryption_key=encryption_key)
+
+            dirname, filename = self.persistence_location()
+            os.chmod(os.path.join(manager.scs_path(), dirname, filename), self.__MODE)
+
+        finally:
+            os.umask(umask)
+
+
+    def cache(self, manager):
+        try:
+            self.save(manager)
+        except OSError as ex:                               # eg. the cache was written by root
+            Logging.getLogger().warning("session not cached: %s" % repr(ex))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self, credentials):
+        if self.credentials != self.credentials_digest(credentials) or not self.id_token:
+            return False
+
+        return self.expires is not None and LocalizedDatetime.now() < self.expires
+
+
+    def access_key(self, manager):
+        if self.__access_key is None or not self.__access_key.ok():
+            self.__access_key = AccessKeyManager().get(self.id_token)
+            self.cache(manager)
+
+        return self.__access_key
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['credentials'] = self.credentials
+        jdict['id-token'] = self.id_token
+        jdict['expires'] = None if self.expires is None else self.expires.as_iso8601()
+
+        if self.__access_key is not None:
+            jdict['access-key'] = self.__access_key
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def credentials(self):
+        return self.__credentials
+
+
+    @property
+    def id_token(self):
+        return self.__id_token
+
+
+    @property
+    def expires(self):
+        return self.__expires
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeviceSession:{expires:%s, access_key:%s}" % \
+               (self.expires, None if self.__access_key is None else self.__access_key.id)
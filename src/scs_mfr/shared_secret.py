@@ -22,6 +22,7 @@ DOCUMENT EXAMPLE
 {"key": "########"}
 
 FILES
+~/SCS/aws/device_session.json
 ~/SCS/conf/shared_secret.conf
 
 SEE ALSO
@@ -33,7 +34,6 @@ import sys
 from scs_core.aws.security.cognito_device import CognitoDeviceCredentials
 from scs_core.aws.security.cognito_device_finder import CognitoDeviceIntrospector
 from scs_core.aws.security.cognito_device_manager import CognitoDeviceManager
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.data.json import JSONify
 
@@ -43,13 +43,14 @@ from scs_core.sys.shared_secret import SharedSecret
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_shared_secret import CmdSharedSecret
+from scs_mfr.security.device_session import DeviceSession, DeviceSessionException
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    auth = None
+    session = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
@@ -74,7 +75,6 @@ if __name__ == '__main__':
     secret = SharedSecret.load(Host)
 
     # CognitoDeviceCredentials...
-    gatekeeper = CognitoLoginManager()
     finder = CognitoDeviceIntrospector()
 
     # CognitoDeviceManager...
@@ -88,9 +88,9 @@ if __name__ == '__main__':
         credentials = CognitoDeviceCredentials.load_credentials_for_device(Host, strict=False)
 
         if credentials:
-            auth = gatekeeper.device_login(credentials)
-
-            if not auth.is_ok():
+            try:
+                session = DeviceSession.authenticate(Host, credentials)
+            except DeviceSessionException:
                 logger.error("existing credentials are invalid, so the Cognito record cannot be updated.")
                 exit(1)
 
@@ -104,11 +104,15 @@ if __name__ == '__main__':
 
         if not cmd.ignore_credentials:
             new_credentials = CognitoDeviceCredentials.load_credentials_for_device(Host)
-            manager.update_self(auth.id_token, new_credentials)
+            manager.update_self(session.id_token, new_credentials)
+
+        DeviceSession.delete(Host)                          # the session belongs to the old credentials
 
     if cmd.delete and secret is not None:
         secret.delete(Host)
         secret = None
 
+        DeviceSession.delete(Host)
+
     if secret:
         print(JSONify.dumps(secret))
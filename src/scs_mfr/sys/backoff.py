@@ -0,0 +1,93 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Exponential backoff with jitter, for polling and retrying remote services. Each interval is drawn uniformly from the
+upper (1 - jitter) fraction of the current ceiling, so that many clients started together do not poll in lockstep.
+The ceiling starts at initial and is multiplied by factor after each interval, up to maximum.
+
+https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+"""
+
+import random
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Backoff(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_INITIAL = 0.5                           # seconds
+    DEFAULT_MAXIMUM = 10.0                          # seconds
+    DEFAULT_FACTOR = 2.0
+    DEFAULT_JITTER = 0.5
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, initial=None, maximum=None, factor=None, jitter=None):
+        """
+        Constructor
+        """
+        self.__initial = self.DEFAULT_INITIAL if initial is None else float(initial)        # float seconds
+        self.__maximum = self.DEFAULT_MAXIMUM if maximum is None else float(maximum)        # float seconds
+        self.__factor = self.DEFAULT_FACTOR if factor is None else float(factor)            # float
+        self.__jitter = self.DEFAULT_JITTER if jitter is None else float(jitter)            # float 0.0 - 1.0
+
+        self.__ceiling = self.__initial                                                     # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def reset(self):
+        self.__ceiling = self.__initial
+
+
+    def interval(self):
+        ceiling = self.__ceiling
+        self.__ceiling = min(self.__ceiling * self.__factor, self.__maximum)
+
+        return random.uniform(ceiling * (1.0 - self.__jitter), ceiling)
+
+
+    def sleep(self, deadline=None):
+        interval = self.interval()
+
+        if deadline is not None:                        # deadline is time.monotonic() seconds
+            interval = max(min(interval, deadline - time.monotonic()), 0.0)
+
+        time.sleep(interval)
+
+        return interval
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def initial(self):
+        return self.__initial
+
+
+    @property
+    def maximum(self):
+        return self.__maximum
+
+
+    @property
+    def factor(self):
+        return self.__factor
+
+
+    @property
+    def jitter(self):
+        return self.__jitter
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Backoff:{initial:%s, maximum:%s, factor:%s, jitter:%s, ceiling:%s}" % \
+               (self.initial, self.maximum, self.factor, self.jitter, self.__ceiling)
@@ -0,0 +1,84 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compiles the Python sources of a repo to byte-code, so that the first run of each utility after a git pull does not
+pay for compilation on the device's SD card, or fail to cache byte-code in a directory that is not writable by the
+user running it.
+
+By default, the .pyc files use checked-hash invalidation (PEP 552) - a .pyc is used if its source hash matches, and is
+not invalidated by the file timestamps that git sets on checkout.
+"""
+
+import compileall
+import os
+import py_compile
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.timer import Timer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BytecodeCompiler(object):
+    """
+    classdocs
+    """
+
+    CHECKED_HASH = py_compile.PycInvalidationMode.CHECKED_HASH
+    TIMESTAMP = py_compile.PycInvalidationMode.TIMESTAMP
+
+    DEFAULT_WORKERS = 1                             # compileall worker processes - 0 for one per CPU
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def source_dir(repo_path):
+        src = os.path.join(repo_path, 'src')
+
+        return src if os.path.isdir(src) else repo_path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, invalidation_mode=None, workers=None):
+        """
+        Constructor
+        """
+        self.__invalidation_mode = self.CHECKED_HASH if invalidation_mode is None else invalidation_mode
+        self.__workers = self.DEFAULT_WORKERS if workers is None else int(workers)
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def compile(self, repo_path):
+        path = self.source_dir(repo_path)
+        timer = Timer()
+
+        success = compileall.compile_dir(path, quiet=1, workers=self.workers,
+                                         invalidation_mode=self.invalidation_mode)
+
+        self.__logger.info("%s: compiled in %0.1f seconds" % (path, timer.total()))
+
+        return bool(success)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def invalidation_mode(self):
+        return self.__invalidation_mode
+
+
+    @property
+    def workers(self):
+        return self.__workers
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BytecodeCompiler:{invalidation_mode:%s, workers:%s}" % (self.invalidation_mode.name, self.workers)
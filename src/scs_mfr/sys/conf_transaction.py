@@ -0,0 +1,218 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A persistence manager that stages the saves and removes of PersistentJSONable documents, and commits them as a batch.
+A ConfTransaction may be passed anywhere a Host is expected - for example, to Configuration.save(..) - and documents
+saved or removed in the transaction are seen by subsequent loads from it.
+
+On commit, every staged document is written to a temporary file beside its target. The written data is flushed to
+storage with a single sync, rather than with one fsync per document. The temporary files are then renamed over their
+targets, the staged removes are made, and each affected directory is fsynced once. If anything fails before the
+renames - for example, a document is invalid and the transaction is not committed, or the SD card is full - no
+document is changed.
+
+Used as a context manager, the transaction is committed if the block completes, and discarded if it raises.
+
+example:
+with ConfTransaction(Host) as transaction:
+    schedule.save(transaction)
+    GasModelConf.delete(transaction)
+"""
+
+import os
+
+from collections import OrderedDict
+
+from scs_core.sys.filesystem import Filesystem
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfTransaction(object):
+    """
+    classdocs
+    """
+
+    __TMP_SUFFIX = 'tmp'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager):
+        """
+        Constructor
+        """
+        self.__manager = manager                            # Host
+        self.__staged = OrderedDict()                       # dict of (dirname, filename): (text, key) or None
+
+        self.__logger = Logging.getLogger()
+
+
+    def __getattr__(self, name):
+        return getattr(self.__manager, name)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+    def __len__(self):
+        return len(self.__staged)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # PersistenceManager...
+
+    def list(self, container, dirname):
+        items = set(self.__manager.list(container, dirname))
+
+        if container != self.__manager.scs_path():
+            return sorted(items)
+
+        for (staged_dirname, filename), staged in self.__staged.items():
+            if staged_dirname != dirname:
+                continue
+
+            if staged is None:
+                items.discard(filename)
+            else:
+                items.add(filename)
+
+        return sorted(items)
+
+
+    def exists(self, dirname, filename):
+        if (dirname, filename) in self.__staged:
+            return self.__staged[(dirname, filename)] is not None
+
+        return self.__manager.exists(dirname, filename)
+
+
+    def load(self, dirname, filename, encryption_key=None):
+        if (dirname, filename) not in self.__staged:
+            return self.__manager.load(dirname, filename, encryption_key=encryption_key)
+
+        staged = self.__staged[(dirname, filename)]
+
+        if staged is None:
+            return None, None
+
+        text, staged_key = staged
+
+        if encryption_key != staged_key:
+            raise ValueError("encryption key mismatch for staged document: %s" % filename)
+
+        return text, None
+
+
+    def save(self, text, dirname, filename, encryption_key=None):
+        self.__staged[(dirname, filename)] = (text, encryption_key)
+
+
+    def remove(self, dirname, filename):
+        self.__staged[(dirname, filename)] = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def commit(self):
+        if not self.__staged:
+            return
+
+        written = OrderedDict()                             # dict of abs_filename: tmp_filename
+        removed = []                                        # list of abs_filename
+        directories = set()
+
+        try:
+            for (dirname, filename), staged in self.__staged.items():
+                abs_dirname = os.path.join(self.__manager.scs_path(), dirname)
+                abs_filename = os.path.join(abs_dirname, filename)
+
+                directories.add(abs_dirname)
+
+                if staged is None:
+                    removed.append(abs_filename)
+                    continue
+
+                Filesystem.mkdir(abs_dirname)
+
+                tmp_filename = '.'.join((abs_filename, str(os.getpid()), self.__TMP_SUFFIX))
+                written[abs_filename] = tmp_filename
+
+                with open(tmp_filename, "w") as f:
+                    f.write(self.__saved_text(*staged))
+
+            os.sync()                                       # one flush for all the documents
+
+        except BaseException:
+            for tmp_filename in written.values():
+                self.__discard(tmp_filename)
+
+            raise
+
+        # atomic operations...
+        for abs_filename, tmp_filename in written.items():
+            os.replace(tmp_filename, abs_filename)
+
+        for abs_filename in removed:
+            self.__discard(abs_filename)
+
+        for abs_dirname in directories:
+            self.__sync_dir(abs_dirname)
+
+        self.__logger.info("committed: saved: %s removed: %s" % (len(written), len(removed)))
+
+        self.__staged = OrderedDict()
+
+
+    def rollback(self):
+        self.__staged = OrderedDict()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __saved_text(text, encryption_key):
+        if not encryption_key:
+            return text + '\n'                              # as FilesystemPersistenceManager
+
+        from scs_core.data.crypt import Crypt                                           # late import
+
+        return Crypt.encrypt(encryption_key, text)
+
+
+    @staticmethod
+    def __discard(abs_filename):
+        try:
+            os.remove(abs_filename)
+        except FileNotFoundError:
+            pass
+
+
+    @staticmethod
+    def __sync_dir(abs_dirname):
+        try:
+            fd = os.open(abs_dirname, os.O_RDONLY)
+        except FileNotFoundError:                           # only removes were staged for a missing directory
+            return
+
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfTransaction:{manager:%s, staged:%s}" % \
+               (self.__manager, ['/'.join(key) for key in self.__staged])
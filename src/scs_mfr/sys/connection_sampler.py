@@ -0,0 +1,229 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Keeps a rolling window of modem connection samples - state and signal quality - in a fixed-size ring buffer, and
+summarises the window as a ConnectionStats report. A dropout is a transition from the connected state to any other
+state within the window. Samples for which the modem could not be queried are held in the unavailable state.
+
+example JSON:
+{"rec": "2026-10-19T09:01:12Z", "samples": 60, "connected": 0.95, "quality": {"min": 18, "mean": 31.4, "max": 40},
+"dropouts": 1, "states": {"connected": 57, "searching": 3}}
+"""
+
+from collections import deque, OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+from scs_core.sys.modem import ModemConnection
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConnectionSampler(object):
+    """
+    classdocs
+    """
+
+    CONNECTED_STATE = 'connected'
+
+    DEFAULT_WINDOW = 60                             # samples
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, window=None):
+        """
+        Constructor
+        """
+        self.__samples = deque(maxlen=self.DEFAULT_WINDOW if window is None else int(window))     # (state, quality)
+
+
+    def __len__(self):
+        return len(self.__samples)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, connection):
+        if connection is None:
+            connection = ModemConnection.null_datum()
+
+        quality = None if connection.signal is None else connection.signal.quality
+
+        self.__samples.append((connection.state, quality))
+
+
+    def stats(self):
+        states = OrderedDict()
+        qualities = []
+        dropouts = 0
+        previous = None
+
+        for state, quality in self.__samples:
+            states[state] = states.get(state, 0) + 1
+
+            if quality is not None:
+                qualities.append(quality)
+
+            if previous == self.CONNECTED_STATE and state != self.CONNECTED_STATE:
+                dropouts += 1
+
+            previous = state
+
+        connected = states.get(self.CONNECTED_STATE, 0) / len(self) if len(self) else None
+        quality = QualityStats.construct_from_values(qualities)
+
+        return ConnectionStats(LocalizedDatetime.now().utc(), len(self), connected, quality, dropouts, states)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def window(self):
+        return self.__samples.maxlen
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConnectionSampler:{window:%s, samples:%s}" % (self.window, len(self))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConnectionStats(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rec, samples, connected, quality, dropouts, states):
+        """
+        Constructor
+        """
+        self.__rec = rec                                    # LocalizedDatetime
+        self.__samples = samples                            # int
+        self.__connected = connected                        # float 0.0 - 1.0       fraction of samples
+        self.__quality = quality                            # QualityStats
+        self.__dropouts = dropouts                          # int
+        self.__states = states                              # dict of state: int count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['rec'] = self.rec.as_iso8601()
+        jdict['samples'] = self.samples
+        jdict['connected'] = None if self.connected is None else round(self.connected, 3)
+        jdict['quality'] = self.quality
+        jdict['dropouts'] = self.dropouts
+        jdict['states'] = self.states
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def samples(self):
+        return self.__samples
+
+
+    @property
+    def connected(self):
+        return self.__connected
+
+
+    @property
+    def quality(self):
+        return self.__quality
+
+
+    @property
+    def dropouts(self):
+        return self.__dropouts
+
+
+    @property
+    def states(self):
+        return self.__states
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConnectionStats:{rec:%s, samples:%s, connected:%s, quality:%s, dropouts:%s, states:%s}" % \
+               (self.rec, self.samples, self.connected, self.quality, self.dropouts, self.states)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class QualityStats(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_values(cls, values):
+        if not values:
+            return None
+
+        return cls(min(values), sum(values) / len(values), max(values))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, minimum, mean, maximum):
+        """
+        Constructor
+        """
+        self.__min = minimum                                # int
+        self.__mean = mean                                  # float
+        self.__max = maximum                                # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['min'] = self.min
+        jdict['mean'] = round(self.mean, 1)
+        jdict['max'] = self.max
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def min(self):
+        return self.__min
+
+
+    @property
+    def mean(self):
+        return self.__mean
+
+
+    @property
+    def max(self):
+        return self.__max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "QualityStats:{min:%s, mean:%s, max:%s}" % (self.min, self.mean, self.max)
@@ -0,0 +1,362 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A cached snapshot of the modem model, connection and SIM reports, so that utilities do not drive ModemManager AT
+commands every time they run - querying the modem can take several seconds, or fail while the modem is busy.
+
+Each report is stored with the time at which it was read. The modem model and SIM reports rarely change, and are held
+for ttl seconds; the connection report is held for CONNECTION_TTL seconds. Stale reports are refreshed in a background
+thread, started by refresh(), so that the caller can proceed with other work. Sections that are requested while
+the thread is running are queued for it. When a stale report is requested, the
+refresh is awaited for up to wait seconds - after that, or if the modem does not respond, the stale report is served.
+In live mode, every report is queried, the query is always awaited, and no cached report is served.
+
+ModemCachingManager presents the cache to code that expects a Host, such as Configuration.load(..).
+
+example JSON:
+{"modem": {"rec": "2026-10-19T09:01:12Z", "report": {"id": "3f07553c31ce11715037ac16c24ceddcfb6f7a0b",
+"imei": "867962041294151", "mfr": "QUALCOMM INCORPORATED", "rev": "EC21EFAR06A01M4G"}},
+"connection": {"rec": "2026-10-19T09:01:12Z", "report": {"state": "connected", "signal": {"quality": 34,
+"recent": true}}}, "sim": {"rec": "2026-10-19T09:01:12Z", "report": {"imsi": "234104886708567",
+"iccid": "8944110068257270054", "operator-code": "23410", "operator-name": "O2 - UK"}}}
+"""
+
+import threading
+
+from collections import deque, OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import PersistentJSONable
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.modem import Modem, ModemConnection, SIM as ModemSIM
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ModemSnapshot(PersistentJSONable):
+    """
+    classdocs
+    """
+
+    MODEM = 'modem'
+    CONNECTION = 'connection'
+    SIM = 'sim'
+
+    SECTIONS = OrderedDict(((MODEM, Modem), (CONNECTION, ModemConnection), (SIM, ModemSIM)))
+
+    __FILENAME = "modem_snapshot.json"
+
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), cls.__FILENAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return cls({}) if skeleton else None
+
+        sections = {}
+
+        for name, report_class in cls.SECTIONS.items():
+            section = jdict.get(name)
+
+            if not section:
+                continue
+
+            rec = LocalizedDatetime.construct_from_iso8601(section.get('rec'))
+            report = report_class.construct_from_jdict(section.get('report'))
+
+            if rec is not None and report is not None:
+                sections[name] = (rec, report)
+
+        return cls(sections)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sections):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__sections = sections                          # dict of name: (LocalizedDatetime, report)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def age(self, name):
+        if name not in self.__sections:
+            return float('inf')
+
+        rec, _ = self.__sections[name]
+
+        return LocalizedDatetime.now().timestamp() - rec.timestamp()
+
+
+    def report(self, name):
+        return self.__sections[name][1] if name in self.__sections else None
+
+
+    def update(self, name, report):
+        self.__sections[name] = (LocalizedDatetime.now().utc(), report)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        for name in self.SECTIONS:
+            if name not in self.__sections:
+                continue
+
+            rec, report = self.__sections[name]
+            jdict[name] = OrderedDict((('rec', rec.as_iso8601()), ('report', report)))
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ModemSnapshot:{sections:%s}" % \
+               {name: (rec.as_iso8601(), str(report)) for name, (rec, report) in self.__sections.items()}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ModemCache(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_TTL = 3600                              # seconds           modem model and SIM
+    CONNECTION_TTL = 30                             # seconds
+    DEFAULT_WAIT = 10.0                             # seconds           for a refresh, when a stale report is held
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager, ttl=None, live=False, wait=None):
+        """
+        Constructor
+        """
+        self.__manager = manager                            # Host
+        self.__ttl = self.DEFAULT_TTL if ttl is None else float(ttl)
+        self.__live = bool(live)                            # bool
+        self.__wait = self.DEFAULT_WAIT if wait is None else float(wait)
+
+        self.__queries = {ModemSnapshot.MODEM: manager.modem,
+                          ModemSnapshot.CONNECTION: manager.modem_conn,
+                          ModemSnapshot.SIM: manager.sim}
+
+        self.__snapshot = self.__load()                     # ModemSnapshot
+        self.__pending = deque()                            # section names awaiting the refresh thread
+        self.__refreshing = set()                           # set of section names      pending or being queried
+        self.__queried = set()                              # set of section names
+        self.__updated = set()                              # set of section names
+        self.__running = False                              # bool                      a refresh thread is running
+
+        self.__lock = threading.Lock()
+        self.__refreshed = threading.Condition(self.__lock)
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def refresh(self, *names):
+        names = names if names else tuple(ModemSnapshot.SECTIONS)
+        stale = [name for name in names if self.is_stale(name)]
+
+        with self.__lock:
+            stale = [name for name in stale if name not in self.__refreshing]
+
+            if not stale:
+                return
+
+            self.__pending.extend(stale)                    # a running thread takes these in turn
+            self.__refreshing.update(stale)
+
+            if self.__running:
+                return
+
+            self.__running = True
+
+        threading.Thread(target=self.__refresh, daemon=True).start()
+
+
+    def is_stale(self, name):
+        ttl = self.CONNECTION_TTL if name == ModemSnapshot.CONNECTION else self.ttl
+
+        with self.__lock:
+            if name in self.__queried:
+                return False
+
+            return self.live or self.__snapshot.age(name) >= ttl
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def modem(self):
+        return self.report(ModemSnapshot.MODEM)
+
+
+    def modem_conn(self):
+        return self.report(ModemSnapshot.CONNECTION)
+
+
+    def sim(self):
+        return self.report(ModemSnapshot.SIM)
+
+
+    def report(self, name):
+        self.refresh(name)                                  # queued behind any refresh that is running
+        self.__await(name)
+
+        with self.__lock:
+            if self.live and name not in self.__updated:
+                return None
+
+            return self.__snapshot.report(name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __await(self, name):
+        with self.__refreshed:
+            held = self.__snapshot.report(name) is not None
+            timeout = self.wait if held and not self.live else None
+
+            if not self.__refreshed.wait_for(lambda: name not in self.__refreshing, timeout):
+                self.__logger.warning("%s: modem busy - serving cached report" % name)
+
+
+    def __refresh(self):
+        try:
+            while True:
+                with self.__lock:
+                    if not self.__pending:
+                        self.__save()
+                        self.__running = False
+                        return
+
+                    name = self.__pending.popleft()
+
+                self.__refresh_section(name)
+
+        except BaseException:
+            with self.__refreshed:                          # waiters must not be stranded by a dead thread
+                self.__refreshing.difference_update(self.__pending)
+                self.__pending.clear()
+                self.__running = False
+                self.__refreshed.notify_all()
+
+            raise
+
+
+    def __refresh_section(self, name):
+        report = None
+
+        try:
+            report = self.__queries[name]()
+
+        except (OSError, ValueError) as ex:
+            self.__logger.warning("%s: %s" % (name, repr(ex)))
+
+        except Exception as ex:                             # the section must still be released
+            self.__logger.error("%s: %s" % (name, repr(ex)))
+
+        finally:
+            with self.__refreshed:
+                if report is not None:
+                    self.__snapshot.update(name, report)
+                    self.__updated.add(name)
+
+                self.__queried.add(name)
+                self.__refreshing.discard(name)
+                self.__refreshed.notify_all()
+
+
+    def __save(self):
+        try:
+            self.__snapshot.save(self.__manager)
+        except OSError as ex:                               # eg. the snapshot was written by root
+            self.__logger.warning("snapshot not cached: %s" % repr(ex))
+
+
+    def __load(self):
+        try:
+            return ModemSnapshot.load(self.__manager, skeleton=True)
+        except (OSError, ValueError):                       # unreadable or corrupt snapshot
+            return ModemSnapshot({})
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ttl(self):
+        return self.__ttl
+
+
+    @property
+    def live(self):
+        return self.__live
+
+
+    @property
+    def wait(self):
+        return self.__wait
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ModemCache:{ttl:%s, live:%s, wait:%s, snapshot:%s}" % \
+               (self.ttl, self.live, self.wait, self.__snapshot)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ModemCachingManager(object):
+    """
+    a Host whose modem, modem_conn and sim reports are served by a ModemCache
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager, cache):
+        """
+        Constructor
+        """
+        self.__manager = manager                            # Host
+        self.__cache = cache                                # ModemCache
+
+
+    def __getattr__(self, name):
+        return getattr(self.__manager, name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def modem(self):
+        return self.__cache.modem()
+
+
+    def modem_conn(self):
+        return self.__cache.modem_conn()
+
+
+    def sim(self):
+        return self.__cache.sim()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ModemCachingManager:{manager:%s, cache:%s}" % (self.__manager, self.__cache)
@@ -0,0 +1,72 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A thread-safe token bucket. Callers block in acquire() until a token is available, so that requests made by any number
+of threads do not exceed rate per second on average, or burst requests at once.
+"""
+
+import threading
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RateLimiter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rate, burst=1):
+        """
+        Constructor
+        """
+        if rate <= 0:
+            raise ValueError(rate)
+
+        self.__rate = float(rate)                           # float requests per second
+        self.__burst = int(burst)                           # int
+
+        self.__tokens = float(burst)                        # float
+        self.__updated = time.monotonic()                   # float seconds
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def acquire(self):
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+
+                self.__tokens = min(self.__tokens + (now - self.__updated) * self.__rate, self.__burst)
+                self.__updated = now
+
+                if self.__tokens >= 1.0:
+                    self.__tokens -= 1.0
+                    return
+
+                wait = (1.0 - self.__tokens) / self.__rate
+
+            time.sleep(wait)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rate(self):
+        return self.__rate
+
+
+    @property
+    def burst(self):
+        return self.__burst
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RateLimiter:{rate:%s, burst:%s}" % (self.rate, self.burst)
@@ -0,0 +1,422 @@
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Analyses the combined load of the items of a Schedule. The scheduler aligns each sampler to its own interval, so the
+samplers fire together at every common multiple of their intervals. The firing timeline is built over the
+hyperperiod - the least common multiple of the intervals, at the 0.1 second resolution of ScheduleItem - or over
+MAX_HORIZON, if the hyperperiod is longer.
+
+Firings within window seconds of one another are counted as concurrent: a sampler holds the I2C bus and the CPU for
+some time after it fires. The worst case is the greatest number of samplers concurrent at any time on the timeline.
+
+Phase offsets are suggested greedily: the items are placed in order of increasing interval, each at the whole-second
+offset within its interval that least increases the worst case, then the number of concurrent firings. Offsets are
+advisory - the scheduler does not currently apply them.
+
+Messages per hour are estimated from the interval and tally of each item. Bytes are estimated from the typical size
+of each sampler's published document, so are a guide to cellular data use rather than a measure.
+
+example JSON:
+{"hyperperiod": 60.0, "horizon": 60.0, "window": 1.0, "items": {"scs-climate": {"interval": 60.0, "tally": 1,
+"firings": 1, "messages-per-hour": 60.0, "bytes-per-hour": 18000, "offset": 1.0}, "scs-gases": {"interval": 10.0,
+"tally": 1, "firings": 6, "messages-per-hour": 360.0, "bytes-per-hour": 216000, "offset": 0.0}},
+"worst-case": {"concurrent": 2, "occurrences": 1, "at": [0.0]}, "suggested-worst-case": {"concurrent": 1,
+"occurrences": 6, "at": [0.0, 10.0, 20.0]}, "messages-per-hour": 420.0, "bytes-per-hour": 234000,
+"mbytes-per-month": 168.5}
+"""
+
+import math
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ScheduleAnalysis(object):
+    """
+    classdocs
+    """
+
+    RESOLUTION = 10                                 # ticks per second      ScheduleItem intervals are rounded to 0.1 s
+    MAX_HORIZON = 86400                             # seconds
+    DEFAULT_WINDOW = 1.0                            # seconds
+
+    OFFSET_STEP = RESOLUTION                        # ticks                 offsets are suggested in whole seconds
+    REPORTED_TIMES = 3
+
+    MESSAGE_BYTES = {                               # typical size of a published document
+        'scs-climate': 300,
+        'scs-gases': 600,
+        'scs-particulates': 900,
+        'scs-status': 1200
+    }
+
+    DEFAULT_MESSAGE_BYTES = 600
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def hyperperiod(cls, intervals):
+        ticks = 1
+
+        for interval in intervals:
+            interval_ticks = cls.ticks(interval)
+            ticks = ticks * interval_ticks // math.gcd(ticks, interval_ticks)
+
+        return ticks
+
+
+    @classmethod
+    def ticks(cls, seconds):
+        return max(1, int(round(seconds * cls.RESOLUTION)))
+
+
+    @classmethod
+    def seconds(cls, ticks):
+        return round(ticks / cls.RESOLUTION, 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, schedule, window=None):
+        """
+        Constructor
+        """
+        self.__items = sorted(schedule.items, key=lambda item: (item.interval, item.name))     # list of ScheduleItem
+        self.__window = self.ticks(self.DEFAULT_WINDOW if window is None else window)         # int ticks
+
+        self.__hyperperiod = self.hyperperiod(item.interval for item in self.__items)
+        self.__horizon = min(self.__hyperperiod, self.MAX_HORIZON * self.RESOLUTION)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def report(self):
+        aligned = OrderedDict((item.name, 0) for item in self.__items)
+        suggested = self.suggest_offsets()
+
+        items = OrderedDict()
+        messages_per_hour = 0.0
+        bytes_per_hour = 0
+
+        for item in sorted(self.__items, key=lambda item: item.name):
+            item_messages = 3600.0 / (item.interval * item.tally)
+            item_bytes = int(round(item_messages * self.MESSAGE_BYTES.get(item.name, self.DEFAULT_MESSAGE_BYTES)))
+
+            messages_per_hour += item_messages
+            bytes_per_hour += item_bytes
+
+            items[item.name] = ItemLoad(item.interval, item.tally, len(self.__firings(item, 0)),
+                                        round(item_messages, 1), item_bytes, self.seconds(suggested[item.name]))
+
+        return ScheduleLoad(self.seconds(self.__hyperperiod), self.seconds(self.__horizon), self.seconds(self.__window),
+                            items, self.worst_case(aligned), self.worst_case(suggested), round(messages_per_hour, 1),
+                            bytes_per_hour)
+
+
+    def worst_case(self, offsets):
+        occupancy = self.__occupancy(offsets)
+        concurrent = max(occupancy)
+
+        if concurrent == 0:
+            return WorstCase(0, 0, [])
+
+        at = [tick for tick, count in enumerate(occupancy) if count == concurrent and
+              (tick == 0 or occupancy[tick - 1] != concurrent)]
+
+        return WorstCase(concurrent, len(at), [self.seconds(tick) for tick in at[:self.REPORTED_TIMES]])
+
+
+    def suggest_offsets(self):
+        offsets = OrderedDict()
+        occupancy = [0] * self.__horizon
+
+        for item in self.__items:
+            best = None
+
+            for offset in range(0, self.ticks(item.interval), self.OFFSET_STEP):
+                counts = [occupancy[tick] for tick in self.__occupied(item, offset)]
+                cost = (max(counts, default=0), sum(1 for count in counts if count > 0))
+
+                if best is None or cost < best[0]:
+                    best = (cost, offset)
+
+            offsets[item.name] = 0 if best is None else best[1]
+
+            for tick in self.__occupied(item, offsets[item.name]):
+                occupancy[tick] += 1
+
+        return offsets
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __occupancy(self, offsets):
+        occupancy = [0] * self.__horizon
+
+        for item in self.__items:
+            for tick in self.__occupied(item, offsets[item.name]):
+                occupancy[tick] += 1
+
+        return occupancy
+
+
+    def __occupied(self, item, offset):
+        occupied = set()
+
+        for firing in self.__firings(item, offset):
+            occupied.update(tick % self.__horizon for tick in range(firing, firing + self.__window))
+
+        return occupied
+
+
+    def __firings(self, item, offset):
+        return range(offset, self.__horizon, self.ticks(item.interval))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def window(self):
+        return self.seconds(self.__window)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ScheduleAnalysis:{items:%s, window:%s, hyperperiod:%s, horizon:%s}" % \
+               ([item.name for item in self.__items], self.window, self.seconds(self.__hyperperiod),
+                self.seconds(self.__horizon))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ScheduleLoad(JSONable):
+    """
+    classdocs
+    """
+
+    __DAYS_PER_MONTH = 30
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, hyperperiod, horizon, window, items, worst_case, suggested_worst_case, messages_per_hour,
+                 bytes_per_hour):
+        """
+        Constructor
+        """
+        self.__hyperperiod = hyperperiod                        # float seconds
+        self.__horizon = horizon                                # float seconds
+        self.__window = window                                  # float seconds
+        self.__items = items                                    # OrderedDict of name: ItemLoad
+        self.__worst_case = worst_case                          # WorstCase     aligned, as scheduled
+        self.__suggested_worst_case = suggested_worst_case      # WorstCase     with the suggested offsets
+        self.__messages_per_hour = messages_per_hour            # float
+        self.__bytes_per_hour = bytes_per_hour                  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['hyperperiod'] = self.hyperperiod
+        jdict['horizon'] = self.horizon
+        jdict['window'] = self.window
+        jdict['items'] = self.items
+        jdict['worst-case'] = self.worst_case
+        jdict['suggested-worst-case'] = self.suggested_worst_case
+        jdict['messages-per-hour'] = self.messages_per_hour
+        jdict['bytes-per-hour'] = self.bytes_per_hour
+        jdict['mbytes-per-month'] = self.mbytes_per_month()
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def mbytes_per_month(self):
+        return round(self.bytes_per_hour * 24 * self.__DAYS_PER_MONTH / 1e6, 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def hyperperiod(self):
+        return self.__hyperperiod
+
+
+    @property
+    def horizon(self):
+        return self.__horizon
+
+
+    @property
+    def window(self):
+        return self.__window
+
+
+    @property
+    def items(self):
+        return self.__items
+
+
+    @property
+    def worst_case(self):
+        return self.__worst_case
+
+
+    @property
+    def suggested_worst_case(self):
+        return self.__suggested_worst_case
+
+
+    @property
+    def messages_per_hour(self):
+        return self.__messages_per_hour
+
+
+    @property
+    def bytes_per_hour(self):
+        return self.__bytes_per_hour
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ScheduleLoad:{hyperperiod:%s, horizon:%s, window:%s, items:%s, worst_case:%s, " \
+               "suggested_worst_case:%s, messages_per_hour:%s, bytes_per_hour:%s}" % \
+               (self.hyperperiod, self.horizon, self.window, {name: str(item) for name, item in self.items.items()},
+                self.worst_case, self.suggested_worst_case, self.messages_per_hour, self.bytes_per_hour)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ItemLoad(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, interval, tally, firings, messages_per_hour, bytes_per_hour, offset):
+        """
+        Constructor
+        """
+        self.__interval = interval                              # float seconds
+        self.__tally = tally                                    # int
+        self.__firings = firings                                # int       within the horizon
+        self.__messages_per_hour = messages_per_hour            # float
+        self.__bytes_per_hour = bytes_per_hour                  # int
+        self.__offset = offset                                  # float seconds     suggested
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['interval'] = self.interval
+        jdict['tally'] = self.tally
+        jdict['firings'] = self.firings
+        jdict['messages-per-hour'] = self.messages_per_hour
+        jdict['bytes-per-hour'] = self.bytes_per_hour
+        jdict['offset'] = self.offset
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def tally(self):
+        return self.__tally
+
+
+    @property
+    def firings(self):
+        return self.__firings
+
+
+    @property
+    def messages_per_hour(self):
+        return self.__messages_per_hour
+
+
+    @property
+    def bytes_per_hour(self):
+        return self.__bytes_per_hour
+
+
+    @property
+    def offset(self):
+        return self.__offset
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ItemLoad:{interval:%s, tally:%s, firings:%s, messages_per_hour:%s, bytes_per_hour:%s, offset:%s}" % \
+               (self.interval, self.tally, self.firings, self.messages_per_hour, self.bytes_per_hour, self.offset)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class WorstCase(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, concurrent, occurrences, at):
+        """
+        Constructor
+        """
+        self.__concurrent = concurrent                          # int       samplers
+        self.__occurrences = occurrences                        # int       within the horizon
+        self.__at = at                                          # list of float seconds     the first occurrences
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['concurrent'] = self.concurrent
+        jdict['occurrences'] = self.occurrences
+        jdict['at'] = self.at
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def concurrent(self):
+        return self.__concurrent
+
+
+    @property
+    def occurrences(self):
+        return self.__occurrences
+
+
+    @property
+    def at(self):
+        return self.__at
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "WorstCase:{concurrent:%s, occurrences:%s, at:%s}" % (self.concurrent, self.occurrences, self.at)
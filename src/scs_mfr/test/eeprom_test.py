@@ -3,7 +3,10 @@ Created on 18 May 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
-Note that this test updates the EEPROM contents.
+Note that this test updates the EEPROM contents. Only pages that differ from the image are written.
+
+If the EEPROMImageCache shows that the board with the given DFE serial number was last verified with the same image,
+the EEPROM is read back and compared by hash instead of being rewritten, unless force is set.
 """
 
 from os import path
@@ -17,6 +20,8 @@ from scs_dfe.interface.component.cat24c32 import CAT24C32
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.eeprom.eeprom_image_cache import EEPROMImageCache
+from scs_mfr.eeprom.eeprom_page_writer import EEPROMPageWriter
 from scs_mfr.test.test import Test
 
 
@@ -29,9 +34,12 @@ class EEPROMTest(Test):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, interface, verbose):
+    def __init__(self, interface, verbose, dfe_serial_number=None, force=False):
         super().__init__(interface, verbose)
 
+        self.__dfe_serial_number = dfe_serial_number
+        self.__force = force
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -50,14 +58,50 @@ class EEPROMTest(Test):
 
             I2C.EEPROM.open()
 
-            eeprom = CAT24C32()
+            cache = EEPROMImageCache.load(Host, skeleton=True)
+            file_image = EEPROMImage.construct_from_file(Host.eep_image(), CAT24C32.SIZE)
+
+            writer = EEPROMPageWriter()
+
+            # cached...
+            if self.__dfe_serial_number is not None and not self.__force and \
+                    cache.matches(self.__dfe_serial_number, file_image):
+                if self.verbose:
+                    print("cached image: %s" % cache.hash(self.__dfe_serial_number), file=sys.stderr)
+
+                if EEPROMImageCache.image_hash(writer.image) == cache.hash(self.__dfe_serial_number):
+                    return True
 
             # test...
-            file_image = EEPROMImage.construct_from_file(Host.eep_image(), CAT24C32.SIZE)
-            eeprom.write(file_image)
+            report = writer.write(file_image)
+
+            if self.verbose:
+                print(report, file=sys.stderr)
 
             # test criterion...
-            return eeprom.image == file_image
+            verified = report.verified and writer.image == file_image
+
+            if self.__dfe_serial_number is not None:
+                if verified:
+                    cache.record(self.__dfe_serial_number, file_image)
+                else:
+                    cache.discard(self.__dfe_serial_number)
+
+                cache.save(Host)
+
+            return verified
 
         finally:
             I2C.EEPROM.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def dfe_serial_number(self):
+        return self.__dfe_serial_number
+
+
+    @property
+    def force(self):
+        return self.__force
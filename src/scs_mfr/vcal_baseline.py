@@ -21,6 +21,8 @@ an ozone sensor is identified as Ox.
 
 Note that the greengrass processes must be restarted for changes to take effect.
 
+Every change of offset is also appended to the device's baseline history - see scs_mfr/baseline_history.
+
 SYNOPSIS
 vcal_baseline.py [{ -b GAS  | { { -s | -o } GAS VALUE [-r SAMPLE_REC -t SAMPLE_TEMP -m SAMPLE_HUMID] } | -d }] [-v]
 
@@ -31,10 +33,12 @@ DOCUMENT EXAMPLE
 {"NO2": {"calibrated-on": "2022-06-23T08:40:06Z", "offset": 134, "env": null}}
 
 FILES
-~/SCS/conf/baseline.json
+~/SCS/conf/vcal_baseline.json
+~/SCS/conf/baseline_history/vcal_*.bhr
 
 SEE ALSO
 scs_dev/gases_sampler
+scs_mfr/baseline_history
 scs_mfr/gas_model_conf
 """
 
@@ -51,6 +55,7 @@ from scs_core.sys.logging import Logging
 
 from scs_host.sys.host import Host
 
+from scs_mfr.baseline.baseline_history import BaselineHistory
 from scs_mfr.cmd.cmd_vcal_baseline import CmdVCalBaseline
 
 
@@ -86,6 +91,7 @@ if __name__ == '__main__':
         # resources...
 
         baseline = VCalBaseline.load(Host, skeleton=True)
+        history = BaselineHistory(Host, 'vcal')
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -107,6 +113,8 @@ if __name__ == '__main__':
             baseline.set_sensor_baseline(cmd.gas_name(), SensorBaseline(now, new_offset, sample=sample))
             baseline.save(Host)
 
+            history.append(cmd.gas_name(), old_offset, baseline.sensor_baseline(cmd.gas_name()))
+
             if cmd.verbose:
                 logger.info("%s: was: %s now: %s" % (cmd.gas_name(), old_offset, new_offset))
 
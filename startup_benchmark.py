@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Time the cold and warm start of every utility that may be included in setup.py (as listed by script_report.py), and
+report the results as a JSON document, for tracking over releases.
+
+Each utility is run with --help, which completes its imports and builds its parser, then exits. A cold start is made
+with an empty byte-code cache (PYTHONPYCACHEPREFIX), so that every module is compiled from source - the OS file cache
+is not dropped. A warm start is the fastest of REPEATS runs with the byte-code cache populated by the cold start.
+
+usage: ./startup_benchmark.py [-r REPEATS] [-t TIMEOUT] [-v] > startup_benchmark.json
+"""
+
+import optparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+from scs_core.sys.filesystem import Filesystem
+
+from scs_mfr import __version__
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def utilities(path):
+    for item in Filesystem.ls(path):
+        if not item.is_directory and item.has_suffix('py') and not item.name.startswith('__'):
+            yield item.name
+
+
+def start(script, pycache, timeout):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)                # the warm start needs the cache
+    started = time.perf_counter()
+
+    try:
+        result = subprocess.run([sys.executable, script, '--help'], env=env, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, None
+
+    return round(time.perf_counter() - started, 3), result.returncode
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+parser = optparse.OptionParser(usage="%prog [-r REPEATS] [-t TIMEOUT] [-v]")
+
+parser.add_option("--repeats", "-r", type="int", action="store", dest="repeats", default=3,
+                  help="warm starts for each utility (default 3)")
+
+parser.add_option("--timeout", "-t", type="float", action="store", dest="timeout", default=30.0,
+                  help="timeout for each start (default 30 seconds)")
+
+parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                  help="report narrative to stderr")
+
+opts, args = parser.parse_args()
+
+if args or opts.repeats < 1:
+    parser.print_help(sys.stderr)
+    exit(2)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+local_path = os.path.join('src', 'scs_mfr')
+abs_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), local_path)
+
+results = OrderedDict()
+
+for name in utilities(abs_path):
+    with tempfile.TemporaryDirectory() as cache:
+        cold, status = start(os.path.join(abs_path, name), cache, opts.timeout)
+        warm_starts = [start(os.path.join(abs_path, name), cache, opts.timeout)[0] for _ in range(opts.repeats)]
+
+    warm = None if None in warm_starts else min(warm_starts)
+    results[name] = OrderedDict((('cold', cold), ('warm', warm), ('status', status)))
+
+    if opts.verbose:
+        print("%s: cold: %s warm: %s status: %s" % (name, cold, warm, status), file=sys.stderr)
+        sys.stderr.flush()
+
+report = OrderedDict()
+
+report['rec'] = LocalizedDatetime.now().utc().as_iso8601()
+report['version'] = __version__
+report['python'] = sys.version.split()[0]
+report['repeats'] = opts.repeats
+report['utilities'] = results
+
+print(JSONify.dumps(report))
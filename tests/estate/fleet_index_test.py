@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Version filters with fewer components than the indexed versions: 2.9.0 is equal to 2.9, 2.10.0 is equal to 2.10, and
+2.10.1 is greater than 2.10.
+"""
+
+import os
+import tempfile
+
+from scs_core.sample.configuration_sample import ConfigurationSample
+
+from scs_mfr.estate.fleet_index import FleetIndex, IndexFilter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def sample(tag, psu_tag):
+    return ConfigurationSample.construct_from_jdict({"tag": tag, "rec": "2026-10-19T09:00:00Z", "ver": 1.0,
+                                                     "val": {"hostname": tag, "psu-version": {"tag": psu_tag}}})
+
+
+def query(index, expression):
+    tags = [match['tag'] for match in index.query([IndexFilter.construct_from_expression(expression)])]
+    print("%s: %s" % (expression, tags))
+
+    return tags
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+filename = os.path.join(tempfile.mkdtemp(), 'fleet_index.db')
+
+with FleetIndex(filename) as fleet_index:
+    print(fleet_index.ingest(sample(tag, psu_tag) for tag, psu_tag in (('scs-001', '2.9.0'), ('scs-002', '2.10.1'),
+                                                                         ('scs-003', '2.2.5'), ('scs-004', '2.3.0'),
+                                                                         ('scs-005', '2.10.0'))))
+
+    ok = query(fleet_index, 'psu-version.tag=2.9') == ['scs-001']
+    ok &= query(fleet_index, 'psu-version.tag>2.9') == ['scs-002', 'scs-005']
+    ok &= query(fleet_index, 'psu-version.tag=2.10') == ['scs-005']
+    ok &= query(fleet_index, 'psu-version.tag>2.10') == ['scs-002']
+    ok &= query(fleet_index, 'psu-version.tag=2.10.1') == ['scs-002']
+    ok &= query(fleet_index, 'psu-version.tag<2.3') == ['scs-003']
+    ok &= query(fleet_index, 'psu-version.tag<=2.3') == ['scs-003', 'scs-004']
+
+print("ok: %s" % ok)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Rows are numbered by their line in the input. An empty JSON object, or a JSON line that is not an object, is read as an
+invalid row, not as an exception.
+"""
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.provision.batch_manifest import BatchManifest
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+lines = [
+    '{"serial": "scs-bbe-401", "invoice": "INV-0000"}\n',
+    '\n',
+    '{}\n',
+    '[1]\n',
+    '{"serial": "scs-bbe-402", "invoice": "INV-0000"}\n'
+]
+
+manifest = BatchManifest.construct_from_lines(lines)
+print(manifest)
+
+for row in manifest.rows:
+    print(JSONify.dumps(row))
+
+print("duplicates: %s" % manifest.duplicates('serial'))
+print("-")
+
+numbers = [row.line for row in manifest.rows]
+errors = [row.error for row in manifest.rows]
+
+print("ok: %s" % (numbers == [1, 3, 4, 5] and errors[0] is None and errors[3] is None and
+                  errors[1] is not None and errors[2] is not None))
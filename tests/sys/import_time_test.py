@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Measures the module-level import time of each utility, using python -X importtime, and fails if any utility exceeds
+its budget. The utility's __main__ block is not run.
+
+usage: ./import_time_test.py [SCRIPT_NAME_1 .. N]
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+DEFAULT_BUDGET = 400                                # milliseconds
+
+BUDGETS = {}                                        # script name: milliseconds, where the default does not apply
+
+LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\| ( *)(\S+)')
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src', 'scs_mfr')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def import_times(statement):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True)
+
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    times = {}
+
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+
+        if match and not match.group(3):            # top-level imports only
+            times[match.group(4)] = int(match.group(2))
+
+    return times
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+baseline = import_times('import runpy')
+
+names = sys.argv[1:] if len(sys.argv) > 1 else \
+    sorted(name for name in os.listdir(SCRIPTS) if name.endswith('.py') and not name.startswith('__'))
+
+failures = 0
+
+for name in names:
+    budget = BUDGETS.get(name, DEFAULT_BUDGET)
+
+    try:
+        times = import_times('import runpy; runpy.run_path(%s)' % repr(os.path.join(SCRIPTS, name)))
+
+    except RuntimeError as ex:
+        print("%s: error: %s" % (name, ex))
+        failures += 1
+        continue
+
+    elapsed = sum(time for module, time in times.items() if module not in baseline) / 1000
+
+    print("%s: %0.1f ms (budget %d ms)%s" % (name, elapsed, budget, " FAILED" if elapsed > budget else ""))
+    sys.stdout.flush()
+
+    if elapsed > budget:
+        failures += 1
+
+print("failures: %d of %d" % (failures, len(names)))
+
+exit(1 if failures else 0)
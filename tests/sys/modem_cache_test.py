@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+"""
+Created on 19 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A section requested while a refresh of another section is running must be queried, not served from the old snapshot.
+A query that raises an unexpected exception must not stop the cache, or leave its caller waiting.
+"""
+
+import tempfile
+import time
+
+from scs_core.sys.modem import ModemConnection
+from scs_core.sys.persistence_manager import FilesystemPersistenceManager
+
+from scs_mfr.sys.modem_cache import ModemCache, ModemSnapshot
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SlowModemHost(FilesystemPersistenceManager):
+    """
+    a Host whose modem takes a second to report its model
+    """
+
+    __SCS_PATH = tempfile.mkdtemp()
+
+    @classmethod
+    def scs_path(cls):
+        return cls.__SCS_PATH
+
+
+    @classmethod
+    def modem(cls):
+        time.sleep(1.0)
+        return None
+
+
+    @classmethod
+    def modem_conn(cls):
+        return ModemConnection.construct_from_jdict({"state": "connected", "signal": {"quality": 34, "recent": True}})
+
+
+    @classmethod
+    def sim(cls):
+        return None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FaultyModemHost(SlowModemHost):
+    """
+    a Host whose SIM query fails unexpectedly
+    """
+
+    @classmethod
+    def sim(cls):
+        raise RuntimeError("SIM query failed")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+cache = ModemCache(SlowModemHost, live=True)
+print(cache)
+
+cache.refresh(ModemSnapshot.MODEM)
+connection = cache.modem_conn()
+
+print("modem_conn: %s" % connection)
+print("ok: %s" % (connection is not None and connection.state == 'connected'))
+print("-")
+
+cache = ModemCache(FaultyModemHost, live=True)
+print(cache)
+
+sim = cache.sim()                                   # must return, not hang
+connection = cache.modem_conn()                     # the cache must still refresh
+
+print("sim: %s" % sim)
+print("modem_conn: %s" % connection)
+print("ok: %s" % (sim is None and connection is not None and connection.state == 'connected'))